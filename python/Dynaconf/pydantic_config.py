@@ -53,6 +53,44 @@ class AppSettings(BaseSettings):
 #     )
 #     database: str = Field(default=DYNACONF_DB_SETTINGS.DB_DATABASE, env="DB_DATABASE")
 #     echo: bool = Field(default=DYNACONF_DB_SETTINGS.DB_ECHO, env="DB_ECHO")
+#     ## Connection pool options. None uses SQLAlchemy's defaults
+#     pool_size: int | None = Field(
+#         default=DYNACONF_DB_SETTINGS.get("DB_POOL_SIZE", None), env="DB_POOL_SIZE"
+#     )
+#     max_overflow: int | None = Field(
+#         default=DYNACONF_DB_SETTINGS.get("DB_MAX_OVERFLOW", None), env="DB_MAX_OVERFLOW"
+#     )
+#     pool_timeout: float | None = Field(
+#         default=DYNACONF_DB_SETTINGS.get("DB_POOL_TIMEOUT", None), env="DB_POOL_TIMEOUT"
+#     )
+#     pool_recycle: int | None = Field(
+#         default=DYNACONF_DB_SETTINGS.get("DB_POOL_RECYCLE", None), env="DB_POOL_RECYCLE"
+#     )
+#     pool_pre_ping: bool = Field(
+#         default=DYNACONF_DB_SETTINGS.get("DB_POOL_PRE_PING", False),
+#         env="DB_POOL_PRE_PING",
+#     )
+
+#     @field_validator(
+#         "pool_size", "max_overflow", "pool_timeout", "pool_recycle", mode="before"
+#     )
+#     def validate_pool_option(cls, v) -> int | float | None:
+#         ## Empty values in settings.toml/the environment use SQLAlchemy's defaults
+#         if v is None or v == "":
+#             return None
+
+#         return v
+
+#     def get_pool_options(self) -> dict:
+#         _options: dict = {
+#             "pool_size": self.pool_size,
+#             "max_overflow": self.max_overflow,
+#             "pool_timeout": self.pool_timeout,
+#             "pool_recycle": self.pool_recycle,
+#             "pool_pre_ping": self.pool_pre_ping or None,
+#         }
+
+#         return {k: v for k, v in _options.items() if v is not None}
 
 #     @field_validator("port")
 #     def validate_db_port(cls, v) -> int:
@@ -94,6 +132,7 @@ class AppSettings(BaseSettings):
 #             engine: sa.Engine = sa.create_engine(
 #                 url=self.get_db_uri().render_as_string(hide_password=False),
 #                 echo=self.echo,
+#                 **self.get_pool_options(),
 #             )
 
 #             return engine
@@ -3,6 +3,25 @@
 from __future__ import annotations
 
 from . import encoders
-from .context_managers import HTTPXController
-from .methods import build_request, save_bytes
-from .transports import get_cache_transport
+from .context_managers import (
+    RATE_LIMITER,
+    REQUEST_METRICS,
+    AsyncHTTPXController,
+    HTTPXController,
+    RateLimiter,
+    RequestMetrics,
+    RequestResult,
+)
+from .methods import (
+    DownloadResult,
+    SpooledBody,
+    aiter_json_body,
+    aspool_response,
+    build_request,
+    iter_json_body,
+    save_bytes,
+    save_stream,
+    spool_response,
+    spooled_body,
+)
+from .transports import get_cache_storage, get_cache_transport
@@ -2,4 +2,17 @@
 
 from __future__ import annotations
 
-from ._client import HTTPXController
+from ._async_client import AsyncHTTPXController
+from ._client import HTTPXController, RequestResult
+from ._metrics import REQUEST_METRICS, RequestMetrics, route_template
+from ._pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    Page,
+    PaginationStrategy,
+    PredictablePagination,
+)
+from ._rate_limit import RATE_LIMITER, RateLimiter, TokenBucket
+from ._registry import CLIENT_REGISTRY, ClientRegistry
+from ._singleflight import SINGLE_FLIGHT, SingleFlight, request_key
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import AbstractAsyncContextManager
+import time
+import typing as t
+
+import httpx
+from loguru import logger as log
+
+from ..encoders.json_encoders import JSONRecordDecoder
+from ..methods import SpooledBody, aspool_response, spooled_body
+from ._client import T, BaseHTTPXController, spooled_chunks
+
+
+class AsyncHTTPXController(BaseHTTPXController, AbstractAsyncContextManager):
+    """Handler for an async HTTPX client.
+
+    Description:
+        Async counterpart to `HTTPXController`. Initializes an `httpx.AsyncClient` when entered in an
+        `async with` statement. Accepts the same params as `BaseHTTPXController`.
+
+        Use `gather()` to send many requests concurrently on a single event loop. The number of requests
+        in flight at once is bounded by a semaphore (`max_concurrency`), and by the client's connection pool
+        (`limits`).
+
+    Usage:
+
+    ``` py linenums=1
+    async with AsyncHTTPXController(base_url="https://example.com") as ctl:
+        reqs = [ctl.new_request(method="GET", url=f"/items/{i}") for i in range(1000)]
+        responses = await ctl.gather(requests=reqs, max_concurrency=200)
+    ```
+    """
+
+    _is_async: bool = True
+
+    async def __aenter__(self) -> t.Self:
+        """Execute when handler is called in an `async with` statement.
+
+        Description:
+            Creates an `httpx.AsyncClient` object, using class parameters as options.
+        """
+        try:
+            _client: httpx.AsyncClient = httpx.AsyncClient(**self._client_kwargs())
+
+            ## If base_url is None, an exception occurs. Set self.base_url
+            #  only if base_url is not None.
+            if self.base_url:
+                _client.base_url = self.base_url
+
+            self.client = _client
+
+            return self
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception initializing httpx AsyncClient. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise exc
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Execute when `async with` statement ends.
+
+        Description:
+            Show any exceptions/tracebacks. Close `self.client` on exit.
+
+        """
+        if exc_type:
+            log.error(f"({exc_type}): {exc_value}")
+
+        if traceback:
+            log.trace(traceback)
+
+        ## Close httpx client
+        if self.client:
+            await self.client.aclose()
+
+    async def _send(
+        self,
+        request: httpx.Request = None,
+        stream: bool = False,
+        auth: httpx.Auth = None,
+    ) -> httpx.Response:
+        """Send a request with self.client, waiting for `self.rate_limiter` & retrying up to `self.retries` times."""
+        ## Read the body in chunks, spilling it to disk if it is larger than self.spool_threshold
+        spool: bool = self.spool_threshold is not None and not stream
+        attempt: int = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                wait: float = self.rate_limiter.reserve(host=request.url.host)
+                if wait:
+                    await asyncio.sleep(wait)
+
+            self._trace_request(request=request)
+
+            try:
+                res: httpx.Response = await self.client.send(
+                    request=request,
+                    stream=stream or spool,
+                    auth=auth,
+                    follow_redirects=self.follow_redirects,
+                )
+            except Exception as exc:
+                delay: float | None = self._retry_delay(
+                    request=request, attempt=attempt, exc=exc
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(request=request, attempt=attempt, res=res)
+                if delay is None:
+                    if spool:
+                        await aspool_response(
+                            res=res,
+                            threshold=self.spool_threshold,
+                            spool_dir=self.spool_dir,
+                        )
+
+                    return res
+
+                await res.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def send_request(
+        self,
+        request: httpx.Request = None,
+        stream: bool = False,
+        auth: httpx.Auth = None,
+    ) -> httpx.Response:
+        """Send httpx.Request using self.client (and optional cache transport).
+
+        Params:
+            request (httpx.Request): An initialized `httpx.Request` object.
+            stream (bool): When `True`, response bytes will be streamed. This can be useful for large file downloads.
+            auth (httpx.Auth): <Not yet documented>
+
+        Returns:
+            (httpx.Response): An `httpx.Response` from the request.
+
+        """
+        assert request, ValueError("Missing an httpx.Request object")
+        assert isinstance(request, httpx.Request), TypeError(
+            f"Expected request to be an httpx.Request object. Got type: ({type(request)})"
+        )
+
+        ## Send request using class's httpx.AsyncClient
+        try:
+            res: httpx.Response = await self._send(
+                request=request, stream=stream, auth=auth
+            )
+            log.debug(
+                f"URL: {request.url}, Response: [{res.status_code}: {res.reason_phrase}]"
+            )
+
+            return res
+
+        except httpx.ConnectError as conn_err:
+            ## Error connecting to remote
+            msg = Exception(
+                f"ConnectError while requesting URL {request.url}. Details: {conn_err}"
+            )
+            log.error(msg)
+
+            return
+        except Exception as exc:
+            msg = Exception(f"Unhandled exception sending request. Details: {exc}")
+            log.error(msg)
+
+            raise msg
+
+    async def gather(
+        self,
+        requests: list[httpx.Request] = None,
+        max_concurrency: int = 100,
+        return_exceptions: bool = True,
+    ) -> list[t.Union[httpx.Response, Exception]]:
+        """Send many httpx.Request objects concurrently, bounded by a semaphore.
+
+        Description:
+            Responses are returned in the same order as the input `requests`. When `return_exceptions=True`,
+            a request that fails is returned as the exception it raised (including `httpx.ConnectError`),
+            instead of cancelling the rest of the batch.
+
+        Params:
+            requests (list[httpx.Request]): A list of initialized `httpx.Request` objects.
+            max_concurrency (int): [Default: 100] Maximum number of requests in flight at once.
+            return_exceptions (bool): [Default: True] Return exceptions in place of responses instead of raising
+                the first exception encountered.
+
+        Returns:
+            (list[httpx.Response|BaseException]): A list of responses (or exceptions, including cancellations), in
+                the same order as `requests`.
+
+        """
+        assert requests is not None, ValueError("Missing list of httpx.Request objects")
+        assert isinstance(max_concurrency, int) and max_concurrency > 0, ValueError(
+            f"max_concurrency must be a positive integer. Got: ({max_concurrency})"
+        )
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _send(request: httpx.Request) -> httpx.Response:
+            async with semaphore:
+                res: httpx.Response = await self._send(request=request)
+                log.debug(
+                    f"URL: {request.url}, Response: [{res.status_code}: {res.reason_phrase}]"
+                )
+
+                return res
+
+        results: list[t.Union[httpx.Response, BaseException]] = await asyncio.gather(
+            *(_send(request=req) for req in requests),
+            return_exceptions=return_exceptions,
+        )
+
+        if return_exceptions:
+            for req, result in zip(requests, results):
+                ## Includes cancellations (asyncio.CancelledError is a BaseException)
+                if isinstance(result, BaseException):
+                    log.error(
+                        f"{type(result).__name__} while requesting URL {req.url}. Details: {result}"
+                    )
+
+        return results
+
+    async def aiter_records(
+        self, res: httpx.Response = None, chunk_size: int | None = None
+    ) -> t.AsyncIterator[t.Any]:
+        """Incrementally decode records from a (streamed) `httpx.Response`.
+
+        Description:
+            Async counterpart to `iter_records()`. Yields each element of a top-level JSON array, or each value
+            of an NDJSON/JSON lines body, as soon as it has been received. Bodies already read by
+            `aspool_response()` are decoded from their `SpooledBody`. The response is closed when iteration
+            finishes or is abandoned.
+
+        Params:
+            res (httpx.Response): An `httpx.Response` object, i.e. from `await send_request(stream=True)`.
+            chunk_size (int|None): Size (in bytes) of chunks read from the response stream.
+
+        Returns:
+            (AsyncIterator[Any]): An async iterator of decoded records.
+
+        """
+        decoder: JSONRecordDecoder = self._record_decoder(res=res)
+        body: SpooledBody | None = spooled_body(res)
+
+        try:
+            if body is not None:
+                ## Already read by aspool_response()
+                for chunk in spooled_chunks(body=body, chunk_size=chunk_size):
+                    for record in decoder.feed(chunk):
+                        yield record
+            else:
+                async for chunk in res.aiter_bytes(chunk_size=chunk_size):
+                    for record in decoder.feed(chunk):
+                        yield record
+
+            for record in decoder.close():
+                yield record
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception decoding records from response content. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise msg
+
+        finally:
+            await res.aclose()
+
+    async def adecode_res_content(self, res: httpx.Response = None) -> t.Any:
+        """Decode an `httpx.Response`'s JSON body, without blocking the event loop on large bodies.
+
+        Description:
+            Async counterpart to `decode_res_content()`. When the controller has a `decode_pool` and the body is
+            at least `decode_pool.threshold` bytes, the body is parsed in a worker process & awaited. Smaller
+            bodies are parsed in place.
+
+        Params:
+            res (httpx.Response): An `httpx.Response` object, with `.content` to be decoded.
+
+        Returns:
+            (Any): The decoded JSON body.
+
+        """
+        started_at: float = time.perf_counter()
+
+        offload: dict[str, t.Any] | None = self._offload_args(res=res)
+        if offload is None:
+            return self.decode_res_content(res=res)
+
+        return self._observe_decode(
+            res=res, started_at=started_at, decoded=await self.decode_pool.adecode(**offload)
+        )
+
+    async def adecode_as(self, res: httpx.Response = None, model: type[T] = None) -> T:
+        """Decode an `httpx.Response`'s JSON body directly into a typed object, without blocking the event loop.
+
+        Description:
+            Async counterpart to `decode_as()`. Large bodies are parsed in `decode_pool`'s workers, like
+            `adecode_res_content()`. `model` must be importable by the workers, i.e. defined at module level.
+
+        Params:
+            res (httpx.Response): An `httpx.Response` object, with `.content` to be decoded.
+            model (type): The type to decode into.
+
+        Returns:
+            (T): An instance of `model`.
+
+        """
+        assert model is not None, ValueError("Missing a model to decode into")
+        started_at: float = time.perf_counter()
+
+        offload: dict[str, t.Any] | None = self._offload_args(res=res)
+        if offload is None:
+            return self.decode_as(res=res, model=model)
+
+        return self._observe_decode(
+            res=res,
+            started_at=started_at,
+            decoded=await self.decode_pool.adecode(**offload, type_=model),
+        )
@@ -1,27 +1,81 @@
 from __future__ import annotations
 
+import codecs
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import AbstractContextManager, contextmanager
-import json
+from dataclasses import dataclass, field
 from pathlib import Path
+import queue
+import threading
+import time
 import typing as t
 
-## For auto detecting response character set
-import chardet
 import hishel
 import httpx
 from loguru import logger as log
 
-def autodetect_charset(content: bytes = None):
-    """Attempt to automatically detect encoding from input bytestring."""
-    try:
-        ## Detect encoding from bytes
-        _encoding: str | None = chardet.detect(byte_str=content).get("encoding")
+from ..encoders.charsets import CHARSET_DETECTOR
+from ..encoders.json_encoders import (
+    JSON_SERIALIZER,
+    JSONRecordDecoder,
+    ProcessPoolDecoder,
+    decode_json_as,
+)
+from ..methods import SpooledBody, spool_response, spooled_body
+from ._metrics import RequestMetrics
+from ._pagination import Page, PaginationStrategy
+from ._rate_limit import (
+    RateLimiter,
+    backoff_delay,
+    retry_after_seconds,
+    should_retry,
+)
+from ._registry import CLIENT_REGISTRY, client_config_key
+from ._singleflight import (
+    DEFAULT_KEY_HEADERS,
+    IDEMPOTENT_METHODS,
+    SINGLE_FLIGHT,
+    SingleFlight,
+    request_key,
+)
+from ._tracing import PoolMonitor, pool_connections, reset_trace, trace_phases
+
+T = t.TypeVar("T")
+
 
-        if not _encoding:
-            ## Default to utf-8
-            _encoding = "utf-8"
+@dataclass
+class RequestResult:
+    """The outcome of a single request sent in a batch, i.e. with `HTTPXController.send_many()`.
 
-        return _encoding
+    Params:
+        index (int): Position of the request in the input list.
+        request (httpx.Request): The request that was sent.
+        response (httpx.Response|None): The response, if the request completed.
+        error (Exception|None): The exception raised while sending the request, if any.
+
+    """
+
+    index: int
+    request: httpx.Request
+    response: httpx.Response | None = field(default=None)
+    error: Exception | None = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        """`True` when the request completed without raising an exception."""
+        return self.error is None and self.response is not None
+
+
+def autodetect_charset(content: bytes = None):
+    """Attempt to automatically detect encoding from input bytestring.
+
+    Description:
+        Uses the shared `CHARSET_DETECTOR`, which checks for a BOM, then attempts a strict UTF-8 decode,
+        and only runs `chardet` on a bounded sample of `content` if both fail.
+    """
+    try:
+        return CHARSET_DETECTOR.detect(content=content)
 
     except Exception as exc:
         msg = Exception(
@@ -33,8 +87,35 @@ def autodetect_charset(content: bytes = None):
         return "utf-8"
 
 
-class HTTPXController(AbstractContextManager):
-    """Handler for HTTPX client.
+def response_body(res: httpx.Response = None) -> t.Union[bytes, memoryview]:
+    """Return a response's body: a zero-copy view of its `SpooledBody` if it was spooled, otherwise `.content`."""
+    body: SpooledBody | None = spooled_body(res)
+
+    return body.buffer if body is not None else res.content
+
+
+## Size of the slices `iter_records()` reads from a spooled body, when no chunk size is given
+SPOOLED_CHUNK_SIZE: int = 1024 * 1024
+
+
+def spooled_chunks(
+    body: SpooledBody = None, chunk_size: int | None = None
+) -> t.Iterator[memoryview]:
+    """Yield zero-copy slices of a `SpooledBody`'s buffer, of at most `chunk_size` bytes."""
+    chunk_size = chunk_size or SPOOLED_CHUNK_SIZE
+    buffer: memoryview = body.buffer
+
+    for start in range(0, len(buffer), chunk_size):
+        yield buffer[start : start + chunk_size]
+
+
+class BaseHTTPXController:
+    """Shared options & helpers for the sync & async HTTPX controllers.
+
+    Description:
+        Stores client options, and implements the request building & response decoding methods that
+        do not depend on the type of client. Use `HTTPXController` or `AsyncHTTPXController` instead
+        of initializing this class directly.
 
     Params:
         url (str|None): Scope the httpx client to a URL.
@@ -49,14 +130,39 @@ class HTTPXController(AbstractContextManager):
         params (dict[str, Any]|None): Optional request params to apply to all requests handled by controller instance.
         follow_redirects (bool): [Default: False] Follow HTTP 302 redirects.
         max_redirects (int|None): [Default: 20] Maximum number of HTTP 302 redirects to follow.
-        retries (int|None): Number of times to retry on request failure.
+        retries (int|None): Number of times to retry on request failure. Requests are retried on a
+            `429`/`503` response, or a connection error, with exponential backoff (plus jitter) that honors
+            the response's `Retry-After` header.
         timeout (int|float|None): Timeout (in seconds) until client gives up on request.
-        limits (httpx.Limits | None): <Not yet documented>
+        limits (httpx.Limits | None): Connection pool limits (`max_connections`, `max_keepalive_connections`,
+            `keepalive_expiry`). When `None`, httpx's defaults are used. Like `http2`, only applied to the client's
+            default transport; when passing a `transport`, configure its limits instead
+            (i.e. `get_cache_transport(limits=...)`).
         transport (httpx.HTTPTransport|hishel.CacheTransport|None): A transport to pass to class's `httpx.Client` object.
         default_encoding (str): [Default: utf-8] Set default encoding for all requests.
+        http2 (bool): [Default: False] Enable HTTP/2 on the client's default transport. Requires the `h2` package
+            (`pip install httpx[http2]`).
+        monitor_pool (bool): [Default: False] Collect connection pool statistics, returned by `pool_stats()`.
+        metrics (RequestMetrics|None): Record per-phase request durations (pool wait, connect, TLS, TTFB, download,
+            decode) in these histograms. Pass the process-wide `REQUEST_METRICS` to aggregate all controllers.
+        rate_limiter (RateLimiter|None): A per-host token bucket rate limiter that paces requests. Pass the
+            process-wide `RATE_LIMITER` to share buckets (and `Retry-After` pauses) between all controllers.
+        spool_threshold (int|None): [Default: None] When set, non-streaming responses are read with
+            `spool_response()`: bodies larger than this many bytes are spilled to a temporary file & memory-mapped
+            instead of being held in memory. `decode_res_content()`, `decode_as()`, `save_bytes()` &
+            `save_stream()` read spilled bodies from the mapping; `res.content` is not set for them. Bodies from a
+            caching transport are buffered by the transport before they are spooled.
+        spool_dir (str|Path|None): [Default: None] Directory for spilled bodies. Defaults to the system's temp
+            directory.
+        decode_pool (ProcessPoolDecoder|None): [Default: None] Parse bodies of at least `decode_pool.threshold`
+            bytes in worker processes, so a large body does not hold the GIL (and stall other requests) while it is
+            parsed. Smaller bodies are parsed in place.
 
     """
 
+    ## Set by subclasses that initialize an httpx.AsyncClient
+    _is_async: bool = False
+
     def __init__(
         self,
         url: str | None = None,
@@ -75,6 +181,13 @@ class HTTPXController(AbstractContextManager):
         limits: httpx.Limits | None = None,
         transport: t.Union[httpx.HTTPTransport, hishel.CacheTransport] | None = None,
         default_encoding: str = autodetect_charset,
+        rate_limiter: RateLimiter | None = None,
+        http2: bool = False,
+        monitor_pool: bool = False,
+        metrics: RequestMetrics | None = None,
+        spool_threshold: int | None = None,
+        spool_dir: t.Union[str, Path] | None = None,
+        decode_pool: ProcessPoolDecoder | None = None,
     ) -> None:
         self.url: httpx.URL | None = httpx.URL(url) if url else None
         self.base_url: httpx.URL | None = httpx.URL(base_url) if base_url else None
@@ -94,66 +207,109 @@ class HTTPXController(AbstractContextManager):
             transport
         )
         self.default_encoding: str = default_encoding
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.http2: bool = http2
+        self.pool_monitor: PoolMonitor | None = PoolMonitor() if monitor_pool else None
+        self.metrics: RequestMetrics | None = metrics
+        self.spool_threshold: int | None = spool_threshold
+        self.spool_dir: t.Union[str, Path] | None = spool_dir
+        self.decode_pool: ProcessPoolDecoder | None = decode_pool
 
-        ## Placeholder for initialized httpx.Client
-        self.client: httpx.Client | None = None
+        ## Placeholder for initialized httpx.Client/httpx.AsyncClient
+        self.client: t.Union[httpx.Client, httpx.AsyncClient] | None = None
 
-    def __enter__(self) -> t.Self:
-        """Execute when handler is called in a `with` statement.
+    def _retry_delay(
+        self,
+        request: httpx.Request = None,
+        attempt: int = 0,
+        res: httpx.Response | None = None,
+        exc: Exception | None = None,
+    ) -> float | None:
+        """Return seconds to wait before retrying a request, or `None` if it should not be retried.
 
         Description:
-            Creates an `httpx.Client` object, using class parameters as options.
+            A `Retry-After` header pauses the request's host in `self.rate_limiter` (if set), even when the
+            request itself will not be retried.
         """
-        try:
-            _client: httpx.Client = httpx.Client(
-                auth=self.auth,
-                params=self.params,
-                headers=self.headers,
-                cookies=self.cookies,
-                proxy=self.proxy,
-                proxies=self.proxies,
-                mounts=self.mounts,
-                timeout=self.timeout,
-                follow_redirects=self.follow_redirects,
-                max_redirects=self.max_redirects,
-                # base_url=self.base_url,
-                transport=self.transport,
-                default_encoding=self.default_encoding,
-            )
+        retry_after: float | None = retry_after_seconds(res=res) if res is not None else None
 
-            ## If base_url is None, an exception occurs. Set self.base_url
-            #  only if base_url is not None.
-            if self.base_url:
-                _client.base_url = self.base_url
+        if retry_after is not None and self.rate_limiter is not None:
+            self.rate_limiter.penalize(host=request.url.host, seconds=retry_after)
 
-            self.client = _client
+        if attempt >= (self.retries or 0) or not should_retry(
+            request=request, res=res, exc=exc
+        ):
+            return None
 
-            return self
+        delay: float = backoff_delay(attempt=attempt, retry_after=retry_after)
+        log.warning(
+            f"[Retry {attempt + 1}/{self.retries}] Retrying {request.method} {request.url} in {delay:.2f}s. "
+            f"Reason: {f'[{res.status_code}: {res.reason_phrase}]' if res is not None else exc}"
+        )
 
-        except Exception as exc:
-            msg = Exception(
-                f"Unhandled exception initializing httpx Client. Details: {exc}"
+        return delay
+
+    def _trace_request(self, request: httpx.Request = None) -> None:
+        """Install per-request traces (pool monitoring & phase timing) before a request is sent.
+
+        Description:
+            Called before every attempt. Traces installed for an earlier attempt (or an earlier send of the same
+            request) are removed first, so each attempt is recorded once.
+        """
+        if self.pool_monitor is None and self.metrics is None:
+            return
+
+        reset_trace(request=request)
+
+        if self.pool_monitor is not None:
+            self.pool_monitor.trace_request(request=request, is_async=self._is_async)
+
+        if self.metrics is not None:
+            trace_phases(request=request, metrics=self.metrics, is_async=self._is_async)
+
+    def _client_kwargs(self) -> dict[str, t.Any]:
+        """Return the keyword arguments used to initialize a controller's `httpx.Client`/`httpx.AsyncClient`."""
+        if self.transport is not None and (self.limits is not None or self.http2):
+            log.warning(
+                "limits & http2 only apply to the client's default transport, and are ignored when a transport is "
+                "passed. Configure them on the transport instead."
             )
-            log.error(msg)
 
-            raise exc
+        _kwargs: dict[str, t.Any] = dict(
+            auth=self.auth,
+            params=self.params,
+            headers=self.headers,
+            cookies=self.cookies,
+            proxy=self.proxy,
+            proxies=self.proxies,
+            mounts=self.mounts,
+            timeout=self.timeout,
+            follow_redirects=self.follow_redirects,
+            max_redirects=self.max_redirects,
+            # base_url=self.base_url,
+            transport=self.transport,
+            default_encoding=self.default_encoding,
+            http2=self.http2,
+        )
+        if self.limits is not None:
+            _kwargs["limits"] = self.limits
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        """Execute  when `with` statement ends.
+        return _kwargs
 
-        Description:
-            Show any exceptions/tracebacks. Close `self.client` on exit.
+    def pool_stats(self) -> dict[str, t.Union[int, float]]:
+        """Return connection pool statistics.
 
+        Description:
+            Returns the number of active & idle connections currently in the client's pool. When the controller
+            was created with `monitor_pool=True`, also returns the number of requests that opened a new connection
+            vs. reused an idle one, the reuse ratio, and average/max pool wait time (in seconds).
         """
-        if exc_type:
-            log.error(f"({exc_type}): {exc_value}")
+        _stats: dict[str, t.Union[int, float]] = pool_connections(client=self.client)
 
-        if traceback:
-            log.trace(traceback)
+        if self.pool_monitor is not None:
+            _stats.update(self.pool_monitor.stats())
 
-        ## Close httpx client
-        if self.client:
-            self.client.close()
+        return _stats
 
     def new_request(
         self,
@@ -226,56 +382,6 @@ class HTTPXController(AbstractContextManager):
 
             raise msg
 
-    def send_request(
-        self,
-        request: httpx.Request = None,
-        stream: bool = False,
-        auth: httpx.Auth = None,
-    ) -> httpx.Response:
-        """Send httpx.Request using self.Client (and optional cache transport).
-
-        Params:
-            request (httpx.Request): An initialized `httpx.Request` object.
-            stream (bool): When `True`, response bytes will be streamed. This can be useful for large file downloads.
-            auth (httpx.Auth): <Not yet documented>
-
-        Returns:
-            (httpx.Response): An `httpx.Response` from the request.
-
-        """
-        assert request, ValueError("Missing an httpx.Request object")
-        assert isinstance(request, httpx.Request), TypeError(
-            f"Expected request to be an httpx.Request object. Got type: ({type(request)})"
-        )
-
-        ## Send request using class's httpx.Client
-        try:
-            res: httpx.Response = self.client.send(
-                request=request,
-                stream=stream,
-                auth=auth,
-                follow_redirects=self.follow_redirects,
-            )
-            log.debug(
-                f"URL: {request.url}, Response: [{res.status_code}: {res.reason_phrase}]"
-            )
-
-            return res
-
-        except httpx.ConnectError as conn_err:
-            ## Error connecting to remote
-            msg = Exception(
-                f"ConnectError while requesting URL {request.url}. Details: {conn_err}"
-            )
-            log.error(msg)
-
-            return
-        except Exception as exc:
-            msg = Exception(f"Unhandled exception sending request. Details: {exc}")
-            log.error(msg)
-
-            raise msg
-
     def decode_res_content(self, res: httpx.Response = None) -> dict:
         """Use multiple methods to attempt to decode an `httpx.Response.content` bytestring.
 
@@ -291,15 +397,24 @@ class HTTPXController(AbstractContextManager):
             f"res must be of type httpx.Response. Got type: ({type(res)})"
         )
 
-        _content: bytes = res.content
+        started_at: float = time.perf_counter()
+
+        offload: dict[str, t.Any] | None = self._offload_args(res=res)
+        if offload is not None:
+            return self._observe_decode(
+                res=res, started_at=started_at, decoded=self.decode_pool.decode(**offload)
+            )
+
+        _content: t.Union[bytes, memoryview] = response_body(res=res)
         assert _content, ValueError("Response content is empty")
-        assert isinstance(_content, bytes), TypeError(
+        assert isinstance(_content, (bytes, memoryview)), TypeError(
             f"Expected response.content to be a bytestring. Got type: ({type(_content)})"
         )
 
         ## Get content's encoding, or default to 'utf-8'
         try:
-            decode_charset: str = autodetect_charset(content=_content)
+            ## Content-Type charset -> BOM -> UTF-8 -> memoized/sampled chardet
+            decode_charset: str = CHARSET_DETECTOR.detect_response(res=res)
         except Exception as exc:
             msg = Exception(
                 f"Unhandled exception detecting response content's encoding. Details: {exc}"
@@ -310,9 +425,21 @@ class HTTPXController(AbstractContextManager):
 
             decode_charset: str = "utf-8"
 
+        if codecs.lookup(decode_charset).name in ("utf-8", "ascii"):
+            ## Parse a UTF-8 body (bytes, or a spooled body's buffer) directly, without a decoded str copy.
+            #  Only bodies in other charsets are transcoded below
+            try:
+                return self._observe_decode(
+                    res=res, started_at=started_at, decoded=JSON_SERIALIZER.loads(_content)
+                )
+            except Exception as exc:
+                log.warning(
+                    f"Parsing response content as UTF-8 JSON failed, decoding it first. Details: {exc}"
+                )
+
         ## Decode content
         try:
-            _decode: str = res.content.decode(decode_charset)
+            _decode: str = str(_content, decode_charset)
 
         except Exception as exc:
             ## Decoding failed, retry with different encodings
@@ -327,7 +454,7 @@ class HTTPXController(AbstractContextManager):
                     f"Retrying response content decode with encoding '{res.encoding}'"
                 )
                 try:
-                    _decode = res.content.decode(res.encoding)
+                    _decode = str(_content, res.encoding)
                 except Exception as exc:
                     inner_msg = Exception(
                         f"[Attempt 2/2] Unhandled exception decoding response content. Details: {exc}"
@@ -343,7 +470,7 @@ class HTTPXController(AbstractContextManager):
                     f"Detected UTF-8 encoding, but decoding as UTF-8 failed. Retrying with encoding ISO-8859-1."
                 )
                 try:
-                    _decode = res.content.decode("ISO-8859-1")
+                    _decode = str(_content, "ISO-8859-1")
                 except Exception as exc:
                     msg = Exception(
                         f"Failure attempting to decode content as UTF-8 and ISO-8859-1. Details: {exc}"
@@ -353,13 +480,650 @@ class HTTPXController(AbstractContextManager):
 
         ## Load decoded content into dict
         try:
-            _json: dict = json.loads(_decode)
+            _json: dict = JSON_SERIALIZER.loads(_decode)
 
-            return _json
+            return self._observe_decode(res=res, started_at=started_at, decoded=_json)
 
         except Exception as exc:
             msg = Exception(
                 f"Unhandled exception loading decoded response content to dict. Details: {exc}"
             )
 
-            raise msg
\ No newline at end of file
+            raise msg
+
+    def decode_as(self, res: httpx.Response = None, model: type[T] = None) -> T:
+        """Decode an `httpx.Response`'s JSON body directly into a typed object.
+
+        Description:
+            Parses the body bytes straight into `model` (a msgspec `Struct`, pydantic model, dataclass, or a
+            container of them, i.e. `list[MyModel]`), skipping the intermediate `dict` built by
+            `decode_res_content()`. Decoders are compiled once per type & cached.
+
+            Bodies in a charset other than UTF-8 are transcoded to UTF-8 first.
+
+        Params:
+            res (httpx.Response): An `httpx.Response` object, with `.content` to be decoded.
+            model (type): The type to decode into.
+
+        Returns:
+            (T): An instance of `model`.
+
+        """
+        assert res, ValueError("Missing httpx Response object")
+        assert isinstance(res, httpx.Response), TypeError(
+            f"res must be of type httpx.Response. Got type: ({type(res)})"
+        )
+        assert model is not None, ValueError("Missing a model to decode into")
+
+        started_at: float = time.perf_counter()
+
+        offload: dict[str, t.Any] | None = self._offload_args(res=res)
+        if offload is not None:
+            return self._observe_decode(
+                res=res,
+                started_at=started_at,
+                decoded=self.decode_pool.decode(**offload, type_=model),
+            )
+
+        _content: t.Union[bytes, memoryview] = response_body(res=res)
+        assert _content, ValueError("Response content is empty")
+
+        decode_charset: str = codecs.lookup(
+            CHARSET_DETECTOR.detect_response(res=res)
+        ).name
+        if decode_charset not in ("utf-8", "ascii"):
+            ## utf-8-sig strips the BOM, which JSON parsers reject
+            _content = str(_content, decode_charset).encode("utf-8")
+
+        try:
+            decoded: T = decode_json_as(data=_content, type_=model)
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception decoding response content to type {model}. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise msg
+
+        return self._observe_decode(res=res, started_at=started_at, decoded=decoded)
+
+    def _offload_args(self, res: httpx.Response = None) -> dict[str, t.Any] | None:
+        """Return the arguments to parse a response's body in `self.decode_pool`, or `None` to parse it in place.
+
+        Description:
+            UTF-8 bodies are passed as-is (spilled bodies by path, so the worker maps the file). Bodies in other
+            charsets are transcoded to UTF-8 first.
+        """
+        if self.decode_pool is None:
+            return None
+
+        _content: t.Union[bytes, memoryview] = response_body(res=res)
+        if not self.decode_pool.should_offload(size=len(_content)):
+            return None
+
+        decode_charset: str = codecs.lookup(
+            CHARSET_DETECTOR.detect_response(res=res)
+        ).name
+        if decode_charset not in ("utf-8", "ascii"):
+            ## utf-8-sig strips the BOM, which JSON parsers reject
+            return {"data": str(_content, decode_charset).encode("utf-8")}
+
+        body: SpooledBody | None = spooled_body(res)
+
+        return {
+            "data": _content,
+            "path": body.path if body is not None and body.spilled else None,
+        }
+
+    def _observe_decode(
+        self, res: httpx.Response = None, started_at: float = 0.0, decoded: T = None
+    ) -> T:
+        """Record the time spent decoding a response's body in `self.metrics` (if set), and return `decoded`."""
+        if self.metrics is not None and res._request is not None:
+            self.metrics.observe(
+                phase="decode", url=res.request.url, seconds=time.perf_counter() - started_at
+            )
+
+        return decoded
+
+    def _record_decoder(self, res: httpx.Response = None) -> JSONRecordDecoder:
+        """Return a `JSONRecordDecoder` for a response's body."""
+        assert res, ValueError("Missing httpx Response object")
+        assert isinstance(res, httpx.Response), TypeError(
+            f"res must be of type httpx.Response. Got type: ({type(res)})"
+        )
+
+        try:
+            url: httpx.URL | None = res.url
+        except RuntimeError:
+            ## Response was not created from a request
+            url = None
+
+        return JSONRecordDecoder(encoding=res.charset_encoding, url=url)
+
+    def iter_records(
+        self, res: httpx.Response = None, chunk_size: int | None = None
+    ) -> t.Iterator[t.Any]:
+        """Incrementally decode records from a (streamed) `httpx.Response`.
+
+        Description:
+            Yields each element of a top-level JSON array, or each value of an NDJSON/JSON lines body, as soon as
+            it has been received. Use with `send_request(stream=True)` so the body is never fully held in memory.
+            Bodies already read by `spool_response()` (i.e. with `spool_threshold`) are decoded from their
+            `SpooledBody`. The response is closed when iteration finishes or is abandoned.
+
+        Params:
+            res (httpx.Response): An `httpx.Response` object, i.e. from `send_request(stream=True)`.
+            chunk_size (int|None): Size (in bytes) of chunks read from the response stream.
+
+        Returns:
+            (Iterator[Any]): An iterator of decoded records.
+
+        """
+        decoder: JSONRecordDecoder = self._record_decoder(res=res)
+        body: SpooledBody | None = spooled_body(res)
+
+        try:
+            chunks: t.Iterator[t.Union[bytes, memoryview]] = (
+                spooled_chunks(body=body, chunk_size=chunk_size)
+                if body is not None
+                else res.iter_bytes(chunk_size=chunk_size)
+            )
+            for chunk in chunks:
+                yield from decoder.feed(chunk)
+
+            yield from decoder.close()
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception decoding records from response content. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise msg
+
+        finally:
+            res.close()
+
+
+class HTTPXController(BaseHTTPXController, AbstractContextManager):
+    """Handler for HTTPX client.
+
+    Description:
+        Initializes an `httpx.Client` when entered in a `with` statement. Accepts the same params
+        as `BaseHTTPXController`, plus the params below.
+
+    Params:
+        coalesce_requests (bool|SingleFlight): [Default: False] When `True`, concurrent identical idempotent
+            requests (`GET`, `HEAD`, `OPTIONS`) sent from different threads share a single in-flight call, and every
+            caller receives the same response. Calls are shared through the process-wide `SINGLE_FLIGHT`, so
+            requests from different controllers (i.e. one `with HTTPXController(...)` per thread) are coalesced
+            when the controllers have the same client config. Pass a `SingleFlight` instance to coalesce within a
+            smaller group instead. Streamed requests are never coalesced, and neither are requests whose body is
+            spooled (`spool_threshold` is set): each caller gets its own `SpooledBody`, so closing one never
+            deletes the file another caller is reading.
+        coalesce_headers (Iterable[str]): Request headers included in the coalescing key, in addition to the
+            method, URL & query params. Requests that differ in any of these headers are sent separately.
+        share_client (bool): [Default: False] Reuse a warm `httpx.Client` (and its open connections) from the
+            process-wide `CLIENT_REGISTRY`, shared with other controllers that have the same client config, instead
+            of creating & closing a new client on every `with` statement. Shared clients also share cookies.
+
+    Usage:
+
+    ``` py linenums=1
+    with HTTPXController(base_url="https://example.com") as ctl:
+        req = ctl.new_request(method="GET", url="/endpoint")
+        res = ctl.send_request(request=req)
+    ```
+    """
+
+    def __init__(
+        self,
+        *args,
+        coalesce_requests: t.Union[bool, SingleFlight] = False,
+        coalesce_headers: t.Iterable[str] = DEFAULT_KEY_HEADERS,
+        share_client: bool = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.share_client: bool = share_client
+        ## Key of the shared client acquired from CLIENT_REGISTRY in __enter__
+        self._registry_key: str | None = None
+
+        self.coalesce_requests: bool = bool(coalesce_requests)
+        self.coalesce_headers: tuple[str, ...] = tuple(coalesce_headers)
+        self.single_flight: SingleFlight | None = None
+        if isinstance(coalesce_requests, SingleFlight):
+            self.single_flight = coalesce_requests
+        elif coalesce_requests:
+            self.single_flight = SINGLE_FLIGHT
+        ## Client config key, set in __enter__. Prefixes coalescing keys, so controllers with different
+        #  auth/headers/transports never share a response.
+        self._config_key: str | None = None
+
+    def _send(
+        self,
+        request: httpx.Request = None,
+        stream: bool = False,
+        auth: httpx.Auth = None,
+    ) -> httpx.Response:
+        """Send a request with self.client.
+
+        Description:
+            Waits for `self.rate_limiter` (if set), retries up to `self.retries` times, and shares the call with
+            identical in-flight requests when coalescing.
+        """
+
+        ## Read the body in chunks, spilling it to disk if it is larger than self.spool_threshold
+        spool: bool = self.spool_threshold is not None and not stream
+
+        def _do_send() -> httpx.Response:
+            attempt: int = 0
+
+            while True:
+                if self.rate_limiter is not None:
+                    wait: float = self.rate_limiter.reserve(host=request.url.host)
+                    if wait:
+                        time.sleep(wait)
+
+                self._trace_request(request=request)
+
+                try:
+                    res: httpx.Response = self.client.send(
+                        request=request,
+                        stream=stream or spool,
+                        auth=auth,
+                        follow_redirects=self.follow_redirects,
+                    )
+                except Exception as exc:
+                    delay: float | None = self._retry_delay(
+                        request=request, attempt=attempt, exc=exc
+                    )
+                    if delay is None:
+                        raise
+                else:
+                    delay = self._retry_delay(request=request, attempt=attempt, res=res)
+                    if delay is None:
+                        if spool:
+                            spool_response(
+                                res=res,
+                                threshold=self.spool_threshold,
+                                spool_dir=self.spool_dir,
+                            )
+
+                        return res
+
+                    res.close()
+
+                time.sleep(delay)
+                attempt += 1
+
+        if (
+            self.single_flight is None
+            or stream
+            or spool
+            or request.method not in IDEMPOTENT_METHODS
+        ):
+            ## A coalesced response (& its SpooledBody) is shared by every caller; closing a shared spooled body
+            #  would unmap & delete it for all of them
+            return _do_send()
+
+        ## A per-call auth is only shared with calls passing the same instance
+        _auth_key: str = f"{id(auth):x}" if auth is not None else ""
+
+        return self.single_flight.do(
+            key=f"{self._config_key}:{_auth_key}:{request_key(request=request, headers=self.coalesce_headers)}",
+            fn=_do_send,
+        )
+
+    def __enter__(self) -> t.Self:
+        """Execute when handler is called in a `with` statement.
+
+        Description:
+            Creates an `httpx.Client` object, using class parameters as options.
+        """
+        try:
+            _client_kwargs: dict[str, t.Any] = self._client_kwargs()
+
+            def _build_client() -> httpx.Client:
+                _client: httpx.Client = httpx.Client(**_client_kwargs)
+
+                ## If base_url is None, an exception occurs. Set self.base_url
+                #  only if base_url is not None.
+                if self.base_url:
+                    _client.base_url = self.base_url
+
+                return _client
+
+            self._config_key = client_config_key(
+                client_kwargs={**_client_kwargs, "base_url": self.base_url}
+            )
+
+            if self.share_client:
+                self._registry_key = self._config_key
+                self.client = CLIENT_REGISTRY.acquire(
+                    key=self._registry_key, factory=_build_client
+                )
+            else:
+                self.client = _build_client()
+
+            return self
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception initializing httpx Client. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise exc
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Execute  when `with` statement ends.
+
+        Description:
+            Show any exceptions/tracebacks. Close `self.client` on exit (or release it, if it is shared).
+
+        """
+        if exc_type:
+            log.error(f"({exc_type}): {exc_value}")
+
+        if traceback:
+            log.trace(traceback)
+
+        ## Release shared client back to the registry, or close httpx client
+        if self._registry_key is not None:
+            CLIENT_REGISTRY.release(key=self._registry_key)
+            self._registry_key = None
+        elif self.client:
+            self.client.close()
+
+    def send_request(
+        self,
+        request: httpx.Request = None,
+        stream: bool = False,
+        auth: httpx.Auth = None,
+    ) -> httpx.Response:
+        """Send httpx.Request using self.Client (and optional cache transport).
+
+        Params:
+            request (httpx.Request): An initialized `httpx.Request` object.
+            stream (bool): When `True`, response bytes will be streamed. This can be useful for large file downloads.
+            auth (httpx.Auth): <Not yet documented>
+
+        Returns:
+            (httpx.Response): An `httpx.Response` from the request.
+
+        """
+        assert request, ValueError("Missing an httpx.Request object")
+        assert isinstance(request, httpx.Request), TypeError(
+            f"Expected request to be an httpx.Request object. Got type: ({type(request)})"
+        )
+
+        ## Send request using class's httpx.Client
+        try:
+            res: httpx.Response = self._send(
+                request=request, stream=stream, auth=auth
+            )
+            log.debug(
+                f"URL: {request.url}, Response: [{res.status_code}: {res.reason_phrase}]"
+            )
+
+            return res
+
+        except httpx.ConnectError as conn_err:
+            ## Error connecting to remote
+            msg = Exception(
+                f"ConnectError while requesting URL {request.url}. Details: {conn_err}"
+            )
+            log.error(msg)
+
+            return
+        except Exception as exc:
+            msg = Exception(f"Unhandled exception sending request. Details: {exc}")
+            log.error(msg)
+
+            raise msg
+
+    def send_many(
+        self,
+        requests: t.Iterable[httpx.Request] = None,
+        max_workers: int = 10,
+        ordered: bool = True,
+    ) -> t.Iterator[RequestResult]:
+        """Send many httpx.Request objects through self.client from a bounded thread pool.
+
+        Description:
+            Requests are submitted to a `ThreadPoolExecutor` in a sliding window of `max_workers * 2`, so
+            a large (or lazily-generated) batch of requests is never all held in memory at once. The shared
+            `httpx.Client` (and its connection pool) is used by all worker threads.
+
+            Each request's outcome is yielded as a `RequestResult`. Exceptions (including `httpx.ConnectError`)
+            are stored on the result's `.error` instead of being raised, so one failure does not stop the batch.
+
+        Params:
+            requests (Iterable[httpx.Request]): Initialized `httpx.Request` objects to send.
+            max_workers (int): [Default: 10] Number of threads sending requests.
+            ordered (bool): [Default: True] When `True`, results are yielded in the same order as `requests`.
+                When `False`, results are yielded as soon as each request finishes.
+
+        Returns:
+            (Iterator[RequestResult]): An iterator of `RequestResult` objects, one per request.
+
+        """
+        assert requests is not None, ValueError("Missing httpx.Request objects to send")
+        assert isinstance(max_workers, int) and max_workers > 0, ValueError(
+            f"max_workers must be a positive integer. Got: ({max_workers})"
+        )
+
+        def _send(index: int, request: httpx.Request) -> RequestResult:
+            try:
+                res: httpx.Response = self._send(request=request)
+                log.debug(
+                    f"URL: {request.url}, Response: [{res.status_code}: {res.reason_phrase}]"
+                )
+
+                return RequestResult(index=index, request=request, response=res)
+
+            except Exception as exc:
+                log.error(
+                    f"({type(exc).__name__}) while requesting URL {request.url}. Details: {exc}"
+                )
+
+                return RequestResult(index=index, request=request, error=exc)
+
+        window: int = max_workers * 2
+        _requests: t.Iterator[tuple[int, httpx.Request]] = enumerate(requests)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="httpx-send-many"
+        ) as executor:
+            if ordered:
+                pending: deque[Future[RequestResult]] = deque()
+
+                for index, request in _requests:
+                    pending.append(executor.submit(_send, index, request))
+
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+
+                while pending:
+                    yield pending.popleft().result()
+
+            else:
+                in_flight: set[Future[RequestResult]] = set()
+
+                for index, request in _requests:
+                    in_flight.add(executor.submit(_send, index, request))
+
+                    if len(in_flight) >= window:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            yield fut.result()
+
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield fut.result()
+
+    def paginate(
+        self,
+        request: httpx.Request = None,
+        strategy: PaginationStrategy = None,
+        prefetch: int = 2,
+        max_pages: int | None = None,
+    ) -> t.Iterator[Page]:
+        """Iterate over the pages of a paginated endpoint, fetching pages ahead of the caller.
+
+        Description:
+            While the caller processes page N, up to `prefetch` following pages are fetched in the background,
+            so a slow consumer and network round-trips overlap instead of adding up.
+
+            For strategies that need the previous page to request the next (`LinkHeaderPagination`,
+            `CursorPagination`), a background thread fetches pages one after another, staying up to `prefetch`
+            pages ahead. For predictable strategies (`OffsetPagination`), up to `prefetch` pages are requested
+            concurrently.
+
+            Pages are yielded in order. Each page's response is checked with `raise_for_status()` and decoded
+            with `decode_res_content()`; the first error stops iteration & is raised to the caller.
+
+        Params:
+            request (httpx.Request): The request for the first page.
+            strategy (PaginationStrategy): How to find the next page, & the records in a page.
+            prefetch (int): [Default: 2] Maximum number of pages fetched ahead of the caller.
+            max_pages (int|None): [Default: None] Stop after this many pages.
+
+        Returns:
+            (Iterator[Page]): An iterator of `Page` objects.
+
+        Usage:
+
+        ``` py linenums=1
+        with HTTPXController(base_url="https://api.example.com") as ctl:
+            req = ctl.new_request(url="/users?per_page=100")
+
+            for page in ctl.paginate(request=req, strategy=LinkHeaderPagination(), prefetch=4):
+                for user in page.items:
+                    ...
+        ```
+        """
+        assert request is not None, ValueError("Missing httpx.Request for the first page")
+        assert isinstance(strategy, PaginationStrategy), TypeError(
+            f"strategy must be a PaginationStrategy. Got type: ({type(strategy)})"
+        )
+        assert isinstance(prefetch, int) and prefetch > 0, ValueError(
+            f"prefetch must be a positive integer. Got: ({prefetch})"
+        )
+
+        def _fetch(index: int, page_request: httpx.Request) -> Page:
+            res: httpx.Response = self._send(request=page_request)
+            res.raise_for_status()
+
+            data: t.Any = self.decode_res_content(res=res)
+
+            return Page(
+                index=index,
+                request=page_request,
+                response=res,
+                data=data,
+                items=strategy.items(data=data),
+            )
+
+        def _more(index: int) -> bool:
+            return max_pages is None or index < max_pages
+
+        if strategy.predictable:
+            with ThreadPoolExecutor(
+                max_workers=prefetch, thread_name_prefix="httpx-paginate"
+            ) as executor:
+                pending: deque[Future[Page]] = deque()
+                next_index: int = 0
+
+                def _fill() -> None:
+                    nonlocal next_index
+
+                    while len(pending) < prefetch and _more(next_index):
+                        pending.append(
+                            executor.submit(
+                                _fetch,
+                                next_index,
+                                strategy.request_for(request=request, index=next_index),
+                            )
+                        )
+                        next_index += 1
+
+                try:
+                    _fill()
+
+                    while pending:
+                        page: Page = pending.popleft().result()
+                        if strategy.is_last(page=page):
+                            yield page
+
+                            return
+
+                        ## Top up before yielding, so `prefetch` pages are in flight while the caller works
+                        _fill()
+
+                        yield page
+
+                finally:
+                    for fut in pending:
+                        fut.cancel()
+
+            return
+
+        ## Sequential strategies: a background thread fetches pages into a queue. `slots` bounds the pages
+        #  fetched (or being fetched) that the caller has not taken yet to `prefetch`
+        pages: queue.Queue = queue.Queue()
+        slots: threading.Semaphore = threading.Semaphore(prefetch)
+        stop: threading.Event = threading.Event()
+        done: object = object()
+
+        def _acquire() -> bool:
+            ## Wait for the caller to take a page, unless it stopped iterating
+            while not stop.is_set():
+                if slots.acquire(timeout=0.1):
+                    return True
+
+            return False
+
+        def _produce() -> None:
+            page_request: httpx.Request | None = request
+            index: int = 0
+
+            try:
+                while page_request is not None and _more(index) and _acquire():
+                    page: Page = _fetch(index, page_request)
+                    page_request = strategy.next_request(page=page)
+                    index += 1
+
+                    pages.put(page)
+
+            except Exception as exc:
+                pages.put(exc)
+
+            pages.put(done)
+
+        producer: threading.Thread = threading.Thread(
+            target=_produce, name="httpx-paginate", daemon=True
+        )
+        producer.start()
+
+        try:
+            while True:
+                item: t.Any = pages.get()
+
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+
+                ## Let the producer fetch the next page while the caller works on this one
+                slots.release()
+
+                yield item
+
+        finally:
+            stop.set()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+import re
+import threading
+import typing as t
+
+import httpx
+
+## Histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    math.inf,
+)
+
+## Request phases recorded by the controllers
+PHASES: tuple[str, ...] = (
+    "pool_wait",
+    "connect",
+    "tls",
+    "ttfb",
+    "download",
+    "total",
+    "decode",
+)
+
+## Path segments replaced with "{id}" when grouping requests by route
+_ID_SEGMENT: re.Pattern = re.compile(
+    r"^(\d+|[0-9a-fA-F]{16,}|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+def route_template(url: httpx.URL = None) -> str:
+    """Return a low-cardinality route for a URL, i.e. `/users/123/orders` -> `/users/{id}/orders`."""
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in url.path.split("/")
+    )
+
+
+class Histogram:
+    """A fixed-bucket histogram of durations (in seconds)."""
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        self.counts: list[int] = [0] * len(self.buckets)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[min(bisect_left(self.buckets, value), len(self.buckets) - 1)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict[str, t.Any]:
+        cumulative: list[int] = []
+        running: int = 0
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "buckets": dict(zip(self.buckets, cumulative)),
+        }
+
+
+class RequestMetrics:
+    """In-process histograms of request phase durations, grouped by phase, host & route.
+
+    Description:
+        Controllers created with `metrics=...` record, for each request:
+
+        - `pool_wait`: Time from sending until the request got a connection from the pool.
+        - `connect`: Opening a new TCP connection (including DNS resolution, which httpcore does not trace
+            separately).
+        - `tls`: TLS handshake on a new connection.
+        - `ttfb`: Time from sending the request headers until the response headers were received.
+        - `download`: Reading the response body.
+        - `total`: Time from sending until the response body was read.
+        - `decode`: Time spent in `decode_res_content()`.
+
+        Read the histograms with `snapshot()`, or as Prometheus text exposition format with `to_prometheus()`.
+
+    Params:
+        buckets (Sequence[float]): [Default: DEFAULT_BUCKETS] Histogram bucket upper bounds, in seconds.
+        route_func (Callable[[httpx.URL], str]): [Default: route_template] Function returning the route label
+            for a request URL. Should return a low-cardinality value (i.e. without IDs).
+
+    """
+
+    def __init__(
+        self,
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+        route_func: t.Callable[[httpx.URL], str] = route_template,
+    ) -> None:
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        if self.buckets[-1] != math.inf:
+            self.buckets += (math.inf,)
+        self.route_func: t.Callable[[httpx.URL], str] = route_func
+
+        self._histograms: dict[tuple[str, str, str], Histogram] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def observe(self, phase: str = None, url: httpx.URL = None, seconds: float = None) -> None:
+        """Record a phase duration for a request URL."""
+        key: tuple[str, str, str] = (phase, url.host, self.route_func(url))
+
+        with self._lock:
+            histogram: Histogram | None = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(buckets=self.buckets)
+                self._histograms[key] = histogram
+
+            histogram.observe(seconds)
+
+    def snapshot(self) -> list[dict[str, t.Any]]:
+        """Return a list of histograms, each with its `phase`, `host` & `route` labels."""
+        with self._lock:
+            return [
+                {"phase": phase, "host": host, "route": route, **histogram.snapshot()}
+                for (phase, host, route), histogram in sorted(self._histograms.items())
+            ]
+
+    def to_prometheus(self, name: str = "httpx_request_phase_seconds") -> str:
+        """Return the histograms in Prometheus text exposition format."""
+
+        def _escape(value: str) -> str:
+            return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        lines: list[str] = [
+            f"# HELP {name} Duration of HTTP request phases, in seconds.",
+            f"# TYPE {name} histogram",
+        ]
+
+        for hist in self.snapshot():
+            labels: str = f'phase="{_escape(hist["phase"])}",host="{_escape(hist["host"])}",route="{_escape(hist["route"])}"'
+
+            for bound, count in hist["buckets"].items():
+                le: str = "+Inf" if bound == math.inf else repr(float(bound))
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+
+            lines.append(f"{name}_sum{{{labels}}} {hist['sum']}")
+            lines.append(f"{name}_count{{{labels}}} {hist['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Remove all recorded histograms."""
+        with self._lock:
+            self._histograms.clear()
+
+
+## Process-wide metrics, used by controllers created with `metrics=REQUEST_METRICS`
+REQUEST_METRICS: RequestMetrics = RequestMetrics()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+import typing as t
+
+import httpx
+
+
+def _get_path(data: t.Any, path: str | None) -> t.Any:
+    """Return the value at a dotted `path` (i.e. "meta.next_cursor") in decoded JSON, or `None` if missing."""
+    if not path:
+        return data
+
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+
+    return data
+
+
+def _follow_up(request: httpx.Request = None, url: httpx.URL = None) -> httpx.Request:
+    """Return a copy of `request` for another URL (i.e. the next page)."""
+    headers: httpx.Headers = request.headers.copy()
+    ## Recomputed by httpx for the new URL & body
+    for name in ("host", "content-length", "transfer-encoding"):
+        headers.pop(name, None)
+
+    return httpx.Request(
+        method=request.method,
+        url=url,
+        headers=headers,
+        content=request.content or None,
+        ## Keep per-request settings, i.e. timeouts & traces
+        extensions=dict(request.extensions),
+    )
+
+
+@dataclass
+class Page:
+    """A page fetched by `HTTPXController.paginate()`.
+
+    Params:
+        index (int): Position of the page, starting at 0.
+        request (httpx.Request): The request that fetched the page.
+        response (httpx.Response): The page's response.
+        data (Any): The decoded JSON body.
+        items (list): The page's records, extracted from `data` by the pagination strategy.
+
+    """
+
+    index: int
+    request: httpx.Request
+    response: httpx.Response
+    data: t.Any = field(default=None)
+    items: list = field(default_factory=list)
+
+
+class PaginationStrategy(ABC):
+    """Base class for pagination strategies used by `HTTPXController.paginate()`.
+
+    Description:
+        A strategy extracts a page's records with `items()`, and decides how to request the next page with
+        `next_request()`. Pages are fetched one after another, ahead of the caller.
+
+        Strategies that can build any page's request up front (i.e. offset/limit) subclass
+        `PredictablePagination` instead, and their pages are fetched concurrently.
+
+    Params:
+        items_field (str|None): [Default: None] Dotted path to the list of records in a page's JSON body, i.e.
+            "data" or "result.items". When `None`, the whole body is the list of records.
+
+    """
+
+    predictable: bool = False
+
+    def __init__(self, items_field: str | None = None) -> None:
+        self.items_field: str | None = items_field
+
+    def items(self, data: t.Any = None) -> list:
+        """Return the records in a page's decoded JSON body."""
+        items: t.Any = _get_path(data, self.items_field)
+
+        return items if isinstance(items, list) else []
+
+    @abstractmethod
+    def next_request(self, page: Page = None) -> httpx.Request | None:
+        """Return the request for the page after `page`, or `None` if `page` is the last page."""
+
+
+class PredictablePagination(PaginationStrategy):
+    """Base class for strategies that can build any page's request from the first page's request.
+
+    Description:
+        `paginate()` requests up to `prefetch` pages of a predictable strategy concurrently, with `request_for()`,
+        and stops after the first page where `is_last()` is `True`.
+    """
+
+    predictable: bool = True
+
+    @abstractmethod
+    def request_for(self, request: httpx.Request = None, index: int = 0) -> httpx.Request:
+        """Return the request for page `index`, given the first page's request."""
+
+    @abstractmethod
+    def is_last(self, page: Page = None) -> bool:
+        """Return `True` if no page follows `page`."""
+
+    def next_request(self, page: Page = None) -> httpx.Request | None:
+        if self.is_last(page=page):
+            return None
+
+        return self.request_for(request=page.request, index=page.index + 1)
+
+
+class LinkHeaderPagination(PaginationStrategy):
+    """Follow the `rel="next"` URL of the response's `Link` header (RFC 8288), i.e. the GitHub API."""
+
+    def next_request(self, page: Page = None) -> httpx.Request | None:
+        next_url: str | None = page.response.links.get("next", {}).get("url")
+        if not next_url:
+            return None
+
+        return _follow_up(request=page.request, url=page.request.url.join(next_url))
+
+
+class CursorPagination(PaginationStrategy):
+    """Pass the cursor/token from each page's body as a query param of the next request.
+
+    Params:
+        cursor_field (str): [Default: "next_cursor"] Dotted path to the next page's cursor in a page's JSON body.
+        cursor_param (str): [Default: "cursor"] Query param the cursor is sent as.
+        items_field (str|None): [Default: "data"] Dotted path to the list of records in a page's JSON body.
+
+    """
+
+    def __init__(
+        self,
+        cursor_field: str = "next_cursor",
+        cursor_param: str = "cursor",
+        items_field: str | None = "data",
+    ) -> None:
+        super().__init__(items_field=items_field)
+
+        self.cursor_field: str = cursor_field
+        self.cursor_param: str = cursor_param
+
+    def next_request(self, page: Page = None) -> httpx.Request | None:
+        cursor: t.Any = _get_path(page.data, self.cursor_field)
+        if cursor in (None, ""):
+            return None
+
+        return _follow_up(
+            request=page.request,
+            url=page.request.url.copy_merge_params({self.cursor_param: cursor}),
+        )
+
+
+class OffsetPagination(PredictablePagination):
+    """Request pages with `offset` & `limit` query params. Pages are fetched concurrently.
+
+    Description:
+        The last page is the first one with fewer than `limit` records. Pages requested beyond it are discarded.
+
+    Params:
+        limit (int): [Default: 100] Records per page.
+        offset_param (str): [Default: "offset"] Query param for the first record's offset.
+        limit_param (str): [Default: "limit"] Query param for the page size.
+        start (int): [Default: 0] Offset of the first page.
+        items_field (str|None): [Default: None] Dotted path to the list of records in a page's JSON body.
+
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        start: int = 0,
+        items_field: str | None = None,
+    ) -> None:
+        assert isinstance(limit, int) and limit > 0, ValueError(
+            f"limit must be a positive integer. Got: ({limit})"
+        )
+        super().__init__(items_field=items_field)
+
+        self.limit: int = limit
+        self.offset_param: str = offset_param
+        self.limit_param: str = limit_param
+        self.start: int = start
+
+    def request_for(self, request: httpx.Request = None, index: int = 0) -> httpx.Request:
+        return _follow_up(
+            request=request,
+            url=request.url.copy_merge_params(
+                {
+                    self.offset_param: self.start + index * self.limit,
+                    self.limit_param: self.limit,
+                }
+            ),
+        )
+
+    def is_last(self, page: Page = None) -> bool:
+        return len(page.items) < self.limit
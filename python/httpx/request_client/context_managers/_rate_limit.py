@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from email.utils import parsedate_to_datetime
+import datetime
+import random
+import threading
+import time
+import typing as t
+
+import httpx
+
+## Response status codes that are retried (with backoff) when a controller has `retries` set
+RETRY_STATUS_CODES: tuple[int, ...] = (429, 503)
+
+
+class TokenBucket:
+    """A thread-safe token bucket, refilled at `rate` tokens/second up to `burst` tokens.
+
+    Description:
+        `reserve()` takes a token and returns how long the caller must wait before using it. Tokens can go
+        negative, so concurrent callers queue up behind each other instead of all waking at the same time.
+        `penalize()` blocks the bucket until a point in time, i.e. from a `Retry-After` header.
+
+    Params:
+        rate (float|None): Tokens added per second. When `None`, the bucket never throttles (only penalties apply).
+        burst (int): [Default: 1] Maximum number of tokens, i.e. requests that can be sent back-to-back.
+
+    """
+
+    def __init__(self, rate: float | None = None, burst: int = 1) -> None:
+        if rate is not None:
+            assert rate > 0, ValueError(f"rate must be a positive number. Got: ({rate})")
+        assert isinstance(burst, int) and burst > 0, ValueError(
+            f"burst must be a positive integer. Got: ({burst})"
+        )
+
+        self.rate: float | None = rate
+        self.burst: int = burst
+
+        self._tokens: float = float(burst)
+        self._updated_at: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, and return the number of seconds to wait before sending a request."""
+        with self._lock:
+            now: float = time.monotonic()
+            wait: float = max(self._blocked_until - now, 0.0)
+
+            if self.rate is None:
+                return wait
+
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+
+            return wait
+
+    def penalize(self, seconds: float = None) -> None:
+        """Block the bucket for `seconds` (i.e. a `Retry-After` value), unless already blocked for longer."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """Per-host token bucket rate limiter.
+
+    Description:
+        Share one instance between controllers (i.e. the process-wide `RATE_LIMITER`) so that all requests to a
+        host, from any controller, draw from the same bucket, and a `Retry-After` from one response pauses every
+        caller of that host.
+
+    Params:
+        default_rate (float|None): [Default: None] Requests/second allowed for hosts without an explicit limit.
+            When `None`, hosts are not throttled, but `Retry-After` penalties are still applied.
+        default_burst (int): [Default: 1] Burst size for hosts without an explicit limit.
+
+    Usage:
+
+    ``` py linenums=1
+    RATE_LIMITER.configure(host="api.example.com", rate=10, burst=20)
+
+    with HTTPXController(rate_limiter=RATE_LIMITER, retries=5) as ctl:
+        ...
+    ```
+    """
+
+    def __init__(self, default_rate: float | None = None, default_burst: int = 1) -> None:
+        self.default_rate: float | None = default_rate
+        self.default_burst: int = default_burst
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def configure(self, host: str = None, rate: float | None = None, burst: int = 1) -> None:
+        """Set the rate (requests/second) & burst size for a host."""
+        assert host, ValueError("Missing host to configure")
+
+        with self._lock:
+            self._buckets[host] = TokenBucket(rate=rate, burst=burst)
+
+    def bucket(self, host: str = None) -> TokenBucket:
+        """Return a host's bucket, creating it with the default rate if needed."""
+        with self._lock:
+            _bucket: TokenBucket | None = self._buckets.get(host)
+
+            if _bucket is None:
+                _bucket = TokenBucket(rate=self.default_rate, burst=self.default_burst)
+                self._buckets[host] = _bucket
+
+            return _bucket
+
+    def reserve(self, host: str = None) -> float:
+        """Take a token for a host, and return the number of seconds to wait before sending."""
+        return self.bucket(host=host).reserve()
+
+    def penalize(self, host: str = None, seconds: float = None) -> None:
+        """Pause all requests to a host for `seconds`."""
+        self.bucket(host=host).penalize(seconds=seconds)
+
+
+## Process-wide rate limiter shared by controllers created with `rate_limiter=RATE_LIMITER`
+RATE_LIMITER: RateLimiter = RateLimiter()
+
+
+def retry_after_seconds(res: httpx.Response = None) -> float | None:
+    """Parse a response's `Retry-After` header (delta-seconds or HTTP-date) into seconds."""
+    value: str | None = res.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at: datetime.datetime = parsedate_to_datetime(value)
+
+        return max(
+            (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(),
+            0.0,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int = 0,
+    base: float = 0.5,
+    cap: float = 30.0,
+    retry_after: float | None = None,
+) -> float:
+    """Return a delay before retry `attempt` (0-indexed).
+
+    Description:
+        Uses exponential backoff with "full jitter" (a random delay between 0 and `base * 2**attempt`, capped at
+        `cap`), so clients that failed together do not retry in lockstep. When the server sent a `Retry-After`,
+        the delay is at least `retry_after`, plus a small jitter.
+    """
+    delay: float = random.uniform(0, min(cap, base * 2**attempt))
+
+    if retry_after is not None:
+        delay = retry_after + random.uniform(0, min(base, retry_after * 0.1 + 0.01))
+
+    return delay
+
+
+def should_retry(
+    request: httpx.Request = None,
+    res: httpx.Response | None = None,
+    exc: Exception | None = None,
+) -> bool:
+    """Return `True` if a request that got `res` (or raised `exc`) should be retried."""
+    if isinstance(exc, httpx.ConnectError):
+        ## The request never reached the server, safe to retry for any method
+        return True
+
+    if not isinstance(request.stream, httpx.ByteStream):
+        ## A streamed body (i.e. from a generator) was consumed by the first attempt & cannot be replayed
+        return False
+
+    if res is not None:
+        return res.status_code in RETRY_STATUS_CODES
+
+    if isinstance(exc, httpx.TransportError):
+        return request.method in ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    return False
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass, field
+import hashlib
+import os
+import threading
+import time
+import typing as t
+
+import httpx
+from loguru import logger as log
+
+
+def _key_part(value: t.Any) -> t.Any:
+    """Return a hashable, deterministic representation of a client option."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (httpx.URL, httpx.Limits, httpx.Timeout)):
+        return repr(value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _key_part(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_key_part(v) for v in value)
+
+    ## Stateful objects (auth, transports, callables) are only shared by identity
+    return (type(value).__qualname__, id(value))
+
+
+def client_config_key(client_kwargs: dict[str, t.Any] = None) -> str:
+    """Build a registry key from the keyword arguments used to initialize an `httpx.Client`.
+
+    Description:
+        Plain values (URLs, headers, params, limits, timeouts, proxies) are compared by value. Stateful objects
+        (auth, transports, mounts' transports) are compared by identity, so two controllers only share a client
+        if they were given the same auth/transport instances.
+    """
+    parts: tuple = tuple(
+        (name, _key_part(value)) for name, value in sorted(client_kwargs.items())
+    )
+
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Entry:
+    client: httpx.Client
+    refcount: int = field(default=0)
+    released_at: float = field(default_factory=time.monotonic)
+
+
+class ClientRegistry:
+    """Process-wide registry of warm `httpx.Client` objects, shared between controllers with the same config.
+
+    Description:
+        `acquire()` returns the registered client for a key (creating it with `factory` if needed), and increments
+        its reference count. `release()` decrements it. A client is not closed when its last user releases it;
+        it stays in the registry (with its open connections) for `idle_timeout` seconds, so short-lived call sites
+        reuse the same connections instead of repeating DNS/TCP/TLS setup. Idle clients are closed lazily on the
+        next `acquire()`/`release()`, or with `evict_idle()`.
+
+        After `os.fork()`, the child process starts with an empty registry. Clients inherited from the parent
+        are dropped without being closed, so the child never writes to (or shuts down) the parent's sockets.
+
+    Params:
+        idle_timeout (int|float): [Default: 300] Seconds an unused client is kept before it is closed.
+
+    """
+
+    def __init__(self, idle_timeout: t.Union[int, float] = 300) -> None:
+        self.idle_timeout: t.Union[int, float] = idle_timeout
+
+        self._entries: dict[str, _Entry] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._pid: int = os.getpid()
+
+        self.created: int = 0
+        self.reused: int = 0
+        self.evicted: int = 0
+
+    def _reset_after_fork(self) -> None:
+        """Drop (without closing) clients inherited from the parent process."""
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+    def _evict_idle(self, now: float) -> list[httpx.Client]:
+        expired: list[str] = [
+            key
+            for key, entry in self._entries.items()
+            if entry.refcount == 0 and now - entry.released_at > self.idle_timeout
+        ]
+
+        self.evicted += len(expired)
+
+        return [self._entries.pop(key).client for key in expired]
+
+    @staticmethod
+    def _close(clients: list[httpx.Client]) -> None:
+        for client in clients:
+            try:
+                client.close()
+            except Exception as exc:
+                log.warning(f"Exception closing idle httpx client. Details: {exc}")
+
+    def acquire(self, key: str = None, factory: t.Callable[[], httpx.Client] = None) -> httpx.Client:
+        """Return the client registered for `key` (created with `factory` if needed), and take a reference."""
+        self._check_pid()
+
+        with self._lock:
+            idle: list[httpx.Client] = self._evict_idle(now=time.monotonic())
+            entry: _Entry | None = self._entries.get(key)
+
+            if entry is None or entry.client.is_closed:
+                entry = _Entry(client=factory())
+                self._entries[key] = entry
+                self.created += 1
+            else:
+                self.reused += 1
+
+            entry.refcount += 1
+            client: httpx.Client = entry.client
+
+        self._close(idle)
+
+        return client
+
+    def release(self, key: str = None) -> None:
+        """Release a reference to the client registered for `key`."""
+        self._check_pid()
+
+        with self._lock:
+            entry: _Entry | None = self._entries.get(key)
+
+            if entry is not None:
+                entry.refcount = max(entry.refcount - 1, 0)
+                if entry.refcount == 0:
+                    entry.released_at = time.monotonic()
+
+            idle: list[httpx.Client] = self._evict_idle(now=time.monotonic())
+
+        self._close(idle)
+
+    def evict_idle(self) -> int:
+        """Close clients that have been unused for longer than `idle_timeout`. Returns the number closed."""
+        self._check_pid()
+
+        with self._lock:
+            idle: list[httpx.Client] = self._evict_idle(now=time.monotonic())
+
+        self._close(idle)
+
+        return len(idle)
+
+    def close_all(self) -> None:
+        """Close & remove every registered client, including clients still in use."""
+        self._check_pid()
+
+        with self._lock:
+            clients: list[httpx.Client] = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+
+        self._close(clients)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of registered/in-use clients, and created/reused/evicted counters."""
+        with self._lock:
+            return {
+                "clients": len(self._entries),
+                "in_use": sum(1 for entry in self._entries.values() if entry.refcount),
+                "created": self.created,
+                "reused": self.reused,
+                "evicted": self.evicted,
+            }
+
+
+## Process-wide registry used by controllers created with `share_client=True`
+CLIENT_REGISTRY: ClientRegistry = ClientRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=CLIENT_REGISTRY._reset_after_fork)
+
+atexit.register(CLIENT_REGISTRY.close_all)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import threading
+import typing as t
+
+import httpx
+
+## Methods that are safe to share a single in-flight call between callers
+IDEMPOTENT_METHODS: tuple[str, ...] = ("GET", "HEAD", "OPTIONS")
+## Request headers included in a coalescing key by default
+DEFAULT_KEY_HEADERS: tuple[str, ...] = ("accept", "accept-encoding", "authorization")
+
+T = t.TypeVar("T")
+
+
+def request_key(
+    request: httpx.Request = None, headers: t.Iterable[str] = DEFAULT_KEY_HEADERS
+) -> str:
+    """Build a key identifying identical requests, from the method, URL, query params & selected headers.
+
+    Params:
+        request (httpx.Request): The request to build a key for.
+        headers (Iterable[str]): Names of request headers to include in the key. Requests that differ in any
+            of these headers are never coalesced.
+
+    Returns:
+        (str): A hex digest identifying the request.
+
+    """
+    assert isinstance(request, httpx.Request), TypeError(
+        f"Expected request to be an httpx.Request object. Got type: ({type(request)})"
+    )
+
+    url: httpx.URL = request.url
+    ## Sort query params so ?a=1&b=2 & ?b=2&a=1 share a key
+    params: list[tuple[str, str]] = sorted(url.params.multi_items())
+
+    parts: list[str] = [
+        request.method,
+        f"{url.scheme}://{url.netloc.decode('ascii')}{url.path}",
+        repr(params),
+    ]
+    for name in sorted(h.lower() for h in headers):
+        parts.append(f"{name}={request.headers.get_list(name)}")
+
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Call:
+    event: threading.Event = field(default_factory=threading.Event)
+    result: t.Any = field(default=None)
+    error: BaseException | None = field(default=None)
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    Description:
+        The first caller for a key (the "leader") runs the function. Callers that arrive with the same key while
+        the leader's call is in flight wait for it, and receive the same result (or exception). Once the call
+        completes, the next caller for the key starts a new call; results are not cached.
+
+    Usage:
+
+    ``` py linenums=1
+    flight = SingleFlight()
+    res = flight.do(key=request_key(req), fn=lambda: client.send(req))
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+        self.leaders: int = 0
+        self.followers: int = 0
+
+    def do(self, key: str = None, fn: t.Callable[[], T] = None) -> T:
+        """Run `fn`, or wait for the in-flight call with the same `key` and return its result."""
+        with self._lock:
+            call: _Call | None = self._calls.get(key)
+
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.leaders += 1
+                leader: bool = True
+            else:
+                self.followers += 1
+                leader = False
+
+        if not leader:
+            call.event.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = fn()
+
+            return call.result
+
+        except BaseException as exc:
+            call.error = exc
+
+            raise
+
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+            call.event.set()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of calls made (leaders), and callers that shared a call (followers)."""
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "followers": self.followers,
+                "in_flight": len(self._calls),
+            }
+
+
+## Process-wide single-flight group, used by controllers created with `coalesce_requests=True`
+SINGLE_FLIGHT: SingleFlight = SingleFlight()
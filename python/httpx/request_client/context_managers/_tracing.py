@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+
+import httpx
+
+from ._metrics import RequestMetrics
+
+## A trace callback receives httpcore's event name (i.e. "connection.connect_tcp.started") & event info
+TraceCallback = t.Callable[[str, dict[str, t.Any]], None]
+
+## Attribute of a trace installed by `install_trace()`, holding the trace it wraps
+_WRAPPED_TRACE: str = "__wrapped_trace__"
+
+
+def install_trace(
+    request: httpx.Request = None, callback: TraceCallback = None, is_async: bool = False
+) -> None:
+    """Add a callback to a request's httpcore `trace` extension, keeping any trace that is already installed.
+
+    Params:
+        request (httpx.Request): The request to trace.
+        callback (TraceCallback): A (sync) function called with each trace event's name & info.
+        is_async (bool): [Default: False] Set to `True` when the request is sent with an `httpx.AsyncClient`,
+            which requires the trace extension to be a coroutine function.
+
+    """
+    previous: t.Callable | None = request.extensions.get("trace")
+
+    if is_async:
+
+        async def _trace(name: str, info: dict[str, t.Any]) -> None:
+            callback(name, info)
+            if previous is not None:
+                await previous(name, info)
+
+    else:
+
+        def _trace(name: str, info: dict[str, t.Any]) -> None:
+            callback(name, info)
+            if previous is not None:
+                previous(name, info)
+
+    setattr(_trace, _WRAPPED_TRACE, previous)
+    request.extensions["trace"] = _trace
+
+
+def reset_trace(request: httpx.Request = None) -> None:
+    """Remove the traces `install_trace()` added to a request, restoring the request's own `trace` extension.
+
+    Description:
+        Call before re-installing traces on a request that is sent again (i.e. a retry), so each attempt is
+        traced once instead of once per earlier attempt.
+    """
+    trace: t.Callable | None = request.extensions.get("trace")
+    while trace is not None and hasattr(trace, _WRAPPED_TRACE):
+        trace = getattr(trace, _WRAPPED_TRACE)
+
+    if trace is None:
+        request.extensions.pop("trace", None)
+    else:
+        request.extensions["trace"] = trace
+
+
+def trace_phases(
+    request: httpx.Request = None, metrics: RequestMetrics = None, is_async: bool = False
+) -> None:
+    """Install a trace on `request` that records its phase durations (connect, TLS, TTFB, ...) in `metrics`.
+
+    Description:
+        Phases are measured from httpcore trace events. Phases that do not happen for a request are not recorded,
+        i.e. `connect` & `tls` are only recorded when a new connection is opened, and nothing is recorded for a
+        response served by a caching transport without reaching the network.
+    """
+    url: httpx.URL = request.url
+    started_at: float = time.perf_counter()
+    marks: dict[str, float] = {}
+
+    def _callback(name: str, info: dict[str, t.Any]) -> None:
+        now: float = time.perf_counter()
+        ## i.e. "http11.receive_response_headers.complete" -> ("receive_response_headers", "complete")
+        _, _, event = name.partition(".")
+        step, _, status = event.rpartition(".")
+
+        if status == "started":
+            marks.setdefault(step, now)
+
+            if "pool_wait" not in marks and step in ("connect_tcp", "send_request_headers"):
+                marks["pool_wait"] = now
+                metrics.observe(phase="pool_wait", url=url, seconds=now - started_at)
+
+            return
+
+        if status != "complete":
+            return
+
+        if step == "connect_tcp" and step in marks:
+            metrics.observe(phase="connect", url=url, seconds=now - marks[step])
+        elif step == "start_tls" and step in marks:
+            metrics.observe(phase="tls", url=url, seconds=now - marks[step])
+        elif step == "receive_response_headers" and "send_request_headers" in marks:
+            metrics.observe(
+                phase="ttfb", url=url, seconds=now - marks["send_request_headers"]
+            )
+        elif step == "receive_response_body" and step in marks:
+            metrics.observe(phase="download", url=url, seconds=now - marks[step])
+            metrics.observe(phase="total", url=url, seconds=now - started_at)
+
+    install_trace(request=request, callback=_callback, is_async=is_async)
+
+
+def _unwrap_transports(client: t.Union[httpx.Client, httpx.AsyncClient]) -> list[t.Any]:
+    """Return a client's transports (including mounts), unwrapping caching/wrapping transports."""
+    transports: list[t.Any] = [client._transport, *client._mounts.values()]
+    unwrapped: list[t.Any] = []
+
+    for transport in transports:
+        ## i.e. hishel.CacheTransport(transport=httpx.HTTPTransport(...))
+        while transport is not None and not hasattr(transport, "_pool"):
+            transport = getattr(transport, "_transport", None)
+
+        if transport is not None and transport not in unwrapped:
+            unwrapped.append(transport)
+
+    return unwrapped
+
+
+def pool_connections(
+    client: t.Union[httpx.Client, httpx.AsyncClient] = None,
+) -> dict[str, int]:
+    """Count the active & idle connections in a client's connection pool(s)."""
+    counts: dict[str, int] = {"connections": 0, "active": 0, "idle": 0}
+
+    if client is None:
+        return counts
+
+    for transport in _unwrap_transports(client=client):
+        for connection in transport._pool.connections:
+            counts["connections"] += 1
+
+            if connection.is_idle():
+                counts["idle"] += 1
+            elif not connection.is_closed():
+                counts["active"] += 1
+
+    return counts
+
+
+class PoolMonitor:
+    """Collect connection pool statistics from httpcore trace events.
+
+    Description:
+        Installed on each request as an httpcore `trace` callback (see `trace_request()`), before it is sent.
+        For each request that reaches the connection pool, it records whether a new connection was opened or an
+        idle one was reused, and how long the request waited before its connection started connecting/sending
+        (pool wait time).
+
+        Responses served without reaching the pool (i.e. cache hits) are not counted.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+
+        self.requests: int = 0
+        self.new_connections: int = 0
+        self.reused_connections: int = 0
+        self.pool_wait_total: float = 0.0
+        self.pool_wait_max: float = 0.0
+
+    def _record(self, new_connection: bool, pool_wait: float) -> None:
+        with self._lock:
+            self.requests += 1
+
+            if new_connection:
+                self.new_connections += 1
+            else:
+                self.reused_connections += 1
+
+            self.pool_wait_total += pool_wait
+            self.pool_wait_max = max(self.pool_wait_max, pool_wait)
+
+    def trace_request(self, request: httpx.Request = None, is_async: bool = False) -> None:
+        """Install a trace on `request` that records pool statistics once it is sent."""
+        started_at: float = time.perf_counter()
+        state: dict[str, t.Any] = {"recorded": False}
+
+        def _callback(name: str, info: dict[str, t.Any]) -> None:
+            if state["recorded"]:
+                return
+
+            if name == "connection.connect_tcp.started":
+                state["recorded"] = True
+                self._record(
+                    new_connection=True, pool_wait=time.perf_counter() - started_at
+                )
+            elif name.endswith("send_request_headers.started"):
+                state["recorded"] = True
+                self._record(
+                    new_connection=False, pool_wait=time.perf_counter() - started_at
+                )
+
+        install_trace(request=request, callback=_callback, is_async=is_async)
+
+    def stats(self) -> dict[str, t.Union[int, float]]:
+        """Return request, connection reuse & pool wait statistics."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "reuse_ratio": self.reused_connections / self.requests
+                if self.requests
+                else 0.0,
+                "pool_wait_avg": self.pool_wait_total / self.requests
+                if self.requests
+                else 0.0,
+                "pool_wait_max": self.pool_wait_max,
+            }
@@ -2,5 +2,13 @@
 
 from __future__ import annotations
 
-from . import json_encoders
-from .json_encoders import DateTimeEncoder
+from . import charsets, json_encoders
+from .charsets import CHARSET_DETECTOR, CharsetDetector, get_charset_stats
+from .json_encoders import (
+    JSON_SERIALIZER,
+    DateTimeEncoder,
+    JSONRecordDecoder,
+    JSONSerializer,
+    ProcessPoolDecoder,
+    decode_json_as,
+)
@@ -0,0 +1,10 @@
+"""Tiered character set detection for response bodies."""
+
+from __future__ import annotations
+
+from ._detector import (
+    CHARSET_DETECTOR,
+    DETECTION_TIERS,
+    CharsetDetector,
+    get_charset_stats,
+)
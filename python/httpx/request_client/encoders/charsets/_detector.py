@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import codecs
+import threading
+import typing as t
+
+import chardet
+import httpx
+from loguru import logger as log
+
+## Byte order marks, checked longest-first so UTF-32 LE is not mistaken for UTF-16 LE
+BOMS: list[tuple[bytes, str]] = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+## Names of the tiers that can settle a charset decision, in the order they are checked
+DETECTION_TIERS: tuple[str, ...] = (
+    "content_type",
+    "bom",
+    "utf8",
+    "cache",
+    "chardet",
+    "default",
+)
+
+
+class CharsetDetector:
+    """Tiered, memoized character set detection for response bodies.
+
+    Description:
+        Checks, in order, until one tier settles the charset:
+
+        1. `content_type`: The `charset=` param of the response's `Content-Type` header.
+        2. `bom`: A byte order mark at the start of the body.
+        3. `utf8`: A strict UTF-8 decode of the first `sample_size` bytes.
+        4. `cache`: A charset previously detected with `chardet` for the same host/endpoint.
+        5. `chardet`: `chardet.detect()` on the first `sample_size` bytes.
+        6. `default`: Fall back to `default_encoding`.
+
+        Charsets detected by `chardet` are memoized per host/endpoint in an LRU of `cache_size` entries.
+        `stats()` returns a count of how many decisions each tier settled.
+
+    Params:
+        sample_size (int): [Default: 65536] Maximum number of bytes inspected by the `utf8` & `chardet` tiers.
+        cache_size (int): [Default: 256] Maximum number of host/endpoint charsets to memoize.
+        default_encoding (str): [Default: utf-8] Encoding returned when no tier can settle the charset.
+
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 65536,
+        cache_size: int = 256,
+        default_encoding: str = "utf-8",
+    ) -> None:
+        assert isinstance(sample_size, int) and sample_size > 0, ValueError(
+            f"sample_size must be a positive integer. Got: ({sample_size})"
+        )
+        assert isinstance(cache_size, int) and cache_size >= 0, ValueError(
+            f"cache_size must be a non-negative integer. Got: ({cache_size})"
+        )
+
+        self.sample_size: int = sample_size
+        self.cache_size: int = cache_size
+        self.default_encoding: str = default_encoding
+
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._counters: dict[str, int] = {tier: 0 for tier in DETECTION_TIERS}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _settle(self, tier: str, charset: str) -> str:
+        with self._lock:
+            self._counters[tier] += 1
+
+        return charset
+
+    def _cache_get(self, key: str | None) -> str | None:
+        if key is None or not self.cache_size:
+            return None
+
+        with self._lock:
+            charset: str | None = self._cache.get(key)
+            if charset is not None:
+                self._cache.move_to_end(key)
+
+            return charset
+
+    def _cache_set(self, key: str | None, charset: str) -> None:
+        if key is None or not self.cache_size:
+            return
+
+        with self._lock:
+            self._cache[key] = charset
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def endpoint_key(url: httpx.URL | None) -> str | None:
+        """Return the memoization key (host + path) for a URL."""
+        if url is None:
+            return None
+
+        return f"{url.host}{url.path}"
+
+    def detect(
+        self,
+        content: bytes = None,
+        content_type: str | None = None,
+        url: httpx.URL | None = None,
+        final: bool = True,
+    ) -> str:
+        """Detect the character set of a bytestring.
+
+        Params:
+            content (bytes): The bytestring to inspect. Only the first `sample_size` bytes are read by the
+                `utf8` and `chardet` tiers.
+            content_type (str|None): The charset from a response's `Content-Type` header, if any.
+            url (httpx.URL|None): The URL the content was requested from. Used as the memoization key.
+            final (bool): [Default: True] Set to `False` when `content` is only the first chunk of a stream,
+                so a multi-byte character cut off at the end of the chunk is not treated as invalid UTF-8.
+
+        Returns:
+            (str): The name of the detected character set.
+
+        """
+        if content_type:
+            try:
+                codecs.lookup(content_type)
+
+                return self._settle("content_type", content_type)
+            except LookupError:
+                log.warning(
+                    f"Unknown charset '{content_type}' in Content-Type header. Sniffing content instead."
+                )
+
+        if not content:
+            return self._settle("default", self.default_encoding)
+
+        for bom, charset in BOMS:
+            if content.startswith(bom):
+                return self._settle("bom", charset)
+
+        sample: bytes = content[: self.sample_size]
+
+        try:
+            ## final=False allows a multi-byte character to be cut off at the end of the sample
+            codecs.getincrementaldecoder("utf-8")(errors="strict").decode(
+                sample, final=final and len(sample) == len(content)
+            )
+
+            return self._settle("utf8", "utf-8")
+        except UnicodeDecodeError:
+            pass
+
+        key: str | None = self.endpoint_key(url)
+        cached: str | None = self._cache_get(key)
+        if cached:
+            return self._settle("cache", cached)
+
+        try:
+            _encoding: str | None = chardet.detect(byte_str=sample).get("encoding")
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception auto-detecting character set for input bytestring. Details: {exc}"
+            )
+            log.error(msg)
+
+            _encoding = None
+
+        if not _encoding:
+            log.warning(f"Could not detect charset. Defaulting to {self.default_encoding}")
+
+            return self._settle("default", self.default_encoding)
+
+        self._cache_set(key, _encoding)
+
+        return self._settle("chardet", _encoding)
+
+    def detect_response(self, res: httpx.Response = None) -> str:
+        """Detect the character set of an `httpx.Response`'s `.content`."""
+        assert isinstance(res, httpx.Response), TypeError(
+            f"res must be of type httpx.Response. Got type: ({type(res)})"
+        )
+
+        try:
+            url: httpx.URL | None = res.url
+        except RuntimeError:
+            ## Response was not created from a request
+            url = None
+
+        body: t.Any = res.extensions.get("spooled_body")
+        if body is not None:
+            ## A spooled (possibly memory-mapped) body; only page in the sample
+            return self.detect(
+                content=bytes(body.buffer[: self.sample_size]),
+                content_type=res.charset_encoding,
+                url=url,
+                final=body.size <= self.sample_size,
+            )
+
+        return self.detect(
+            content=res.content, content_type=res.charset_encoding, url=url
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return a count of how many charset decisions each tier settled."""
+        with self._lock:
+            _stats: dict[str, int] = dict(self._counters)
+            _stats["cache_entries"] = len(self._cache)
+
+        return _stats
+
+    def reset(self) -> None:
+        """Clear the memoized charsets and tier counters."""
+        with self._lock:
+            self._cache.clear()
+            self._counters = {tier: 0 for tier in DETECTION_TIERS}
+
+
+## Shared detector used by the HTTPX controllers
+CHARSET_DETECTOR: CharsetDetector = CharsetDetector()
+
+
+def get_charset_stats() -> dict[str, int]:
+    """Return the tier counters of the shared `CHARSET_DETECTOR`."""
+    return CHARSET_DETECTOR.stats()
@@ -2,4 +2,14 @@
 
 from __future__ import annotations
 
+from ._backends import (
+    JSON_BACKENDS,
+    JSON_SERIALIZER,
+    JSONSerializer,
+    available_json_backends,
+    json_default,
+)
 from ._encoders import DateTimeEncoder
+from ._offload import ProcessPoolDecoder
+from ._streaming import JSONRecordDecoder
+from ._typed import decode_json_as, get_typed_decoder
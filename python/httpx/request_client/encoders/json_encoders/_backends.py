@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from decimal import Decimal
+import json
+import typing as t
+from uuid import UUID
+
+from loguru import logger as log
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+## JSON backends, in the order they are preferred when `backend="auto"`
+JSON_BACKENDS: tuple[str, ...] = ("orjson", "msgspec", "stdlib")
+
+
+def available_json_backends() -> list[str]:
+    """Return the names of the JSON backends that can be used in this environment."""
+    installed: dict[str, bool] = {
+        "orjson": orjson is not None,
+        "msgspec": msgspec is not None,
+        "stdlib": True,
+    }
+
+    return [name for name in JSON_BACKENDS if installed[name]]
+
+
+def json_default(o: t.Any) -> t.Any:
+    """Serialize objects the JSON backends do not handle natively.
+
+    Description:
+        `datetime.datetime` (including `pendulum.DateTime`), `datetime.date` & `datetime.time` objects are
+        serialized as ISO-formatted strings, `Decimal` & `UUID` objects as strings, and sets/tuples as lists.
+        A UTC offset of zero is written as `Z` (i.e. `2024-01-02T03:04:05Z`), like `orjson` & `msgspec` do.
+    """
+    if isinstance(o, (datetime, time)):
+        iso: str = o.isoformat()
+
+        return f"{iso[:-6]}Z" if iso.endswith("+00:00") else iso
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, (Decimal, UUID)):
+        return str(o)
+    if isinstance(o, (set, frozenset, tuple)):
+        return list(o)
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class JSONSerializer:
+    """Serialize & parse JSON with the fastest available backend.
+
+    Description:
+        With `backend="auto"`, uses `orjson` if it is installed, then `msgspec`, then the stdlib `json` module.
+        All backends produce compact UTF-8 JSON, and serialize datetimes (including `pendulum.DateTime`) as
+        ISO-formatted strings with `Z` for UTC (see `json_default()`), so request bodies do not change when the
+        backend does.
+
+        `orjson` only supports 64-bit integers; values it cannot serialize are retried with the stdlib encoder.
+
+    Params:
+        backend (str): [Default: "auto"] One of "auto", "orjson", "msgspec" or "stdlib".
+        default (Callable[[Any], Any]): [Default: json_default] Function called for objects the backend cannot
+            serialize. Should return a serializable object, or raise `TypeError`.
+
+    Usage:
+
+    ``` py linenums=1
+    body: bytes = JSON_SERIALIZER.dumps({"created_at": pendulum.now()})
+    data: dict = JSON_SERIALIZER.loads(body)
+    ```
+    """
+
+    def __init__(
+        self,
+        backend: str = "auto",
+        default: t.Callable[[t.Any], t.Any] = json_default,
+    ) -> None:
+        assert backend == "auto" or backend in JSON_BACKENDS, ValueError(
+            f"Invalid JSON backend: '{backend}'. Must be one of: {('auto',) + JSON_BACKENDS}"
+        )
+
+        if backend == "auto":
+            backend = available_json_backends()[0]
+        elif backend not in available_json_backends():
+            log.warning(
+                f"JSON backend '{backend}' is not installed. Falling back to 'stdlib'."
+            )
+            backend = "stdlib"
+
+        self.backend: str = backend
+        self.default: t.Callable[[t.Any], t.Any] = default
+
+        if backend == "msgspec":
+            self._encoder = msgspec.json.Encoder(enc_hook=default)
+            self._decoder = msgspec.json.Decoder()
+
+    def _stdlib_dumps(self, obj: t.Any) -> bytes:
+        return json.dumps(
+            obj, default=self.default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def dumps(self, obj: t.Any = None) -> bytes:
+        """Serialize `obj` to UTF-8 encoded JSON bytes."""
+        if self.backend == "orjson":
+            try:
+                return orjson.dumps(
+                    obj,
+                    default=self.default,
+                    ## UTC as "Z", matching msgspec
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+                )
+            except orjson.JSONEncodeError:
+                ## i.e. integers larger than 64 bits
+                return self._stdlib_dumps(obj)
+
+        if self.backend == "msgspec":
+            return self._encoder.encode(obj)
+
+        return self._stdlib_dumps(obj)
+
+    def dumps_str(self, obj: t.Any = None) -> str:
+        """Serialize `obj` to a JSON string."""
+        return self.dumps(obj).decode("utf-8")
+
+    def loads(self, data: t.Union[bytes, bytearray, memoryview, str] = None) -> t.Any:
+        """Parse JSON from a string, or from UTF-8 encoded bytes."""
+        if self.backend == "orjson":
+            return orjson.loads(data)
+
+        if self.backend == "msgspec":
+            return self._decoder.decode(data)
+
+        if isinstance(data, memoryview):
+            ## json.loads() only accepts str, bytes & bytearray
+            data = bytes(data)
+
+        return json.loads(data)
+
+
+## Process-wide serializer, using the fastest installed backend
+JSON_SERIALIZER: JSONSerializer = JSONSerializer()
@@ -0,0 +1,126 @@
+"""Compare JSON backend throughput on representative API payloads.
+
+Run with `python -m request_client.encoders.json_encoders._benchmark`.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+import timeit
+import typing as t
+
+from ._backends import JSONSerializer, available_json_backends
+
+
+def sample_payloads(records: int = 1000, seed: int = 0) -> dict[str, t.Any]:
+    """Build payloads shaped like typical API traffic.
+
+    Returns:
+        (dict[str, Any]): Payloads by name: `small` (a single flat object, i.e. a request body), `records`
+            (a list of nested objects with datetimes, i.e. a page of results) & `numeric` (a list of floats).
+
+    """
+    rng: random.Random = random.Random(seed)
+    start: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def _record(i: int) -> dict[str, t.Any]:
+        return {
+            "id": i,
+            "uuid": f"{rng.getrandbits(128):032x}",
+            "name": f"user-{i}",
+            "email": f"user-{i}@example.com",
+            "active": rng.random() > 0.2,
+            "score": round(rng.uniform(0, 100), 3),
+            "tags": rng.sample(["a", "b", "c", "d", "e", "f"], k=3),
+            "created_at": start + timedelta(seconds=rng.randint(0, 10**7)),
+            "address": {
+                "street": f"{rng.randint(1, 9999)} Main St",
+                "city": rng.choice(["Springfield", "Zürich", "東京", "São Paulo"]),
+                "zip": f"{rng.randint(0, 99999):05d}",
+            },
+        }
+
+    return {
+        "small": _record(0),
+        "records": {"count": records, "results": [_record(i) for i in range(records)]},
+        "numeric": [rng.uniform(-1e6, 1e6) for _ in range(records * 10)],
+    }
+
+
+def benchmark_json_backends(
+    payloads: dict[str, t.Any] | None = None,
+    backends: list[str] | None = None,
+    number: int = 0,
+    repeat: int = 5,
+) -> list[dict[str, t.Any]]:
+    """Time `dumps()` & `loads()` for each backend & payload.
+
+    Params:
+        payloads (dict[str, Any]|None): [Default: sample_payloads()] Payloads to serialize, by name.
+        backends (list[str]|None): [Default: available_json_backends()] Backends to compare.
+        number (int): [Default: 0] Calls per timing. When `0`, calibrated so each timing takes ~0.2 seconds.
+        repeat (int): [Default: 5] Number of timings; the fastest is reported.
+
+    Returns:
+        (list[dict[str, Any]]): One row per backend/payload/operation, with `seconds` per call & `mb_per_sec`.
+
+    """
+    payloads = payloads if payloads is not None else sample_payloads()
+    backends = backends or available_json_backends()
+
+    rows: list[dict[str, t.Any]] = []
+
+    for name, payload in payloads.items():
+        for backend in backends:
+            serializer: JSONSerializer = JSONSerializer(backend=backend)
+            encoded: bytes = serializer.dumps(payload)
+
+            for operation, func in (
+                ("dumps", lambda: serializer.dumps(payload)),
+                ("loads", lambda: serializer.loads(encoded)),
+            ):
+                timer: timeit.Timer = timeit.Timer(func)
+                calls: int = number or timer.autorange()[0]
+                seconds: float = min(timer.repeat(repeat=repeat, number=calls)) / calls
+
+                rows.append(
+                    {
+                        "payload": name,
+                        "backend": backend,
+                        "operation": operation,
+                        "bytes": len(encoded),
+                        "seconds": seconds,
+                        "mb_per_sec": len(encoded) / seconds / 1024 / 1024,
+                    }
+                )
+
+    return rows
+
+
+def main() -> None:
+    rows: list[dict[str, t.Any]] = benchmark_json_backends()
+
+    print(f"{'payload':<10} {'operation':<10} {'backend':<10} {'us/call':>12} {'MiB/s':>10} {'vs stdlib':>10}")
+
+    for row in rows:
+        baseline: dict[str, t.Any] | None = next(
+            (
+                r
+                for r in rows
+                if r["backend"] == "stdlib"
+                and r["payload"] == row["payload"]
+                and r["operation"] == row["operation"]
+            ),
+            None,
+        )
+        speedup: str = f"{baseline['seconds'] / row['seconds']:.1f}x" if baseline else "-"
+
+        print(
+            f"{row['payload']:<10} {row['operation']:<10} {row['backend']:<10} "
+            f"{row['seconds'] * 1e6:>12.1f} {row['mb_per_sec']:>10.1f} {speedup:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
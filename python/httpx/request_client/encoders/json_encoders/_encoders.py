@@ -8,7 +8,12 @@ import pendulum
 
 
 class DateTimeEncoder(json.JSONEncoder):
-    """Handle encoding a `datetime.datetime` or `pendulum.DateTime` as an ISO-formatted string."""
+    """Handle encoding a `datetime.datetime` or `pendulum.DateTime` as an ISO-formatted string.
+
+    Description:
+        For use with the stdlib `json` module, i.e. `json.dumps(data, cls=DateTimeEncoder)`. `JSON_SERIALIZER`
+        serializes datetimes natively, and is faster when `orjson` or `msgspec` is installed.
+    """
 
     def default(self, o) -> str | json.Any:
         if isinstance(o, datetime):
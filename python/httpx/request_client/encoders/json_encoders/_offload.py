@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+import mmap
+from multiprocessing import resource_tracker, shared_memory
+import os
+from pathlib import Path
+import pickle
+import threading
+import typing as t
+
+from loguru import logger as log
+
+from ._backends import JSON_SERIALIZER
+from ._typed import get_typed_decoder
+
+T = t.TypeVar("T")
+
+## A worker's result: ("value", result), or ("chunks", [pickled slices of a list result])
+WorkerResult = tuple[str, t.Any]
+
+
+def _pack_result(result: t.Any = None, chunk_size: int = 0) -> WorkerResult:
+    """Pickle a list result in slices of `chunk_size` records, so the parent can unpickle it piece by piece."""
+    if not chunk_size or not isinstance(result, list) or len(result) <= chunk_size:
+        return ("value", result)
+
+    return (
+        "chunks",
+        [
+            pickle.dumps(result[i : i + chunk_size], protocol=pickle.HIGHEST_PROTOCOL)
+            for i in range(0, len(result), chunk_size)
+        ],
+    )
+
+
+def _decode_in_worker(
+    source: str = None,
+    name: str = None,
+    size: int = 0,
+    type_: t.Any = None,
+    chunk_size: int = 0,
+) -> WorkerResult:
+    """Parse a body in a pool worker, straight from shared memory or a spooled file's mapping.
+
+    Params:
+        source (str): "shm" when `name` is a `SharedMemory` block, "file" when it is a spooled body's path.
+        name (str): Name of the shared memory block, or path to the file.
+        size (int): Size of the body, in bytes.
+        type_ (Any|None): Type to decode into. When `None`, the body is parsed into Python objects.
+        chunk_size (int): Records per pickled slice of a list result (see `_pack_result()`).
+    """
+    decode: t.Callable[[t.Any], t.Any] = (
+        JSON_SERIALIZER.loads if type_ is None else get_typed_decoder(type_)
+    )
+
+    if source == "shm":
+        ## Attaching registers the block with the parent's resource tracker, which the parent unregisters
+        #  when it unlinks it
+        shm: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+        buffer: memoryview = shm.buf[:size]
+        try:
+            return _pack_result(result=decode(buffer), chunk_size=chunk_size)
+        finally:
+            buffer.release()
+            shm.close()
+
+    with open(name, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as _mmap:
+        buffer = memoryview(_mmap)[:size]
+        try:
+            return _pack_result(result=decode(buffer), chunk_size=chunk_size)
+        finally:
+            buffer.release()
+
+
+class ProcessPoolDecoder:
+    """Parse large JSON bodies in a pool of worker processes, so parsing does not hold this process's GIL.
+
+    Description:
+        Bodies of at least `threshold` bytes are copied once into a `multiprocessing.shared_memory` block (bodies
+        spilled to disk by `spool_response()` are memory-mapped by the worker instead, without a copy), and parsed
+        by a worker process. Only the parsed result is pickled back. Smaller bodies are cheaper to parse in place;
+        check `should_offload()` first.
+
+        Unpickling the result still takes this process's GIL. List results (i.e. a page of records) are returned
+        in slices of `result_chunk_size` records, unpickled one at a time, so other threads (and, with
+        `adecode()`, the event loop) run between slices instead of stalling until the whole result is rebuilt.
+        Offloading trades total decode time for responsiveness; it pays off most when parsing/validation is
+        expensive relative to the size of the result, i.e. pydantic validation.
+
+        `type_` (see `decode_json_as()`) must be importable by the workers, i.e. defined at module level.
+
+        The pool is started on first use. Pass an instance to a controller's `decode_pool` param to offload
+        `decode_res_content()` & `decode_as()` (and the async controller's `adecode_res_content()` &
+        `adecode_as()`, which await the worker without blocking the event loop).
+
+    Params:
+        threshold (int): [Default: 8MiB] Minimum body size (in bytes) to offload.
+        max_workers (int|None): [Default: None] Number of worker processes. Defaults to the number of CPUs.
+        mp_context (Any|None): [Default: None] A `multiprocessing` context, i.e. `multiprocessing.get_context("spawn")`.
+        result_chunk_size (int): [Default: 10000] Records per slice of a list result. `0` returns results whole.
+
+    Usage:
+
+    ``` py linenums=1
+    with ProcessPoolDecoder(threshold=16 * 1024 * 1024) as pool:
+        with HTTPXController(decode_pool=pool, spool_threshold=64 * 1024 * 1024) as ctl:
+            res = ctl.send_request(request=req)
+            records = ctl.decode_as(res=res, model=list[Record])
+    ```
+    """
+
+    def __init__(
+        self,
+        threshold: int = 8 * 1024 * 1024,
+        max_workers: int | None = None,
+        mp_context: t.Any | None = None,
+        result_chunk_size: int = 10_000,
+    ) -> None:
+        assert isinstance(threshold, int) and threshold > 0, ValueError(
+            f"threshold must be a positive integer. Got: ({threshold})"
+        )
+
+        self.threshold: int = threshold
+        self.max_workers: int | None = max_workers
+        self.mp_context: t.Any | None = mp_context
+        self.result_chunk_size: int = result_chunk_size
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The worker pool, started on first use."""
+        with self._lock:
+            if self._executor is None:
+                ## Forked workers must share this process's resource tracker, or each one starts its own &
+                #  "cleans up" (unlinks) blocks it attached to when it exits
+                resource_tracker.ensure_running()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=self.mp_context
+                )
+
+            return self._executor
+
+    def should_offload(self, size: int = 0) -> bool:
+        """Return `True` if a body of `size` bytes should be parsed in the pool."""
+        return size >= self.threshold
+
+    def submit(
+        self,
+        data: t.Union[bytes, memoryview] = None,
+        type_: t.Any = None,
+        path: t.Union[str, Path] | None = None,
+    ) -> Future:
+        """Send a body to a worker, and return a `Future` for its (packed) result. See `decode()` & `adecode()`.
+
+        Params:
+            data (bytes|memoryview): UTF-8 encoded JSON. Copied into a shared memory block, which is unlinked when
+                the worker is done.
+            type_ (Any|None): [Default: None] Type to decode into. When `None`, the body is parsed into Python objects.
+            path (str|Path|None): [Default: None] Path to a file holding the body (i.e. `SpooledBody.path`). When set,
+                the worker maps the file, and `data` is only used for its size.
+        """
+        size: int = len(data)
+
+        if path is not None:
+            return self.executor.submit(
+                _decode_in_worker,
+                source="file",
+                name=os.fspath(path),
+                size=size,
+                type_=type_,
+                chunk_size=self.result_chunk_size,
+            )
+
+        shm: shared_memory.SharedMemory = shared_memory.SharedMemory(
+            create=True, size=max(size, 1)
+        )
+        try:
+            shm.buf[:size] = data
+
+            future: Future = self.executor.submit(
+                _decode_in_worker,
+                source="shm",
+                name=shm.name,
+                size=size,
+                type_=type_,
+                chunk_size=self.result_chunk_size,
+            )
+        except Exception:
+            shm.close()
+            shm.unlink()
+
+            raise
+
+        def _release(_: Future) -> None:
+            shm.close()
+            shm.unlink()
+
+        future.add_done_callback(_release)
+
+        return future
+
+    def decode(
+        self,
+        data: t.Union[bytes, memoryview] = None,
+        type_: type[T] | None = None,
+        path: t.Union[str, Path] | None = None,
+    ) -> T:
+        """Parse a body in a worker, blocking the calling thread (but not the GIL) until it is done."""
+        try:
+            kind, result = self.submit(data=data, type_=type_, path=path).result()
+            if kind == "value":
+                return result
+
+            records: list = []
+            for chunk in result:
+                ## Each slice is unpickled in a separate call, so other threads can take the GIL in between
+                records.extend(pickle.loads(chunk))
+
+            return records
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception decoding {len(data)} byte body in a worker process. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise msg
+
+    async def adecode(
+        self,
+        data: t.Union[bytes, memoryview] = None,
+        type_: type[T] | None = None,
+        path: t.Union[str, Path] | None = None,
+    ) -> T:
+        """Parse a body in a worker, without blocking the event loop."""
+        try:
+            kind, result = await asyncio.wrap_future(
+                self.submit(data=data, type_=type_, path=path)
+            )
+            if kind == "value":
+                return result
+
+            records: list = []
+            for chunk in result:
+                records.extend(pickle.loads(chunk))
+                ## Let the event loop run between slices
+                await asyncio.sleep(0)
+
+            return records
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception decoding {len(data)} byte body in a worker process. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise msg
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import typing as t
+
+import httpx
+
+from ..charsets import CHARSET_DETECTOR, CharsetDetector
+
+## JSON insignificant whitespace
+WHITESPACE: re.Pattern = re.compile(r"[ \t\n\r]*")
+## First characters of a JSON value that may be cut off mid-token at the end of a chunk (numbers)
+NUMBER_START: str = "-0123456789"
+## Characters that continue a number after `raw_decode()` stops, when the rest of the number is in the next chunk
+NUMBER_CONTINUE: str = ".eE+-"
+
+
+class JSONRecordDecoder:
+    """Incrementally decode JSON records from chunks of a response body.
+
+    Description:
+        Accepts chunks of bytes (or `str`) with `feed()`, and returns each complete record as soon as it has
+        been received. Only the partial record at the end of the last chunk is buffered, so memory use does not
+        grow with the size of the body.
+
+        Two layouts are supported, detected from the first non-whitespace character:
+
+        - A top-level JSON array (`[{...}, {...}]`): each element of the array is returned as a record.
+        - NDJSON/JSON lines, or any whitespace-separated stream of JSON values: each value is a record.
+
+        When `encoding` is `None`, the charset is detected from the first chunk with the shared
+        `CHARSET_DETECTOR`.
+
+    Params:
+        encoding (str|None): Character set of the incoming bytes, i.e. from the `Content-Type` header.
+        url (httpx.URL|None): URL the body was requested from, used by charset detection.
+        detector (CharsetDetector): [Default: CHARSET_DETECTOR] Detector used when `encoding` is `None`.
+
+    """
+
+    def __init__(
+        self,
+        encoding: str | None = None,
+        url: httpx.URL | None = None,
+        detector: CharsetDetector = CHARSET_DETECTOR,
+    ) -> None:
+        self.encoding: str | None = encoding
+        self.url: httpx.URL | None = url
+        self.detector: CharsetDetector = detector
+
+        self._text_decoder: codecs.IncrementalDecoder | None = None
+        self._json_decoder: json.JSONDecoder = json.JSONDecoder()
+        self._buffer: str = ""
+        ## Buffer length to wait for before re-attempting an incomplete record
+        self._min_length: int = 0
+        ## "array" | "values", set from the first non-whitespace character
+        self._layout: str | None = None
+        ## Inside a top-level array: True when the next token must be ',' or ']'
+        self._expect_separator: bool = False
+        self._closed: bool = False
+
+    def _decode_text(
+        self, chunk: t.Union[bytes, memoryview, str], final: bool = False
+    ) -> str:
+        if isinstance(chunk, str):
+            return chunk
+
+        if self._text_decoder is None:
+            if not self.encoding:
+                self.encoding = self.detector.detect(
+                    content=bytes(chunk), url=self.url, final=final
+                )
+
+            self._text_decoder = codecs.getincrementaldecoder(self.encoding)(
+                errors="strict"
+            )
+
+        return self._text_decoder.decode(chunk, final=final)
+
+    def _drain(self, final: bool = False) -> list[t.Any]:
+        records: list[t.Any] = []
+
+        if not final and len(self._buffer) < self._min_length:
+            return records
+
+        self._min_length = 0
+        buf: str = self._buffer
+        pos: int = 0
+
+        while True:
+            pos = WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf):
+                break
+
+            if self._closed:
+                raise ValueError(
+                    f"Unexpected data after end of top-level JSON array: {buf[pos:pos + 20]!r}"
+                )
+
+            if self._layout is None:
+                if buf[pos] == "[":
+                    self._layout = "array"
+                    pos += 1
+
+                    continue
+                else:
+                    self._layout = "values"
+
+            if self._layout == "array":
+                if buf[pos] == "]":
+                    self._closed = True
+                    pos += 1
+
+                    continue
+
+                if self._expect_separator:
+                    if buf[pos] != ",":
+                        raise ValueError(
+                            f"Expected ',' or ']' in JSON array, got: {buf[pos:pos + 20]!r}"
+                        )
+
+                    self._expect_separator = False
+                    pos += 1
+
+                    continue
+
+            try:
+                record, end = self._json_decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+
+                ## Wait until the unparsed tail has doubled before trying again, so a record spread over
+                #  many chunks is re-scanned O(log n) times instead of once per chunk.
+                self._min_length = 2 * (len(buf) - pos)
+
+                break
+
+            if (
+                not final
+                and buf[pos] in NUMBER_START
+                and not buf[end:].strip(NUMBER_CONTINUE)
+            ):
+                ## A number at the end of the buffer may continue in the next chunk, including when it was
+                #  cut off after a '.', 'e' or sign (`raw_decode()` stops before those)
+                self._min_length = len(buf) - pos + 1
+
+                break
+
+            records.append(record)
+            pos = end
+
+            if self._layout == "array":
+                self._expect_separator = True
+
+        ## Drop consumed records; `_min_length` is relative to the remaining tail
+        self._buffer = buf[pos:]
+
+        return records
+
+    def feed(self, chunk: t.Union[bytes, memoryview, str] = None) -> list[t.Any]:
+        """Add a chunk of the body, and return any records it completed."""
+        if not chunk:
+            return []
+
+        self._buffer += self._decode_text(chunk)
+
+        return self._drain()
+
+    def close(self) -> list[t.Any]:
+        """Flush the remaining buffer, and return any records it completed.
+
+        Raises:
+            (json.JSONDecodeError|ValueError): When the body ends in the middle of a record, or a top-level
+                array is never closed.
+        """
+        if self._text_decoder is not None:
+            self._buffer += self._text_decoder.decode(b"", final=True)
+
+        records: list[t.Any] = self._drain(final=True)
+
+        if self._layout == "array" and not self._closed:
+            raise ValueError("Response body ended before the top-level JSON array was closed")
+
+        return records
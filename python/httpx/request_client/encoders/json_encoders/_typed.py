@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import functools
+import typing as t
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import pydantic
+except ImportError:
+    pydantic = None
+
+T = t.TypeVar("T")
+
+## A compiled decoder: parses UTF-8 JSON bytes directly into an instance of its type
+TypedDecoder = t.Callable[[t.Union[bytes, memoryview, str]], t.Any]
+
+
+def _contains(type_: t.Any, base: type) -> bool:
+    """Return `True` if `type_` is, or is parameterized with (i.e. `list[Model]`), a subclass of `base`."""
+    if isinstance(type_, type) and issubclass(type_, base):
+        return True
+
+    return any(_contains(arg, base) for arg in t.get_args(type_))
+
+
+@functools.lru_cache(maxsize=256)
+def get_typed_decoder(type_: t.Any = None) -> TypedDecoder:
+    """Compile (once per type) a decoder that parses JSON bytes straight into `type_`.
+
+    Description:
+        - msgspec `Struct` types (or containers of them, i.e. `list[MyStruct]`) use a `msgspec.json.Decoder`.
+        - pydantic models (or containers of them) use a `pydantic.TypeAdapter`'s `validate_json()`.
+        - Any other type (dataclasses, `TypedDict`, builtins) uses msgspec if it is installed, otherwise pydantic.
+
+        Decoders are cached, so the schema is only compiled the first time a type is decoded.
+
+    Params:
+        type_ (Any): The type to decode into, i.e. `MyModel` or `list[MyModel]`.
+
+    Returns:
+        (TypedDecoder): A function accepting JSON `bytes` (or `str`) and returning an instance of `type_`.
+
+    """
+    assert type_ is not None, ValueError("Missing a type to decode into")
+
+    use_msgspec: bool = msgspec is not None and _contains(type_, msgspec.Struct)
+    use_pydantic: bool = pydantic is not None and _contains(type_, pydantic.BaseModel)
+
+    if use_msgspec or (not use_pydantic and msgspec is not None):
+        return msgspec.json.Decoder(type_).decode
+
+    if pydantic is not None:
+        validate_json: TypedDecoder = pydantic.TypeAdapter(type_).validate_json
+
+        def _decode(data: t.Union[bytes, memoryview, str]) -> t.Any:
+            ## pydantic only accepts str, bytes & bytearray
+            return validate_json(bytes(data) if isinstance(data, memoryview) else data)
+
+        return _decode
+
+    raise ImportError(
+        "Decoding into a type requires msgspec or pydantic. Install one with: pip install msgspec"
+    )
+
+
+def decode_json_as(
+    data: t.Union[bytes, memoryview, str] = None, type_: type[T] = None
+) -> T:
+    """Parse & validate JSON `data` directly into `type_`, without building an intermediate `dict`.
+
+    Params:
+        data (bytes|memoryview|str): UTF-8 encoded JSON bytes, or a JSON string.
+        type_ (type): The type to decode into, i.e. a msgspec `Struct`, pydantic model or `list[...]` of either.
+
+    Returns:
+        (T): An instance of `type_`.
+
+    """
+    return get_typed_decoder(type_)(data)
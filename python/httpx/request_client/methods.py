@@ -2,27 +2,275 @@
 
 from __future__ import annotations
 
-import json
+from dataclasses import dataclass, field
+import mmap
+import os
 from pathlib import Path
+import re
+import tempfile
+import time
 import typing as t
+import weakref
+import zlib
 
 import httpx
 from loguru import logger as log
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
-def save_bytes(
-    _bytes: bytes = None,
-    output_dir: t.Union[str, Path] = None,
-    output_filename: str = None,
-) -> bool:
-    """Save bytestring to a file.
+from .encoders.json_encoders import JSON_SERIALIZER, JSONSerializer
+
+
+@dataclass
+class DownloadResult:
+    """Summary of a completed streaming download, returned by `save_stream()`.
 
     Params:
-        _bytes (bytes): A bytestring to save to a file.
-        output_dir (str|Path): Directory where bytes file will be saved.
-        output_filename (str): Name of the file to be saved at `output_dir/`output_filename`.
+        path (Path): Path the file was saved to.
+        bytes_written (int): Total number of bytes written to the file.
+        elapsed (float): Seconds spent downloading, including resumes.
+        resumes (int): Number of times the download was resumed with an HTTP Range request.
+
+    """
+
+    path: Path
+    bytes_written: int = field(default=0)
+    elapsed: float = field(default=0.0)
+    resumes: int = field(default=0)
+
+    @property
+    def bytes_per_sec(self) -> float:
+        """Average download throughput, in bytes/second."""
+        if not self.elapsed:
+            return 0.0
+
+        return self.bytes_written / self.elapsed
+
+
+class SpooledBody:
+    """A response body, held in memory or spilled to a temporary file & memory-mapped.
+
+    Description:
+        Returned by `spool_response()`. Bodies larger than the spool threshold are written to a temporary file
+        while they are downloaded, and exposed through a read-only `mmap`, so the body is paged in by the OS on
+        demand instead of being held in the process's heap.
+
+        `buffer` returns a `memoryview` of the body (zero-copy for both in-memory & spilled bodies). Call
+        `close()` (or use the body as a context manager) to unmap & delete the temporary file; this also happens
+        when the body is garbage collected.
+
+    Params:
+        data (bytes): [Default: b""] The body, when it is held in memory.
+        path (Path|None): [Default: None] Path to the temporary file holding a spilled body.
+
+    """
+
+    def __init__(self, data: bytes = b"", path: Path | None = None) -> None:
+        self.path: Path | None = path
+        self._data: bytes = data
+        self._file: t.BinaryIO | None = None
+        self._mmap: mmap.mmap | None = None
+
+        if path is not None:
+            self._file = open(path, "rb")
+            if os.fstat(self._file.fileno()).st_size:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._finalizer: weakref.finalize = weakref.finalize(
+            self, SpooledBody._cleanup, self._mmap, self._file, path
+        )
+
+    @staticmethod
+    def _cleanup(
+        _mmap: mmap.mmap | None, _file: t.BinaryIO | None, path: Path | None
+    ) -> None:
+        if _mmap is not None:
+            try:
+                _mmap.close()
+            except BufferError:
+                ## A memoryview of the buffer is still alive; the mapping is released with it
+                pass
+        if _file is not None:
+            _file.close()
+        if path is not None:
+            Path(path).unlink(missing_ok=True)
+
+    @property
+    def spilled(self) -> bool:
+        """`True` when the body was spilled to a temporary file."""
+        return self.path is not None
+
+    @property
+    def size(self) -> int:
+        """Size of the body, in bytes."""
+        if self._mmap is not None:
+            return len(self._mmap)
+
+        return len(self._data)
+
+    @property
+    def buffer(self) -> memoryview:
+        """A read-only, zero-copy view of the body."""
+        return memoryview(self._mmap if self._mmap is not None else self._data)
+
+    def read(self) -> bytes:
+        """Return a copy of the body as `bytes`."""
+        return bytes(self.buffer)
+
+    def save_to(self, path: t.Union[str, Path] = None) -> Path:
+        """Write the body to `path`, straight from the mapped/in-memory buffer."""
+        path = Path(path)
+
+        with open(path, "wb") as f:
+            f.write(self.buffer)
+
+        return path
+
+    def close(self) -> None:
+        """Unmap the body & delete its temporary file."""
+        self._finalizer()
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def spooled_body(res: httpx.Response = None) -> SpooledBody | None:
+    """Return the `SpooledBody` attached to a response by `spool_response()`, if any."""
+    return res.extensions.get("spooled_body")
+
+
+class _BodySpooler:
+    """Accumulate a response body in memory, switching to a temporary file once it exceeds `threshold` bytes."""
+
+    def __init__(self, threshold: int = 0, spool_dir: t.Union[str, Path] | None = None) -> None:
+        assert isinstance(threshold, int) and threshold >= 0, ValueError(
+            f"threshold must be a non-negative integer. Got: ({threshold})"
+        )
+
+        self.threshold: int = threshold
+        self.spool_dir: t.Union[str, Path] | None = spool_dir
+        self._buffer: bytearray = bytearray()
+        self._tmp: t.Any = None
+
+    def feed(self, chunk: bytes = None) -> None:
+        if self._tmp is not None:
+            self._tmp.write(chunk)
+            return
+
+        self._buffer += chunk
+        if len(self._buffer) > self.threshold:
+            self._tmp = tempfile.NamedTemporaryFile(
+                dir=self.spool_dir, prefix="httpx-spool-", suffix=".body", delete=False
+            )
+            self._tmp.write(self._buffer)
+            self._buffer = bytearray()
+
+    def finish(self, res: httpx.Response = None) -> SpooledBody:
+        if self._tmp is not None:
+            self._tmp.close()
+            body: SpooledBody = SpooledBody(path=Path(self._tmp.name))
+
+            log.debug(f"Spilled {body.size} byte response body to '{body.path}'")
+        else:
+            body = SpooledBody(data=bytes(self._buffer))
+            ## Same as httpx.Response.read(), so `.content`/`.json()` work for small bodies
+            res._content = body._data
+
+        res.extensions["spooled_body"] = body
+
+        return body
+
+    def abort(self, res: httpx.Response = None, exc: Exception = None) -> Exception:
+        if self._tmp is not None:
+            self._tmp.close()
+            Path(self._tmp.name).unlink(missing_ok=True)
+
+        msg = Exception(
+            f"Unhandled exception spooling response body from URL {res.request.url}. Details: {exc}"
+        )
+        log.error(msg)
+
+        return msg
+
+
+def spool_response(
+    res: httpx.Response = None,
+    threshold: int = 64 * 1024 * 1024,
+    spool_dir: t.Union[str, Path] | None = None,
+    chunk_size: int = 1024 * 1024,
+) -> SpooledBody:
+    """Read a streaming response's body, spilling it to a temporary file when it is larger than `threshold`.
+
+    Description:
+        The body is read in chunks of `chunk_size`. Once more than `threshold` bytes have been read, the buffered
+        bytes & all following chunks are written to a temporary file in `spool_dir`, so memory use is bounded by
+        `threshold` whatever the size of the response.
+
+        The returned `SpooledBody` is also attached to the response (see `spooled_body()`). Bodies that fit under
+        the threshold are also set as the response's `.content`; spilled bodies are not, and reading
+        `res.content` raises `httpx.ResponseNotRead`.
+
+    Params:
+        res (httpx.Response): A response sent with `stream=True`, whose body has not been read. It is closed once
+            its body is read.
+        threshold (int): [Default: 64MiB] Bodies larger than this many bytes are spilled to disk.
+        spool_dir (str|Path|None): [Default: None] Directory for temporary files. Defaults to the system's temp
+            directory.
+        chunk_size (int): [Default: 1MiB] Size of the chunks read from the response.
+
+    Returns:
+        (SpooledBody): The response body.
 
     """
+    assert isinstance(res, httpx.Response), TypeError(
+        f"res must be of type httpx.Response. Got type: ({type(res)})"
+    )
+    spooler: _BodySpooler = _BodySpooler(threshold=threshold, spool_dir=spool_dir)
+
+    try:
+        for chunk in res.iter_bytes(chunk_size=chunk_size):
+            spooler.feed(chunk)
+    except Exception as exc:
+        raise spooler.abort(res=res, exc=exc)
+    finally:
+        res.close()
+
+    return spooler.finish(res=res)
+
+
+async def aspool_response(
+    res: httpx.Response = None,
+    threshold: int = 64 * 1024 * 1024,
+    spool_dir: t.Union[str, Path] | None = None,
+    chunk_size: int = 1024 * 1024,
+) -> SpooledBody:
+    """Async counterpart to `spool_response()`, for responses from an `httpx.AsyncClient`."""
+    assert isinstance(res, httpx.Response), TypeError(
+        f"res must be of type httpx.Response. Got type: ({type(res)})"
+    )
+    spooler: _BodySpooler = _BodySpooler(threshold=threshold, spool_dir=spool_dir)
+
+    try:
+        async for chunk in res.aiter_bytes(chunk_size=chunk_size):
+            spooler.feed(chunk)
+    except Exception as exc:
+        raise spooler.abort(res=res, exc=exc)
+    finally:
+        await res.aclose()
+
+    return spooler.finish(res=res)
+
+
+def _prepare_output_path(
+    output_dir: t.Union[str, Path] = None, output_filename: str = None
+) -> Path:
+    """Validate an output directory & filename, create the directory if needed, and return the file's path."""
     assert output_dir, ValueError("Missing output directory path")
     assert isinstance(output_dir, str) or isinstance(output_dir, Path), TypeError(
         f"output_dir must be a str or Path. Got type: ({type(output_dir)})"
@@ -42,11 +290,6 @@ def save_bytes(
         f"output_filename must be a string. Got type: ({type(output_filename)})"
     )
 
-    assert _bytes, ValueError("Missing bytestring to save.")
-    assert isinstance(_bytes, bytes), TypeError(
-        f"_bytes must be of type bytes. Got type: ({type(_bytes)})"
-    )
-
     ## Concatenate output_dir and output_filename into a Path object
     output_path: Path = Path(f"{output_dir}/{output_filename}")
     if not output_path.parent.exists():
@@ -64,6 +307,34 @@ def save_bytes(
 
             raise msg
 
+    return output_path
+
+
+def save_bytes(
+    _bytes: t.Union[bytes, memoryview, SpooledBody] = None,
+    output_dir: t.Union[str, Path] = None,
+    output_filename: str = None,
+) -> bool:
+    """Save bytestring to a file.
+
+    Params:
+        _bytes (bytes|memoryview|SpooledBody): A bytestring to save to a file. A `SpooledBody` is written
+            straight from its (memory-mapped) buffer.
+        output_dir (str|Path): Directory where bytes file will be saved.
+        output_filename (str): Name of the file to be saved at `output_dir/`output_filename`.
+
+    """
+    assert isinstance(_bytes, (bytes, memoryview, SpooledBody)), TypeError(
+        f"_bytes must be of type bytes, memoryview or SpooledBody. Got type: ({type(_bytes)})"
+    )
+    if isinstance(_bytes, SpooledBody):
+        _bytes = _bytes.buffer
+    assert len(_bytes), ValueError("Missing bytestring to save.")
+
+    output_path: Path = _prepare_output_path(
+        output_dir=output_dir, output_filename=output_filename
+    )
+
     ## Save img bytes
     try:
         with open(output_path, "wb") as f:
@@ -83,12 +354,370 @@ def save_bytes(
         return False
 
 
+## `Content-Range` header of a 206 response: `bytes <first>-<last>/<size>`
+CONTENT_RANGE: re.Pattern = re.compile(r"\s*bytes\s+(\d+)-\d+/(?:\d+|\*)", re.IGNORECASE)
+
+
+def _content_range_start(res: httpx.Response) -> int | None:
+    """Return the first byte position of a response's `Content-Range`, or `None` when missing/invalid."""
+    match: re.Match | None = CONTENT_RANGE.match(res.headers.get("Content-Range", ""))
+
+    return int(match.group(1)) if match else None
+
+
+def _range_request(
+    request: httpx.Request, offset: int, validator: str | None = None
+) -> httpx.Request:
+    """Copy a GET request, asking the server for the bytes from `offset` onwards."""
+    headers: httpx.Headers = httpx.Headers(request.headers)
+    headers["Range"] = f"bytes={offset}-"
+    if validator:
+        ## Only honor the range if the resource has not changed since the first response
+        headers["If-Range"] = validator
+
+    return httpx.Request(
+        method=request.method,
+        url=request.url,
+        headers=headers,
+        extensions=request.extensions,
+    )
+
+
+def save_stream(
+    res: httpx.Response = None,
+    output_dir: t.Union[str, Path] = None,
+    output_filename: str = None,
+    client: httpx.Client | None = None,
+    buffer_size: int = 1024 * 1024,
+    max_resumes: int = 3,
+) -> DownloadResult:
+    """Stream a response body to a file, without holding the whole body in memory.
+
+    Description:
+        Chunks of `buffer_size` bytes are written to a temporary file next to the destination, which is renamed
+        to `output_dir/output_filename` (atomically) once the body has been fully received. A partially written
+        file is never left at the destination path.
+
+        When a `client` is passed and the connection drops mid-download, the download is resumed from the last
+        byte written with an HTTP `Range` request (up to `max_resumes` times, including resume requests that
+        fail to connect). An `If-Range` header with the response's `ETag`/`Last-Modified` is sent, so if the
+        resource changed the download restarts from byte 0. The download also restarts from byte 0 when the
+        server ignores the range, or returns a partial response that does not start at the requested byte.
+
+    Params:
+        res (httpx.Response): A streamed `httpx.Response`, i.e. from `send_request(stream=True)`.
+        output_dir (str|Path): Directory where the file will be saved.
+        output_filename (str): Name of the file to be saved at `output_dir/output_filename`.
+        client (httpx.Client|None): Client used to send `Range` requests when resuming. When `None`, a dropped
+            connection raises instead of resuming.
+        buffer_size (int): [Default: 1MiB] Size (in bytes) of chunks read from the stream & the file write buffer.
+        max_resumes (int): [Default: 3] Maximum number of times to resume a dropped download.
+
+    Returns:
+        (DownloadResult): The saved file's path, bytes written, elapsed time & throughput.
+
+    """
+    assert res, ValueError("Missing httpx Response object")
+    assert isinstance(res, httpx.Response), TypeError(
+        f"res must be of type httpx.Response. Got type: ({type(res)})"
+    )
+    assert isinstance(buffer_size, int) and buffer_size > 0, ValueError(
+        f"buffer_size must be a positive integer. Got: ({buffer_size})"
+    )
+    res.raise_for_status()
+
+    output_path: Path = _prepare_output_path(
+        output_dir=output_dir, output_filename=output_filename
+    )
+
+    body: SpooledBody | None = spooled_body(res)
+    if body is not None:
+        ## Body was already read by `spool_response()`; write it from its buffer
+        start: float = time.perf_counter()
+        try:
+            body.save_to(output_path)
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception saving spooled response to path '{output_path}'. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise msg
+
+        return DownloadResult(
+            path=output_path,
+            bytes_written=body.size,
+            elapsed=time.perf_counter() - start,
+        )
+
+    validator: str | None = res.headers.get("ETag") or res.headers.get(
+        "Last-Modified"
+    )
+    request: httpx.Request = res.request
+
+    result: DownloadResult = DownloadResult(path=output_path)
+    start: float = time.perf_counter()
+
+    tmp_fd, tmp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".part"
+    )
+    tmp_path: Path = Path(tmp_name)
+
+    try:
+        with os.fdopen(tmp_fd, "wb", buffering=buffer_size) as f:
+            while True:
+                try:
+                    if res is None:
+                        ## Resume from the last byte written, or start over when nothing was written
+                        res = client.send(
+                            request=(
+                                _range_request(
+                                    request=request,
+                                    offset=result.bytes_written,
+                                    validator=validator,
+                                )
+                                if result.bytes_written
+                                else request
+                            ),
+                            stream=True,
+                        )
+                        res.raise_for_status()
+
+                        resumed_at: int | None = (
+                            _content_range_start(res) if res.status_code == 206 else 0
+                        )
+                        if resumed_at != result.bytes_written:
+                            ## Server ignored the Range request, the resource changed, or the partial response
+                            #  does not start at the requested byte. Start over.
+                            log.warning(
+                                f"Server did not resume at byte {result.bytes_written} (status: {res.status_code}, "
+                                f"Content-Range: {res.headers.get('Content-Range')}). Restarting download."
+                            )
+                            expected_at: int = result.bytes_written
+                            f.seek(0)
+                            f.truncate()
+                            result.bytes_written = 0
+
+                            if res.status_code == 206:
+                                ## Unusable partial body; retried as a request for the full body
+                                raise httpx.RemoteProtocolError(
+                                    f"Partial response starts at byte {resumed_at}, expected {expected_at}",
+                                    request=res.request,
+                                )
+
+                        if res.status_code != 206:
+                            ## A full response; later resumes must match this version of the resource
+                            validator = res.headers.get("ETag") or res.headers.get(
+                                "Last-Modified"
+                            )
+
+                    for chunk in res.iter_bytes(chunk_size=buffer_size):
+                        f.write(chunk)
+                        result.bytes_written += len(chunk)
+
+                    break
+
+                except httpx.TransportError as exc:
+                    if res is not None:
+                        res.close()
+                        res = None
+
+                    if client is None or result.resumes >= max_resumes:
+                        raise
+
+                    result.resumes += 1
+                    log.warning(
+                        f"[Resume {result.resumes}/{max_resumes}] Download interrupted after {result.bytes_written} "
+                        f"bytes downloading {request.url}. Details: {exc}"
+                    )
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, output_path)
+
+    except Exception as exc:
+        msg = Exception(
+            f"Unhandled exception streaming response to path '{output_path}'. Details: {exc}"
+        )
+        log.error(msg)
+
+        tmp_path.unlink(missing_ok=True)
+
+        raise msg
+
+    finally:
+        if res is not None:
+            res.close()
+
+    result.elapsed = time.perf_counter() - start
+    log.success(
+        f"Saved {result.bytes_written} bytes to path '{output_path}' ({result.bytes_per_sec / 1024 / 1024:.2f} MiB/s)"
+    )
+
+    return result
+
+
+## Streaming request body formats, and their Content-Type
+BODY_FORMATS: dict[str, str] = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+## Content-Encodings supported for streaming request bodies
+BODY_COMPRESSIONS: tuple[str, ...] = ("gzip", "zstd")
+
+
+def _frame_records(
+    records: t.Iterable[t.Any],
+    body_format: str,
+    serializer: JSONSerializer,
+    chunk_size: int,
+) -> t.Iterator[bytes]:
+    """Serialize records one at a time, yielding body chunks of roughly `chunk_size` bytes."""
+    buffer: bytearray = bytearray(b"[" if body_format == "json" else b"")
+    separator: bytes = b"," if body_format == "json" else b""
+    first: bool = True
+
+    for record in records:
+        if not first:
+            buffer += separator
+        first = False
+
+        buffer += serializer.dumps(record)
+        if body_format == "ndjson":
+            buffer += b"\n"
+
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if body_format == "json":
+        buffer += b"]"
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def _compressor(compression: str, level: int | None) -> t.Any:
+    """Return an object with `compress()` & `flush()` methods for a Content-Encoding."""
+    if compression == "gzip":
+        ## wbits=31 writes a gzip header & trailer
+        return zlib.compressobj(level if level is not None else 6, zlib.DEFLATED, 31)
+
+    if zstandard is None:
+        raise ImportError(
+            "zstd compression requires the zstandard package. Install it with: pip install zstandard"
+        )
+
+    return zstandard.ZstdCompressor(level=level if level is not None else 3).compressobj()
+
+
+def iter_json_body(
+    records: t.Iterable[t.Any] = None,
+    body_format: str = "json",
+    compression: str | None = None,
+    compression_level: int | None = None,
+    serializer: JSONSerializer = JSON_SERIALIZER,
+    chunk_size: int = 64 * 1024,
+) -> t.Iterator[bytes]:
+    """Stream records as a JSON array or NDJSON request body, optionally compressed on the fly.
+
+    Description:
+        Records are pulled from `records` (i.e. a generator) & serialized one at a time, so memory use is bounded
+        by `chunk_size` (plus the compressor's window), no matter how many records are sent.
+
+    Params:
+        records (Iterable[Any]): The records to send.
+        body_format (str): [Default: "json"] "json" to send a JSON array, or "ndjson" to send one record per line.
+        compression (str|None): [Default: None] Compress the body with "gzip" or "zstd".
+        compression_level (int|None): [Default: None] Compression level. Defaults to 6 (gzip) or 3 (zstd).
+        serializer (JSONSerializer): [Default: JSON_SERIALIZER] Serializer used for each record.
+        chunk_size (int): [Default: 65536] Approximate size (in bytes, before compression) of yielded chunks.
+
+    Returns:
+        (Iterator[bytes]): The request body, in chunks.
+
+    """
+    chunks: t.Iterator[bytes] = _frame_records(
+        records=records,
+        body_format=body_format,
+        serializer=serializer,
+        chunk_size=chunk_size,
+    )
+
+    if compression is None:
+        yield from chunks
+
+        return
+
+    compressor: t.Any = _compressor(compression=compression, level=compression_level)
+
+    for chunk in chunks:
+        compressed: bytes = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+async def aiter_json_body(
+    records: t.AsyncIterable[t.Any] = None,
+    body_format: str = "json",
+    compression: str | None = None,
+    compression_level: int | None = None,
+    serializer: JSONSerializer = JSON_SERIALIZER,
+    chunk_size: int = 64 * 1024,
+) -> t.AsyncIterator[bytes]:
+    """Async version of `iter_json_body()`, for records from an async iterable (sent with an `httpx.AsyncClient`)."""
+    compressor: t.Any = (
+        _compressor(compression=compression, level=compression_level)
+        if compression is not None
+        else None
+    )
+    buffer: bytearray = bytearray(b"[" if body_format == "json" else b"")
+    first: bool = True
+
+    def _drain() -> bytes:
+        chunk: bytes = bytes(buffer)
+        buffer.clear()
+
+        return compressor.compress(chunk) if compressor is not None else chunk
+
+    async for record in records:
+        if not first and body_format == "json":
+            buffer += b","
+        first = False
+
+        buffer += serializer.dumps(record)
+        if body_format == "ndjson":
+            buffer += b"\n"
+
+        if len(buffer) >= chunk_size:
+            chunk = _drain()
+            if chunk:
+                yield chunk
+
+    if body_format == "json":
+        buffer += b"]"
+
+    chunk = _drain()
+    if compressor is not None:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
+
+
 def build_request(
     method: str = "GET",
     url: str = None,
     headers: dict | None = {"Content-Type": "application/json"},
     params: dict | None = None,
     data: t.Union[dict, str] | None = None,
+    serializer: JSONSerializer = JSON_SERIALIZER,
+    records: t.Union[t.Iterable[t.Any], t.AsyncIterable[t.Any]] | None = None,
+    body_format: str = "json",
+    compression: str | None = None,
+    compression_level: int | None = None,
 ) -> httpx.Request:
     """Assemble an httpx.Request instance from inputs.
 
@@ -97,7 +726,14 @@ def build_request(
         url (str): The URL to request.
         headers (dict|None): Optional request headers dict.
         params (dict|None): Optional request params dict.
-        data (dict|str|None): Optional request data.
+        data (dict|str|None): Optional request data. A `dict` is serialized to JSON with `serializer`.
+        serializer (JSONSerializer): [Default: JSON_SERIALIZER] Serializer used for `dict` request data.
+        records (Iterable|AsyncIterable|None): Stream these records as the request body instead of `data`.
+            Records are serialized one at a time as they are sent (see `iter_json_body()`), with chunked
+            transfer encoding. A streamed body can only be sent once, so the request is not retried.
+        body_format (str): [Default: "json"] Streamed body format, "json" (an array) or "ndjson".
+        compression (str|None): [Default: None] Compress the streamed body with "gzip" or "zstd".
+        compression_level (int|None): [Default: None] Compression level for the streamed body.
 
     Returns:
         (httpx.Request): An initialized `httpx.Request` object.
@@ -122,18 +758,44 @@ def build_request(
         assert isinstance(params, dict), TypeError(
             f"params should be a dict. Got type: ({type(params)})"
         )
-    if data:
+    if records is not None:
+        assert not data, ValueError("Pass either data or records, not both")
+        assert body_format in BODY_FORMATS, ValueError(
+            f"Invalid body_format: '{body_format}'. Must be one of: {list(BODY_FORMATS)}"
+        )
+        assert compression is None or compression in BODY_COMPRESSIONS, ValueError(
+            f"Invalid compression: '{compression}'. Must be one of: {BODY_COMPRESSIONS}"
+        )
+
+        body_func: t.Callable = (
+            aiter_json_body if hasattr(records, "__aiter__") else iter_json_body
+        )
+        data = body_func(
+            records=records,
+            body_format=body_format,
+            compression=compression,
+            compression_level=compression_level,
+            serializer=serializer,
+        )
+
+        ## Copy, so the default headers dict is never modified
+        headers = {**(headers or {}), "Content-Type": BODY_FORMATS[body_format]}
+        if compression is not None:
+            headers["Content-Encoding"] = compression
+
+    elif data:
         assert isinstance(data, dict) or isinstance(data, str), TypeError(
             f"data should be a Python dict or JSON string. Got type: ({type(data)})"
         )
 
         if isinstance(data, dict):
-            _data: str = json.dumps(data)
+            _data: bytes = serializer.dumps(data)
             data = _data
 
     try:
+        ## Send serialized JSON as the raw body (httpx form-encodes dicts passed as `data`)
         req: httpx.Request = httpx.Request(
-            method=method, url=url, headers=headers, params=params, data=data
+            method=method, url=url, headers=headers, params=params, content=data
         )
 
         return req
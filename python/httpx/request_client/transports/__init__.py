@@ -2,4 +2,6 @@
 
 from __future__ import annotations
 
-from ._transports import get_cache_transport
+from ._refresh import HISHEL_VERSION, RefreshingCacheTransport
+from ._storages import MemoryLRUStorage, SQLiteCacheStorage
+from ._transports import CACHE_BACKENDS, get_cache_storage, get_cache_transport
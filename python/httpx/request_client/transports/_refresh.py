@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import re
+import threading
+import typing as t
+
+import hishel
+import httpcore
+import httpx
+from loguru import logger as log
+
+from ._storages import update_stored_headers
+
+## The hishel release `RefreshingCacheTransport` is written against. hishel's `CacheTransport` has no hooks for
+#  serving stale responses or updating entries in place, so `handle_request()` is re-implemented on top of hishel
+#  internals: the private `hishel._controller`/`_headers`/`_utils` helpers, and private attributes of
+#  `CacheTransport` & `Controller` (the storages in `_storages.py` also use `hishel._serializers.Metadata`).
+#  Those change between releases without notice (hishel is pre-1.0), so the transport is only enabled with this
+#  exact version; `get_cache_transport()` falls back to `hishel.CacheTransport` with any other. Re-check
+#  `handle_request()` against hishel's before bumping the pin.
+HISHEL_VERSION: str = "0.0.33"
+
+try:
+    from hishel._controller import (
+        allowed_stale,
+        get_age,
+        get_freshness_lifetime,
+        get_heuristic_freshness,
+    )
+    from hishel._headers import parse_cache_control
+    from hishel._utils import extract_header_values_decoded
+except ImportError:
+    ## Another hishel release, without these internals. RefreshingCacheTransport is disabled.
+    pass
+
+## Response status codes that fall back to a stale response when `stale_if_error` allows it
+STALE_IF_ERROR_STATUS_CODES: tuple[int, ...] = (500, 502, 503, 504)
+
+_STALE_DIRECTIVE: re.Pattern = re.compile(
+    r"(stale-while-revalidate|stale-if-error)\s*=\s*\"?(\d+)", re.IGNORECASE
+)
+
+
+def hishel_supported() -> bool:
+    """Return `True` if the installed hishel is the release `RefreshingCacheTransport` is written against."""
+    return getattr(hishel, "__version__", None) == HISHEL_VERSION
+
+
+def request_cache_control(request: httpcore.Request = None) -> t.Any:
+    """Parse a request's Cache-Control header."""
+    return parse_cache_control(
+        extract_header_values_decoded(request.headers, b"Cache-Control")
+    )
+
+
+def stale_directives(response: httpcore.Response = None) -> dict[str, int]:
+    """Parse the `stale-while-revalidate` & `stale-if-error` Cache-Control directives (RFC 5861) of a response."""
+    directives: dict[str, int] = {}
+
+    for value in extract_header_values_decoded(response.headers, b"Cache-Control"):
+        for name, seconds in _STALE_DIRECTIVE.findall(value):
+            directives[name.lower()] = int(seconds)
+
+    return directives
+
+
+class RefreshingCacheTransport(hishel.CacheTransport):
+    """A `hishel.CacheTransport` that revalidates cheaply, & serves stale responses while refreshing them.
+
+    Description:
+        Stale responses with an `ETag` or `Last-Modified` validator are revalidated with a conditional request
+        (`If-None-Match`/`If-Modified-Since`). On a `304 Not Modified`, the stored response's headers & metadata
+        are updated in place (restarting its storage ttl), without re-downloading or rewriting its body.
+        `stats()` counts revalidations, `304` responses & the body bytes they saved.
+
+        Also implements the `stale-while-revalidate` & `stale-if-error` behaviors from RFC 5861:
+
+        - When a cached response has been stale for less than its stale-while-revalidate window, it is returned
+            immediately (with `response.extensions["stale"] = True`), and a conditional request refreshes the
+            cache entry in a background thread. At most one refresh per cache key runs at a time, and at most
+            `max_refreshes` refreshes run concurrently; stale hits beyond that bound do not schedule another refresh.
+        - When a cached response is past its stale-while-revalidate window, the request waits for revalidation as
+            usual. If that fails with a transport error or a 5xx response, and the response has been stale for less
+            than its stale-if-error window, the stale response is returned instead.
+
+        The windows come from the response's `Cache-Control: stale-while-revalidate=N, stale-if-error=N`
+        directives. The `stale_while_revalidate` & `stale_if_error` params are used for responses without them.
+        Responses with `no-cache` or `must-revalidate` are never served stale, and neither are responses the
+        storage has already deleted: a storage `ttl` shorter than `max-age` plus the stale window cuts the window
+        short.
+
+        Built on hishel internals, so it requires the exact hishel release pinned in `HISHEL_VERSION`.
+
+    Params:
+        transport (httpx.BaseTransport): The transport requests are sent with.
+        storage (hishel.BaseStorage|None): The cache storage.
+        controller (hishel.Controller|None): The hishel cache controller.
+        stale_while_revalidate (int): [Default: 0] Seconds a stale response may be served while it is refreshed.
+        stale_if_error (int): [Default: 0] Seconds a stale response may be served when revalidation fails.
+        max_refreshes (int): [Default: 4] Maximum number of concurrent background refreshes.
+
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport = None,
+        storage: hishel.BaseStorage | None = None,
+        controller: hishel.Controller | None = None,
+        stale_while_revalidate: int = 0,
+        stale_if_error: int = 0,
+        max_refreshes: int = 4,
+    ) -> None:
+        assert hishel_supported(), RuntimeError(
+            f"RefreshingCacheTransport requires hishel=={HISHEL_VERSION}. Installed: ({getattr(hishel, '__version__', None)})"
+        )
+        assert isinstance(max_refreshes, int) and max_refreshes > 0, ValueError(
+            f"max_refreshes must be a positive integer. Got: ({max_refreshes})"
+        )
+        super().__init__(transport=transport, storage=storage, controller=controller)
+
+        self.stale_while_revalidate: int = stale_while_revalidate
+        self.stale_if_error: int = stale_if_error
+        self.max_refreshes: int = max_refreshes
+
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_refreshes, thread_name_prefix="hishel-refresh"
+        )
+        self._refreshing: set[str] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+        self.revalidations: int = 0
+        self.not_modified: int = 0
+        self.modified: int = 0
+        self.bytes_saved: int = 0
+        self.stale_served: int = 0
+        self.stale_if_error_served: int = 0
+        self.refreshes: int = 0
+        self.refreshes_skipped: int = 0
+        self.refresh_errors: int = 0
+
+    def _httpcore_request(self, request: httpx.Request) -> httpcore.Request:
+        """Build the httpcore request hishel uses for cache keys & controller decisions."""
+        return httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=b"",
+            extensions=request.extensions,
+        )
+
+    def _staleness(self, response: httpcore.Response) -> float | None:
+        """Return how many seconds a response has been stale for, or `None` if it cannot be served stale."""
+        if not allowed_stale(response=response):
+            return None
+
+        freshness_lifetime: int | None = get_freshness_lifetime(response)
+        if freshness_lifetime is None:
+            if not self._controller._allow_heuristics:
+                return None
+            freshness_lifetime = get_heuristic_freshness(
+                response=response, clock=self._controller._clock
+            )
+
+        return get_age(response, self._controller._clock) - freshness_lifetime
+
+    def _serve_stale(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: hishel.Metadata,
+    ) -> httpx.Response:
+        res: httpx.Response = self._create_hishel_response(
+            key=key,
+            response=response,
+            request=request,
+            cached=True,
+            revalidated=False,
+            metadata=metadata,
+        )
+        res.extensions["stale"] = True
+
+        return res
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        request: httpx.Request,
+        conditional_request: httpcore.Request,
+        stored_response: httpcore.Response,
+        metadata: hishel.Metadata,
+    ) -> None:
+        with self._lock:
+            if key in self._refreshing or len(self._refreshing) >= self.max_refreshes:
+                self.refreshes_skipped += 1
+
+                return
+
+            self._refreshing.add(key)
+            self.refreshes += 1
+
+        try:
+            self._executor.submit(
+                self._refresh, key, request, conditional_request, stored_response, metadata
+            )
+        except RuntimeError:
+            ## The transport was closed
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _revalidate(
+        self,
+        key: str,
+        request: httpx.Request,
+        conditional_request: httpcore.Request,
+        stored_response: httpcore.Response,
+        metadata: hishel.Metadata,
+        extensions: dict[str, t.Any],
+    ) -> tuple[httpcore.Response, bool]:
+        """Send a conditional request for a stored response, & update the cache with the result.
+
+        Returns:
+            (tuple[httpcore.Response, bool]): The response to use, & `True` if the server answered `304 Not
+                Modified` (the stored body was reused).
+
+        """
+        revalidation_request: httpx.Request = httpx.Request(
+            method=request.method,
+            url=request.url,
+            headers=conditional_request.headers,
+            extensions=extensions,
+        )
+        revalidation_response: httpx.Response = self._transport.handle_request(
+            revalidation_request
+        )
+        try:
+            content: bytes = revalidation_response.read()
+        finally:
+            revalidation_response.close()
+
+        new_response: httpcore.Response = httpcore.Response(
+            status=revalidation_response.status_code,
+            headers=revalidation_response.headers.raw,
+            content=content,
+            extensions=revalidation_response.extensions,
+        )
+        httpcore_request: httpcore.Request = self._httpcore_request(request)
+
+        if new_response.status == 304:
+            ## Copy the stored response, so a response already returned to a caller is not modified
+            old_response: httpcore.Response = httpcore.Response(
+                status=stored_response.status,
+                headers=list(stored_response.headers),
+                content=stored_response.content,
+                extensions=dict(stored_response.extensions),
+            )
+            final_response: httpcore.Response = self._controller.handle_validation_response(
+                old_response=old_response, new_response=new_response
+            )
+            final_response.read()
+
+            update_stored_headers(
+                storage=self._storage,
+                key=key,
+                response=final_response,
+                request=httpcore_request,
+                metadata=metadata,
+            )
+
+            with self._lock:
+                self.revalidations += 1
+                self.not_modified += 1
+                self.bytes_saved += len(final_response.content)
+
+            return final_response, True
+
+        new_response.read()
+
+        if self._controller.is_cachable(request=httpcore_request, response=new_response):
+            self._storage.store(key, response=new_response, request=httpcore_request)
+
+        with self._lock:
+            self.revalidations += 1
+            self.modified += 1
+
+        return new_response, False
+
+    def _refresh(
+        self,
+        key: str,
+        request: httpx.Request,
+        conditional_request: httpcore.Request,
+        stored_response: httpcore.Response,
+        metadata: hishel.Metadata,
+    ) -> None:
+        """Revalidate a stale cache entry in the background."""
+        try:
+            self._revalidate(
+                key=key,
+                request=request,
+                conditional_request=conditional_request,
+                stored_response=stored_response,
+                metadata=metadata,
+                ## Caller-specific extensions (i.e. trace callbacks) are not carried into the background request
+                extensions={
+                    name: value
+                    for name, value in request.extensions.items()
+                    if name in ("timeout", "sni_hostname")
+                },
+            )
+
+        except Exception as exc:
+            with self._lock:
+                self.refresh_errors += 1
+
+            log.warning(
+                f"({type(exc).__name__}) refreshing cached response for URL {request.url}. Details: {exc}"
+            )
+
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in ("GET", "HEAD") or request.extensions.get(
+            "cache_disabled", False
+        ):
+            return super().handle_request(request)
+
+        httpcore_request: httpcore.Request = self._httpcore_request(request)
+        key: str = self._controller._key_generator(httpcore_request, b"")
+        stored_data: tuple | None = self._storage.retrieve(key)
+
+        if not stored_data:
+            return super().handle_request(request)
+
+        stored_response, stored_request, metadata = stored_data
+        stored_response.read()
+
+        res: t.Union[httpcore.Response, httpcore.Request, None] = (
+            self._controller.construct_response_from_cache(
+                request=httpcore_request,
+                response=stored_response,
+                original_request=stored_request,
+            )
+        )
+
+        if isinstance(res, httpcore.Response):
+            return self._create_hishel_response(
+                key=key,
+                response=res,
+                request=httpcore_request,
+                cached=True,
+                revalidated=False,
+                metadata=metadata,
+            )
+
+        if res is None or request_cache_control(httpcore_request).only_if_cached:
+            ## The stored response cannot be used (i.e. Vary mismatch), or the caller asked not to revalidate
+            return super().handle_request(request)
+
+        ## Only serve stale responses when the caller did not ask for a revalidated response
+        staleness: float | None = (
+            None
+            if self._controller._always_revalidate
+            or request_cache_control(httpcore_request).no_cache
+            else self._staleness(stored_response)
+        )
+        directives: dict[str, int] = stale_directives(response=stored_response)
+
+        ## Ages are whole seconds, so a response is stale for `staleness` in [0, window): a window of 0 is disabled
+        if staleness is not None and 0 <= staleness < directives.get(
+            "stale-while-revalidate", self.stale_while_revalidate
+        ):
+            with self._lock:
+                self.stale_served += 1
+
+            self._schedule_refresh(
+                key=key,
+                request=request,
+                conditional_request=res,
+                stored_response=stored_response,
+                metadata=metadata,
+            )
+
+            return self._serve_stale(
+                key=key, response=stored_response, request=httpcore_request, metadata=metadata
+            )
+
+        stale_if_error: bool = staleness is not None and 0 <= staleness < directives.get(
+            "stale-if-error", self.stale_if_error
+        )
+
+        try:
+            response, not_modified = self._revalidate(
+                key=key,
+                request=request,
+                conditional_request=res,
+                stored_response=stored_response,
+                metadata=metadata,
+                extensions=request.extensions,
+            )
+
+        except httpx.TransportError as exc:
+            ## hishel's allow_stale only covers connection errors
+            if not (
+                stale_if_error
+                or (
+                    isinstance(exc, httpx.ConnectError)
+                    and self._controller._allow_stale
+                    and allowed_stale(response=stored_response)
+                )
+            ):
+                raise
+
+            log.warning(
+                f"({type(exc).__name__}) revalidating cached response for URL {request.url}. Serving stale response."
+            )
+
+        else:
+            if not (stale_if_error and response.status in STALE_IF_ERROR_STATUS_CODES):
+                return self._create_hishel_response(
+                    key=key,
+                    response=response,
+                    request=httpcore_request,
+                    cached=not_modified,
+                    revalidated=True,
+                    metadata=metadata,
+                )
+
+        with self._lock:
+            self.stale_if_error_served += 1
+
+        return self._serve_stale(
+            key=key, response=stored_response, request=httpcore_request, metadata=metadata
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return revalidation counters, & counts of stale responses served & background refreshes."""
+        with self._lock:
+            return {
+                "revalidations": self.revalidations,
+                "not_modified": self.not_modified,
+                "modified": self.modified,
+                "bytes_saved": self.bytes_saved,
+                "stale_served": self.stale_served,
+                "stale_if_error_served": self.stale_if_error_served,
+                "refreshes": self.refreshes,
+                "refreshes_skipped": self.refreshes_skipped,
+                "refreshes_in_flight": len(self._refreshing),
+                "refresh_errors": self.refresh_errors,
+            }
+
+    def close(self) -> None:
+        ## Let running refreshes finish before the storage is closed
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+        super().close()
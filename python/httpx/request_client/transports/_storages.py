@@ -0,0 +1,632 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import datetime
+from pathlib import Path
+import sqlite3
+import threading
+import time
+import typing as t
+
+import hishel
+from hishel import clone_model
+import httpcore
+from loguru import logger as log
+
+try:
+    from hishel._serializers import Metadata
+except ImportError:
+    ## Other hishel releases (see HISHEL_VERSION in _refresh.py); stored metadata is a plain dict
+    Metadata = dict
+
+## (response, request, metadata) tuple returned by hishel storages
+StoredResponse = tuple[httpcore.Response, httpcore.Request, Metadata]
+
+
+def _entry_size(response: httpcore.Response, request: httpcore.Request) -> int:
+    """Approximate the memory used by a cached response (body + headers)."""
+    size: int = len(response.content)
+
+    for key, value in response.headers:
+        size += len(key) + len(value)
+    for key, value in request.headers:
+        size += len(key) + len(value)
+
+    return size
+
+
+def update_stored_headers(
+    storage: hishel.BaseStorage = None,
+    key: str = None,
+    response: httpcore.Response = None,
+    request: httpcore.Request = None,
+    metadata: Metadata = None,
+) -> None:
+    """Replace a stored response's headers & metadata after a `304 Not Modified`, restarting its ttl.
+
+    Description:
+        Storages with an `update_headers()` method (`MemoryLRUStorage`, `SQLiteCacheStorage`) update the entry
+        without rewriting its body. Other hishel storages re-store the whole response.
+    """
+    if hasattr(storage, "update_headers"):
+        storage.update_headers(key=key, response=response, request=request, metadata=metadata)
+    else:
+        storage.store(key, response=response, request=request, metadata=metadata)
+
+
+class MemoryLRUStorage(hishel.BaseStorage):
+    """An in-process LRU cache tier, in front of another hishel storage.
+
+    Description:
+        Hot responses are served from memory, without opening/reading/deserializing a file. Misses fall back to
+        the `backend` storage (i.e. `hishel.FileStorage`), and responses found there are promoted into memory.
+        New responses are written to both tiers.
+
+        The memory tier is bounded by both `max_entries` and `max_bytes` (approximate size of bodies + headers).
+        The least recently used entries are evicted first. Responses larger than `max_bytes` are only stored in
+        the backend.
+
+        Cache hits update a response's metadata (`number_of_uses`) in memory only, so a hot entry is not
+        re-written to the backend on every hit. Each hit returns its own copy of the stored response & metadata,
+        because hishel mutates them (`extensions`, `number_of_uses`) when serving a hit.
+
+    Params:
+        backend (hishel.BaseStorage|None): Storage to fall back to on a memory miss. When `None`, only the memory
+            tier is used.
+        max_entries (int): [Default: 1024] Maximum number of responses held in memory.
+        max_bytes (int): [Default: 64MiB] Maximum approximate size of responses held in memory.
+        ttl (int|float|None): [Default: None] Seconds a response may be served from memory after it was stored.
+            Expired entries are dropped, so they cannot be served stale (see `RefreshingCacheTransport`); set it
+            longer than `max-age` plus the stale windows.
+
+    """
+
+    def __init__(
+        self,
+        backend: hishel.BaseStorage | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: t.Union[int, float] | None = None,
+    ) -> None:
+        super().__init__(ttl=ttl)
+
+        assert isinstance(max_entries, int) and max_entries > 0, ValueError(
+            f"max_entries must be a positive integer. Got: ({max_entries})"
+        )
+        assert isinstance(max_bytes, int) and max_bytes > 0, ValueError(
+            f"max_bytes must be a positive integer. Got: ({max_bytes})"
+        )
+        if backend is not None:
+            assert isinstance(backend, hishel.BaseStorage), TypeError(
+                f"backend must be a hishel storage. Got type: ({type(backend)})"
+            )
+
+        self.backend: hishel.BaseStorage | None = backend
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+
+        ## key -> (stored response, size, monotonic time stored)
+        self._entries: OrderedDict[str, tuple[StoredResponse, int, float]] = (
+            OrderedDict()
+        )
+        self._bytes: int = 0
+        self._lock: threading.RLock = threading.RLock()
+
+        self.hits: int = 0
+        self.backend_hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def _expired(self, stored_at: float) -> bool:
+        return self._ttl is not None and time.monotonic() - stored_at > self._ttl
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _put(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata,
+    ) -> None:
+        size: int = _entry_size(response=response, request=request)
+
+        with self._lock:
+            self._pop(key)
+
+            if size > self.max_bytes:
+                log.debug(
+                    f"Response for cache key '{key}' ({size} bytes) is larger than the memory tier. Skipping."
+                )
+                return
+
+            stored_response: httpcore.Response = clone_model(response)
+            ## Read, so hits can be copied from it
+            stored_response.read()
+            self._entries[key] = (
+                (stored_response, clone_model(request), metadata),
+                size,
+                time.monotonic(),
+            )
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def store(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata | None = None,
+    ) -> None:
+        """Store a response in memory and in the backend storage."""
+        metadata = metadata or Metadata(
+            cache_key=key,
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+            number_of_uses=0,
+        )
+
+        self._put(key=key, response=response, request=request, metadata=metadata)
+
+        if self.backend is not None:
+            self.backend.store(key, response=response, request=request, metadata=metadata)
+
+    def retrieve(self, key: str) -> StoredResponse | None:
+        """Retrieve a response from memory, falling back to the backend storage."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                stored, _, stored_at = entry
+
+                if not self._expired(stored_at):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+
+                    response, request, metadata = stored
+
+                    ## A copy per hit, so concurrent readers do not see each other's changes
+                    return clone_model(response), clone_model(request), dict(metadata)
+
+                self._pop(key)
+
+        if self.backend is not None:
+            stored: StoredResponse | None = self.backend.retrieve(key)
+
+            if stored is not None:
+                with self._lock:
+                    self.backend_hits += 1
+
+                response, request, metadata = stored
+                ## Read the body so its size is known & it can be served again from memory
+                response.read()
+                self._put(key=key, response=response, request=request, metadata=metadata)
+
+                return stored
+
+        with self._lock:
+            self.misses += 1
+
+        return None
+
+    def update_metadata(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata,
+    ) -> None:
+        """Update a stored response's metadata.
+
+        Description:
+            Entries held in memory are updated in memory only. Entries that are not in memory are updated in the
+            backend storage.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                (stored_response, stored_request, _), size, stored_at = entry
+                self._entries[key] = (
+                    (stored_response, stored_request, metadata),
+                    size,
+                    stored_at,
+                )
+
+                return
+
+        if self.backend is not None:
+            self.backend.update_metadata(
+                key=key, response=response, request=request, metadata=metadata
+            )
+
+    def update_headers(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata,
+    ) -> None:
+        """Replace a stored response's headers & metadata (i.e. after a 304), restarting its ttl."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                (stored_response, stored_request, _), size, _ = entry
+                ## Replace the stored response, instead of changing one a reader may be copying
+                stored_response = httpcore.Response(
+                    status=stored_response.status,
+                    headers=list(response.headers),
+                    content=stored_response.content,
+                    extensions=dict(stored_response.extensions),
+                )
+                stored_response.read()
+                self._entries[key] = (
+                    (stored_response, stored_request, metadata),
+                    size,
+                    time.monotonic(),
+                )
+                self._entries.move_to_end(key)
+
+        if self.backend is not None:
+            update_stored_headers(
+                storage=self.backend,
+                key=key,
+                response=response,
+                request=request,
+                metadata=metadata,
+            )
+
+    def remove(self, key: t.Union[str, httpcore.Response]) -> None:
+        """Remove a response from memory and from the backend storage."""
+        if isinstance(key, httpcore.Response):
+            key = t.cast(str, key.extensions["cache_metadata"]["cache_key"])
+
+        with self._lock:
+            self._pop(key)
+
+        if self.backend is not None:
+            self.backend.remove(key)
+
+    def close(self) -> None:
+        """Clear the memory tier and close the backend storage."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+        if self.backend is not None:
+            self.backend.close()
+
+    def stats(self) -> dict[str, t.Union[int, float]]:
+        """Return hit/miss/eviction counters and the current size of the memory tier."""
+        with self._lock:
+            lookups: int = self.hits + self.backend_hits + self.misses
+
+            return {
+                "hits": self.hits,
+                "backend_hits": self.backend_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class SQLiteCacheStorage(hishel.BaseStorage):
+    """A hishel storage keeping all cached responses in a single SQLite database.
+
+    Description:
+        Avoids creating one file per cached response (which exhausts inodes, and makes TTL cleanup a full
+        directory walk). The database is opened in WAL mode, so readers do not block the writer.
+
+        Entries are indexed by key (primary key), expiry & last access time, so lookups, expiry and eviction
+        are index seeks instead of table scans:
+
+        - Expired entries are deleted in a single `DELETE ... WHERE expires_at <= ?` statement, at most once
+            every `check_ttl_every` seconds.
+        - When `max_bytes` is set, the least recently used entries are deleted after a `store()` until the
+            total size of stored responses is back under budget.
+
+        Response bodies are stored in their own column, so `update_metadata()` (called on every cache hit) and
+        `update_headers()` (called after a `304 Not Modified`) only rewrite the small serialized headers/metadata.
+
+    Params:
+        path (str|Path): [Default: .cache/hishel/cache.sqlite] Path to the SQLite database file.
+        serializer (hishel.BaseSerializer|None): [Default: hishel.PickleSerializer] Serializer for stored responses.
+        ttl (int|float|None): [Default: None] Seconds a response may be served after it was stored.
+        max_bytes (int|None): [Default: None] Byte budget for stored responses. When `None`, entries are only
+            removed when they expire.
+        check_ttl_every (int|float): [Default: 60] Minimum seconds between bulk expiry statements.
+
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, Path] = ".cache/hishel/cache.sqlite",
+        serializer: hishel.BaseSerializer | None = None,
+        ttl: t.Union[int, float] | None = None,
+        max_bytes: int | None = None,
+        check_ttl_every: t.Union[int, float] = 60,
+    ) -> None:
+        super().__init__(serializer=serializer or hishel.PickleSerializer(), ttl=ttl)
+
+        if max_bytes is not None:
+            assert isinstance(max_bytes, int) and max_bytes > 0, ValueError(
+                f"max_bytes must be a positive integer. Got: ({max_bytes})"
+            )
+
+        self.path: Path = Path(path).expanduser()
+        self.max_bytes: int | None = max_bytes
+        self.check_ttl_every: t.Union[int, float] = check_ttl_every
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._last_cleaned: float = 0.0
+        self._connection: sqlite3.Connection = self._connect()
+        ## Running total of stored bytes, so eviction only runs when over budget
+        self._bytes: int = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()[0]
+
+        self.evictions: int = 0
+        self.expired: int = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            connection: sqlite3.Connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at
+                    ON cache_entries (expires_at) WHERE expires_at IS NOT NULL;
+                CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at
+                    ON cache_entries (accessed_at);
+                """
+            )
+            return connection
+
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception opening SQLite cache database '{self.path}'. Details: {exc}"
+            )
+            log.error(msg)
+
+            raise msg
+
+    def _dumps(
+        self,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata,
+    ) -> tuple[bytes, bytes]:
+        """Serialize a response's headers, request & metadata, returning them with the response body."""
+        head: httpcore.Response = httpcore.Response(
+            status=response.status,
+            headers=response.headers,
+            content=b"",
+            extensions=response.extensions,
+        )
+        head.read()
+        data: t.Union[str, bytes] = self._serializer.dumps(
+            response=head, request=request, metadata=metadata
+        )
+
+        return (data.encode("utf-8") if isinstance(data, str) else data), response.content
+
+    def _loads(self, data: bytes, body: bytes) -> StoredResponse:
+        if not self._serializer.is_binary:
+            data = data.decode("utf-8")
+
+        response, request, metadata = self._serializer.loads(data)
+        response = httpcore.Response(
+            status=response.status,
+            headers=response.headers,
+            content=body,
+            extensions=response.extensions,
+        )
+
+        return response, request, metadata
+
+    def _remove_expired(self) -> None:
+        if self._ttl is None:
+            return
+
+        now: float = time.time()
+        if now - self._last_cleaned < self.check_ttl_every:
+            return
+
+        with self._lock:
+            self._last_cleaned = now
+            removed: list[tuple[int]] = self._connection.execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ? RETURNING size", (now,)
+            ).fetchall()
+            self._bytes -= sum(row[0] for row in removed)
+            self.expired += len(removed)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the stored size is under `max_bytes`."""
+        if self.max_bytes is None or self._bytes <= self.max_bytes:
+            return
+
+        with self._lock:
+            while self._bytes > self.max_bytes:
+                rows: list[tuple[str, int]] = self._connection.execute(
+                    "SELECT key, size FROM cache_entries ORDER BY accessed_at LIMIT 64"
+                ).fetchall()
+                if not rows:
+                    self._bytes = 0
+                    break
+
+                victims: list[str] = []
+                for key, size in rows:
+                    victims.append(key)
+                    self._bytes -= size
+
+                    if self._bytes <= self.max_bytes:
+                        break
+
+                self._connection.executemany(
+                    "DELETE FROM cache_entries WHERE key = ?",
+                    [(key,) for key in victims],
+                )
+                self.evictions += len(victims)
+
+    def store(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata | None = None,
+    ) -> None:
+        """Store (or replace) a response in the database."""
+        metadata = metadata or Metadata(
+            cache_key=key,
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+            number_of_uses=0,
+        )
+        data, body = self._dumps(response=response, request=request, metadata=metadata)
+        size: int = len(data) + len(body)
+        now: float = time.time()
+        expires_at: float | None = now + self._ttl if self._ttl is not None else None
+
+        with self._lock:
+            previous = self._connection.execute(
+                "SELECT size FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, data, body, size, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, data, body, size, now, expires_at, now),
+            )
+            self._bytes += size - (previous[0] if previous else 0)
+
+        self._evict()
+        self._remove_expired()
+
+    def retrieve(self, key: str) -> StoredResponse | None:
+        """Retrieve an unexpired response from the database."""
+        self._remove_expired()
+        now: float = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, body FROM cache_entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            if self.max_bytes is not None:
+                ## Access time is only needed to choose LRU victims for the byte budget
+                self._connection.execute(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+        return self._loads(data=row[0], body=row[1])
+
+    def _update_head(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata,
+        restart_ttl: bool,
+    ) -> None:
+        """Rewrite a stored entry's serialized headers/metadata, leaving its body untouched."""
+        data, _ = self._dumps(response=response, request=request, metadata=metadata)
+        now: float = time.time()
+
+        with self._lock:
+            previous = self._connection.execute(
+                "SELECT size, LENGTH(body) FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if previous is None:
+                return
+
+            size: int = len(data) + previous[1]
+            self._connection.execute(
+                "UPDATE cache_entries SET data = ?, size = ? WHERE key = ?",
+                (data, size, key),
+            )
+            if restart_ttl:
+                self._connection.execute(
+                    "UPDATE cache_entries SET created_at = ?, expires_at = ?, accessed_at = ? WHERE key = ?",
+                    (now, now + self._ttl if self._ttl is not None else None, now, key),
+                )
+
+            self._bytes += size - previous[0]
+
+    def update_metadata(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata,
+    ) -> None:
+        """Update a stored response's metadata, keeping its original expiry."""
+        self._update_head(
+            key=key, response=response, request=request, metadata=metadata, restart_ttl=False
+        )
+
+    def update_headers(
+        self,
+        key: str,
+        response: httpcore.Response,
+        request: httpcore.Request,
+        metadata: Metadata,
+    ) -> None:
+        """Replace a stored response's headers & metadata (i.e. after a 304), restarting its ttl."""
+        self._update_head(
+            key=key, response=response, request=request, metadata=metadata, restart_ttl=True
+        )
+
+    def remove(self, key: t.Union[str, httpcore.Response]) -> None:
+        """Remove a response from the database."""
+        if isinstance(key, httpcore.Response):
+            key = t.cast(str, key.extensions["cache_metadata"]["cache_key"])
+
+        with self._lock:
+            row = self._connection.execute(
+                "DELETE FROM cache_entries WHERE key = ? RETURNING size", (key,)
+            ).fetchone()
+            if row is not None:
+                self._bytes -= row[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number & total size of stored responses, and eviction/expiry counters."""
+        with self._lock:
+            entries: int = self._connection.execute(
+                "SELECT COUNT(*) FROM cache_entries"
+            ).fetchone()[0]
+
+            return {
+                "entries": entries,
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+                "expired": self.expired,
+            }
@@ -6,6 +6,70 @@ import hishel
 import httpx
 from loguru import logger as log
 
+from ._refresh import HISHEL_VERSION, RefreshingCacheTransport, hishel_supported
+from ._storages import MemoryLRUStorage, SQLiteCacheStorage
+
+## Persistent cache storages that can be selected by name in get_cache_storage()
+CACHE_BACKENDS: tuple[str, ...] = ("file", "sqlite")
+
+
+def get_cache_storage(
+    cache_dir: str = ".cache/hishel",
+    ttl: int | None = None,
+    memory_max_entries: int | None = None,
+    memory_max_bytes: int = 64 * 1024 * 1024,
+    backend: str = "file",
+    max_bytes: int | None = None,
+) -> hishel.BaseStorage:
+    """Return an initialized hishel storage for a cache transport.
+
+    Description:
+        By default, returns a `hishel.FileStorage`, which writes one file per cached response. With
+        `backend="sqlite"`, returns a `SQLiteCacheStorage`, which keeps all responses in a single indexed
+        database at `cache_dir/cache.sqlite`. When `memory_max_entries` is set, the storage is wrapped in a
+        `MemoryLRUStorage`, which serves hot responses from memory. Keep a reference to the returned storage
+        to read its `.stats()`.
+
+    Params:
+        cache_dir (str): [default: .cache/hishel] Directory where cache files will be stored.
+        ttl (int|None): [default: None] Limit ttl on responses stored in the cache.
+        backend (str): [default: file] Persistent storage to use, one of `CACHE_BACKENDS` ("file", "sqlite").
+        max_bytes (int|None): [default: None] Byte budget for the `sqlite` backend. Least recently used responses
+            are evicted when it is exceeded.
+        memory_max_entries (int|None): [default: None] Maximum number of responses held in the in-memory tier.
+            When `None`, the in-memory tier is disabled.
+        memory_max_bytes (int): [default: 64MiB] Maximum approximate size of responses held in the in-memory tier.
+
+    """
+    assert backend in CACHE_BACKENDS, ValueError(
+        f"Invalid cache backend: '{backend}'. Must be one of {CACHE_BACKENDS}"
+    )
+
+    try:
+        if backend == "sqlite":
+            cache_storage: hishel.BaseStorage = SQLiteCacheStorage(
+                path=f"{cache_dir}/cache.sqlite", ttl=ttl, max_bytes=max_bytes
+            )
+        else:
+            cache_storage: hishel.BaseStorage = hishel.FileStorage(
+                base_path=cache_dir, ttl=ttl
+            )
+
+        if memory_max_entries:
+            cache_storage = MemoryLRUStorage(
+                backend=cache_storage,
+                max_entries=memory_max_entries,
+                max_bytes=memory_max_bytes,
+                ttl=ttl,
+            )
+
+        return cache_storage
+    except Exception as exc:
+        msg = Exception(f"Unhandled exception returning cache storage. Details: {exc}")
+        log.error(msg)
+
+        raise exc
+
 
 def get_cache_transport(
     cache_dir: str = ".cache/hishel",
@@ -15,25 +79,89 @@ def get_cache_transport(
     cert: t.Union[
         str, tuple[str, str | None], tuple[str, str | None, str | None]
     ] = None,
+    memory_max_entries: int | None = None,
+    memory_max_bytes: int = 64 * 1024 * 1024,
+    backend: str = "file",
+    max_bytes: int | None = None,
+    storage: hishel.BaseStorage | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+    stale_while_revalidate: int = 0,
+    stale_if_error: int = 0,
+    max_refreshes: int = 4,
 ) -> hishel.CacheTransport:
-    """Return an initialized hishel.CacheTransport.
+    """Return an initialized cache transport (a `RefreshingCacheTransport`, extending `hishel.CacheTransport`).
+
+    Description:
+        Stale responses are revalidated with `If-None-Match`/`If-Modified-Since`, and a `304 Not Modified`
+        refreshes the stored entry without re-downloading its body. Keep a reference to the returned transport
+        to read its `.stats()`.
+
+        `RefreshingCacheTransport` requires the hishel release pinned in `HISHEL_VERSION`. With any other release,
+        a plain `hishel.CacheTransport` is returned (a warning is logged), without stale serving or in-place `304`
+        updates.
 
     Params:
         cache_dir (str): [default: .cache/hishel] Directory where cache files will be stored.
         ttl (int|None): [default: None] Limit ttl on requests sent with this transport.
+            The storage deletes responses `ttl` seconds after they were stored, regardless of their `max-age`,
+            so they can no longer be served stale. With `stale_while_revalidate`/`stale_if_error`, use a `ttl`
+            of at least the longest `max-age` plus the stale window.
         verify (bool): [default: True] Verify SSL certificates on requests sent with this transport.
         retriest (int): [default: 0] Number of times to retry requests sent with this transport.
         cert (valid HTTPX Cert): An optional SSL certificate to send with requests.
+        memory_max_entries (int|None): [default: None] Enable an in-memory LRU tier in front of the file cache,
+            holding up to this many responses.
+        memory_max_bytes (int): [default: 64MiB] Maximum approximate size of the in-memory LRU tier.
+        backend (str): [default: file] Persistent cache storage, "file" (one file per response) or "sqlite"
+            (a single indexed SQLite database).
+        max_bytes (int|None): [default: None] Byte budget for the `sqlite` backend.
+        storage (hishel.BaseStorage|None): [default: None] A pre-built storage (i.e. from `get_cache_storage()`).
+            When set, `cache_dir`, `ttl`, `backend`, `max_bytes` & the `memory_*` params are ignored.
+        limits (httpx.Limits|None): [default: None] Connection pool limits for the wrapped `httpx.HTTPTransport`.
+        http2 (bool): [default: False] Enable HTTP/2 on the wrapped `httpx.HTTPTransport` (requires `h2`).
+        stale_while_revalidate (int): [default: 0] Serve responses that have been stale for up to this many seconds
+            immediately, & refresh them in the background. Responses' own `stale-while-revalidate` directives
+            take precedence.
+        stale_if_error (int): [default: 0] Serve responses that have been stale for up to this many seconds when
+            revalidating them fails (transport error or 5xx). Responses' own `stale-if-error` directives take
+            precedence.
+        max_refreshes (int): [default: 4] Maximum number of concurrent background refreshes.
 
     """
     # Create a cache instance with hishel
-    cache_storage = hishel.FileStorage(base_path=cache_dir, ttl=ttl)
-    cache_transport = httpx.HTTPTransport(verify=verify, cert=cert, retries=retries)
+    cache_storage = storage or get_cache_storage(
+        cache_dir=cache_dir,
+        ttl=ttl,
+        memory_max_entries=memory_max_entries,
+        memory_max_bytes=memory_max_bytes,
+        backend=backend,
+        max_bytes=max_bytes,
+    )
+    transport_kwargs: dict[str, t.Any] = dict(
+        verify=verify, cert=cert, retries=retries, http2=http2
+    )
+    if limits is not None:
+        transport_kwargs["limits"] = limits
+    cache_transport = httpx.HTTPTransport(**transport_kwargs)
+
+    if not hishel_supported():
+        log.warning(
+            f"hishel {getattr(hishel, '__version__', None)} is installed, but RefreshingCacheTransport requires "
+            f"hishel=={HISHEL_VERSION}. Falling back to hishel.CacheTransport (stale_while_revalidate, "
+            "stale_if_error & in-place 304 updates are disabled)."
+        )
+
+        return hishel.CacheTransport(transport=cache_transport, storage=cache_storage)
 
     try:
         # Create an HTTP cache transport
-        cache_transport = hishel.CacheTransport(
-            transport=cache_transport, storage=cache_storage
+        cache_transport = RefreshingCacheTransport(
+            transport=cache_transport,
+            storage=cache_storage,
+            stale_while_revalidate=stale_while_revalidate,
+            stale_if_error=stale_if_error,
+            max_refreshes=max_refreshes,
         )
 
         return cache_transport
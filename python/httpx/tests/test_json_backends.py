@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from request_client.encoders.json_encoders import (
+    JSON_BACKENDS,
+    JSONSerializer,
+    available_json_backends,
+)
+
+PAYLOAD: dict = {
+    "utc": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "utc_micro": datetime(2024, 1, 2, 3, 4, 5, 120000, tzinfo=timezone.utc),
+    "zoneinfo_utc": datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("UTC")),
+    "offset": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+    "naive": datetime(2024, 1, 2, 3, 4, 5),
+    "pendulum": pendulum.datetime(2024, 1, 2, 3, 4, 5),
+    "date": date(2024, 1, 2),
+    "time": time(3, 4, 5),
+    "time_utc": time(3, 4, 5, tzinfo=timezone.utc),
+}
+
+EXPECTED: dict[str, str] = {
+    "utc": "2024-01-02T03:04:05Z",
+    "utc_micro": "2024-01-02T03:04:05.120000Z",
+    "zoneinfo_utc": "2024-01-02T03:04:05Z",
+    "offset": "2024-01-02T03:04:05+05:30",
+    "naive": "2024-01-02T03:04:05",
+    "pendulum": "2024-01-02T03:04:05Z",
+    "date": "2024-01-02",
+    "time": "03:04:05",
+    "time_utc": "03:04:05Z",
+}
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+def test_datetimes_match_across_backends(backend: str):
+    if backend not in available_json_backends():
+        pytest.skip(f"{backend} is not installed")
+
+    serializer: JSONSerializer = JSONSerializer(backend=backend)
+
+    assert serializer.backend == backend
+    assert serializer.loads(serializer.dumps(PAYLOAD)) == EXPECTED
+    assert serializer.dumps(PAYLOAD) == JSONSerializer(backend="stdlib").dumps(PAYLOAD)
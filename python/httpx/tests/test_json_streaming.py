@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from request_client.encoders.json_encoders import JSONRecordDecoder
+
+## Numbers that raw_decode() can stop in the middle of: fractions, exponents & signs
+NUMBERS: list[str] = [
+    "0",
+    "-0",
+    "7",
+    "1.5",
+    "-5000000000.0",
+    "12.25e3",
+    "1e3",
+    "1E-3",
+    "-2.5e+10",
+    "6.02E+23",
+]
+
+BODIES: list[str] = [
+    "[" + ", ".join(NUMBERS) + "]",
+    "\n".join(NUMBERS) + "\n",
+    "\n".join(NUMBERS),
+    json.dumps([{"value": json.loads(n)} for n in NUMBERS]),
+]
+
+
+def _decode(chunks: list[bytes]) -> list:
+    decoder: JSONRecordDecoder = JSONRecordDecoder(encoding="utf-8")
+    records: list = []
+    for chunk in chunks:
+        records.extend(decoder.feed(chunk))
+    records.extend(decoder.close())
+
+    return records
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_every_split_point(body: str):
+    expected: list = (
+        json.loads(body)
+        if body.startswith("[")
+        else [json.loads(n) for n in NUMBERS]
+    )
+    data: bytes = body.encode("utf-8")
+
+    for split in range(len(data) + 1):
+        records: list = _decode([data[:split], data[split:]])
+        assert records == expected, f"Split at {split} ({data[:split]!r}) decoded: {records}"
+
+
+def test_split_after_decimal_point():
+    assert _decode([b"1.", b"5\n2"]) == [1.5, 2]
+
+
+def test_split_after_exponent():
+    assert _decode([b"[1e", b"3]"]) == [1000.0]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+import typing as t
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from request_client import HTTPXController
+from request_client.context_managers import LinkHeaderPagination, OffsetPagination
+
+PAGES: int = 6
+
+
+class _Pages(BaseHTTPRequestHandler):
+    requests: list[str] = []
+
+    def do_GET(self):
+        type(self).requests.append(self.path)
+
+        query: dict[str, list[str]] = parse_qs(urlparse(self.path).query)
+        page: int = int(query.get("page", query.get("offset", ["0"]))[0])
+        body: bytes = json.dumps([page]).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if page + 1 < PAGES:
+            self.send_header("Link", f'</items?page={page + 1}>; rel="next"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> t.Iterator[str]:
+    _Pages.requests = []
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), _Pages)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_sequential_prefetch_stays_within_limit(base_url: str, prefetch: int):
+    with HTTPXController(base_url=base_url) as ctl:
+        pages = ctl.paginate(
+            request=ctl.new_request(url="/items?page=0"),
+            strategy=LinkHeaderPagination(),
+            prefetch=prefetch,
+        )
+
+        first = next(pages)
+        ## Give the producer time to run ahead while the caller holds page 0
+        time.sleep(0.5)
+        fetched: int = len(_Pages.requests)
+        rest = list(pages)
+
+    assert first.data == [0]
+    assert [page.data for page in rest] == [[i] for i in range(1, PAGES)]
+    assert fetched == 1 + prefetch
+
+
+def test_predictable_max_pages_is_not_refetched(base_url: str):
+    with HTTPXController(base_url=base_url) as ctl:
+        pages = list(
+            ctl.paginate(
+                request=ctl.new_request(url="/items"),
+                strategy=OffsetPagination(limit=1),
+                max_pages=2,
+            )
+        )
+
+    assert [page.data for page in pages] == [[0], [1]]
+    assert len(_Pages.requests) == 2
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import typing as t
+
+import httpx
+import pytest
+
+from request_client import AsyncHTTPXController, HTTPXController, spooled_body
+from request_client.context_managers import SingleFlight
+from request_client.encoders.json_encoders import JSON_SERIALIZER
+
+RECORDS: list[dict[str, t.Any]] = [
+    {"id": i, "name": f"user-{i}", "active": i % 2 == 0} for i in range(2000)
+]
+BODY: bytes = json.dumps(RECORDS).encode("utf-8")
+
+
+class _Records(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> t.Iterator[str]:
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), _Records)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_iter_records_from_spilled_body(base_url: str, tmp_path):
+    with HTTPXController(base_url=base_url, spool_threshold=1000, spool_dir=tmp_path) as ctl:
+        res = ctl.send_request(request=ctl.new_request(url="/users"))
+        assert spooled_body(res).spilled
+
+        assert ctl.decode_res_content(res=res) == RECORDS
+        assert list(ctl.iter_records(res=res, chunk_size=4096)) == RECORDS
+
+
+def test_aiter_records_from_spilled_body(base_url: str, tmp_path):
+    async def _records() -> list[t.Any]:
+        async with AsyncHTTPXController(
+            base_url=base_url, spool_threshold=1000, spool_dir=tmp_path
+        ) as ctl:
+            res = await ctl.send_request(request=ctl.new_request(url="/users"))
+            assert spooled_body(res).spilled
+
+            return [record async for record in ctl.aiter_records(res=res)]
+
+    assert asyncio.run(_records()) == RECORDS
+
+
+def test_spooled_requests_are_not_coalesced(base_url: str, tmp_path):
+    barrier: threading.Barrier = threading.Barrier(2)
+    responses: list[t.Any] = []
+    flight: SingleFlight = SingleFlight()
+
+    def _get() -> None:
+        with HTTPXController(
+            base_url=base_url,
+            spool_threshold=1000,
+            spool_dir=tmp_path,
+            coalesce_requests=flight,
+        ) as ctl:
+            barrier.wait()
+            responses.append(ctl.send_request(request=ctl.new_request(url="/users")))
+
+    threads: list[threading.Thread] = [threading.Thread(target=_get) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    first, second = (spooled_body(res) for res in responses)
+    assert first is not second
+
+    ## Closing one caller's body leaves the other's readable
+    first.close()
+    assert json.loads(second.read()) == RECORDS
+
+
+@pytest.mark.parametrize(
+    ("charset", "parsed_type"), [("utf-8", bytes), ("ascii", bytes), ("latin-1", str)]
+)
+def test_decode_res_content_parses_utf8_bytes_directly(
+    monkeypatch: pytest.MonkeyPatch, charset: str, parsed_type: type
+):
+    parsed: list[type] = []
+    loads: t.Callable[..., t.Any] = JSON_SERIALIZER.loads
+
+    def _loads(data: t.Any) -> t.Any:
+        parsed.append(type(data))
+
+        return loads(data)
+
+    monkeypatch.setattr(JSON_SERIALIZER, "loads", _loads)
+
+    name: str = "cafe" if charset == "ascii" else "café"
+    res: httpx.Response = httpx.Response(
+        200,
+        headers={"Content-Type": f"application/json; charset={charset}"},
+        content=json.dumps({"name": name}, ensure_ascii=False).encode(charset),
+    )
+
+    assert HTTPXController().decode_res_content(res=res) == {"name": name}
+    ## Only non-UTF-8 bodies are transcoded to str first
+    assert parsed == [parsed_type]
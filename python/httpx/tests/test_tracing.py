@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import typing as t
+
+import pytest
+
+from request_client import HTTPXController, RequestMetrics
+
+
+class _TooManyRequests(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body: bytes = b'{"error": "slow down"}'
+        self.send_response(429)
+        self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> t.Iterator[str]:
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), _TooManyRequests)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def _counts(metrics: RequestMetrics) -> dict[str, int]:
+    return {h["phase"]: h["count"] for h in metrics.snapshot()}
+
+
+def test_one_observation_per_attempt(base_url: str):
+    metrics: RequestMetrics = RequestMetrics()
+
+    with HTTPXController(base_url=base_url, retries=3, metrics=metrics, monitor_pool=True) as ctl:
+        res = ctl.send_request(request=ctl.new_request(url="/limited"))
+        pool_requests: int = ctl.pool_stats()["requests"]
+
+    assert res.status_code == 429
+    ## 1 request + 3 retries
+    counts: dict[str, int] = _counts(metrics)
+    for phase in ("ttfb", "download", "total"):
+        assert counts[phase] == 4, f"{phase} recorded {counts[phase]} times: {counts}"
+    assert pool_requests == 4
+
+
+def test_resent_request_is_traced_once(base_url: str):
+    metrics: RequestMetrics = RequestMetrics()
+    events: list[str] = []
+
+    with HTTPXController(base_url=base_url, metrics=metrics) as ctl:
+        req = ctl.new_request(url="/limited")
+        ## A trace set by the caller is kept
+        req.extensions["trace"] = lambda name, info: events.append(name)
+
+        ctl.send_request(request=req)
+        ctl.send_request(request=req)
+
+    assert _counts(metrics)["ttfb"] == 2
+    assert events.count("http11.receive_response_headers.complete") == 2
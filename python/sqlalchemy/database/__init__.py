@@ -2,6 +2,28 @@ from __future__ import annotations
 
 from .annotated import INT_PK, STR_10, STR_255
 from .base import Base
+from .bulk import BulkResult, bulk_insert, bulk_upsert
 from .db_config import DBSettings
-from .methods import get_db_uri, get_engine, get_session_pool
+from .engine_registry import ENGINE_REGISTRY, EngineRegistry, engine_key
+from .methods import (
+    ASYNC_DRIVERS,
+    dispose_async_engine,
+    dispose_engine,
+    find_async_engine,
+    find_engine,
+    get_async_db_uri,
+    get_async_engine,
+    get_async_session_pool,
+    get_db_uri,
+    get_engine,
+    get_session_pool,
+    pool_options,
+)
 from .mixins import TableNameMixin, TimestampMixin
+from .pool_metrics import PoolMetrics, get_pool_metrics, instrument_pool
+from .sqlite_profile import (
+    SQLITE_PROFILES,
+    SQLiteProfile,
+    apply_sqlite_profile,
+    get_sqlite_profile,
+)
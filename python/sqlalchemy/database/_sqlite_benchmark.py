@@ -0,0 +1,190 @@
+"""Compare SQLite write & read throughput with and without a PRAGMA profile.
+
+Run with `python -m database._sqlite_benchmark` (from the directory containing the `database` package).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import tempfile
+import threading
+import time
+import typing as t
+
+import sqlalchemy as sa
+
+from .methods import get_db_uri, get_engine
+from .sqlite_profile import SQLITE_PROFILES
+
+## Benchmark table, kept out of `Base.metadata`
+_METADATA: sa.MetaData = sa.MetaData()
+_RECORDS: sa.Table = sa.Table(
+    "benchmark_records",
+    _METADATA,
+    sa.Column("id", sa.INTEGER, primary_key=True),
+    sa.Column("name", sa.VARCHAR(255)),
+    sa.Column("score", sa.FLOAT),
+)
+
+
+def _rows(start: int, count: int) -> list[dict[str, t.Any]]:
+    return [
+        {"id": i, "name": f"record-{i}", "score": i * 0.5}
+        for i in range(start, start + count)
+    ]
+
+
+def _write_txn(engine: sa.Engine, ops: int) -> int:
+    ## One row per transaction: dominated by journal & fsync cost
+    for i in range(ops):
+        with engine.begin() as conn:
+            conn.execute(sa.insert(_RECORDS), _rows(10_000_000 + i, 1))
+
+    return ops
+
+
+def _write_batch(engine: sa.Engine, ops: int) -> int:
+    with engine.begin() as conn:
+        conn.execute(sa.insert(_RECORDS), _rows(20_000_000, ops))
+
+    return ops
+
+
+def _read_point(engine: sa.Engine, ops: int) -> int:
+    rng: random.Random = random.Random(0)
+    stmt: sa.Select = sa.select(_RECORDS).where(_RECORDS.c.id == sa.bindparam("id"))
+
+    with engine.connect() as conn:
+        for _ in range(ops):
+            conn.execute(stmt, {"id": 20_000_000 + rng.randrange(ops)}).first()
+
+    return ops
+
+
+def _read_while_writing(engine: sa.Engine, ops: int, readers: int = 4) -> int:
+    ## Readers count queries completed while a writer commits small transactions
+    stop: threading.Event = threading.Event()
+    counts: list[int] = [0] * readers
+
+    def _reader(index: int) -> None:
+        with engine.connect() as conn:
+            while not stop.is_set():
+                try:
+                    conn.execute(sa.select(sa.func.count()).select_from(_RECORDS)).scalar()
+                    counts[index] += 1
+                except sa.exc.OperationalError:
+                    ## "database is locked" under the rollback journal
+                    pass
+                conn.rollback()
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=_reader, args=(i,)) for i in range(readers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        for i in range(ops):
+            with engine.begin() as conn:
+                conn.execute(sa.insert(_RECORDS), _rows(30_000_000 + i, 1))
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return sum(counts)
+
+
+## Workload name -> (function, number of operations)
+WORKLOADS: dict[str, tuple[t.Callable[[sa.Engine, int], int], int]] = {
+    "write_txn": (_write_txn, 500),
+    "write_batch": (_write_batch, 50_000),
+    "read_point": (_read_point, 20_000),
+    "read_while_writing": (_read_while_writing, 200),
+}
+
+
+def benchmark_sqlite_profiles(
+    profiles: list[str | None] | None = None,
+    workloads: list[str] | None = None,
+    directory: t.Union[str, Path] | None = None,
+) -> list[dict[str, t.Any]]:
+    """Run each workload against a new database file, once per profile.
+
+    Params:
+        profiles (list[str|None]|None): [Default: None & all of SQLITE_PROFILES] Profiles to compare. `None` is
+            SQLite's defaults.
+        workloads (list[str]|None): [Default: all of WORKLOADS] Workloads to run, in order.
+        directory (str|Path|None): [Default: a temporary directory] Where database files are created.
+
+    Returns:
+        (list[dict[str, Any]]): One row per profile/workload, with `ops`, `seconds` & `ops_per_sec`.
+
+    """
+    profiles = profiles if profiles is not None else [None, *SQLITE_PROFILES]
+    workloads = workloads or list(WORKLOADS)
+
+    rows: list[dict[str, t.Any]] = []
+
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for profile in profiles:
+            db_path: Path = Path(tmp) / f"{profile or 'default'}.sqlite"
+            engine: sa.Engine = get_engine(
+                db_uri=get_db_uri(database=str(db_path)),
+                cached=False,
+                sqlite_profile=profile,
+            )
+            _METADATA.create_all(engine)
+
+            try:
+                for name in workloads:
+                    func, ops = WORKLOADS[name]
+
+                    started_at: float = time.perf_counter()
+                    completed: int = func(engine, ops)
+                    seconds: float = time.perf_counter() - started_at
+
+                    rows.append(
+                        {
+                            "profile": profile or "default",
+                            "workload": name,
+                            "ops": completed,
+                            "seconds": seconds,
+                            "ops_per_sec": completed / seconds if seconds else 0.0,
+                        }
+                    )
+            finally:
+                engine.dispose()
+
+    return rows
+
+
+def main() -> None:
+    rows: list[dict[str, t.Any]] = benchmark_sqlite_profiles()
+
+    print(f"{'workload':<20} {'profile':<16} {'ops':>8} {'seconds':>9} {'ops/s':>12} {'vs default':>11}")
+
+    for row in rows:
+        baseline: dict[str, t.Any] | None = next(
+            (
+                r
+                for r in rows
+                if r["profile"] == "default" and r["workload"] == row["workload"]
+            ),
+            None,
+        )
+        speedup: str = (
+            f"{row['ops_per_sec'] / baseline['ops_per_sec']:.1f}x"
+            if baseline and baseline["ops_per_sec"]
+            else "-"
+        )
+
+        print(
+            f"{row['workload']:<20} {row['profile']:<16} {row['ops']:>8} "
+            f"{row['seconds']:>9.3f} {row['ops_per_sec']:>12.0f} {speedup:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
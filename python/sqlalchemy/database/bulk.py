@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import itertools
+import time
+import typing as t
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+import sqlalchemy.orm as so
+
+from .mixins import TimestampMixin
+
+## TimestampMixin columns, which are left to their defaults when a row does not set them
+TIMESTAMP_COLUMNS: tuple[str, ...] = ("created_at", "updated_at")
+## Columns never overwritten when an upsert updates an existing row
+INSERT_ONLY_COLUMNS: tuple[str, ...] = ("created_at",)
+
+## Dialects supporting INSERT ... ON CONFLICT, and their insert() constructs
+UPSERT_DIALECTS: dict[str, t.Callable[[t.Any], t.Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+Executor = t.Union[so.Session, sa.Connection]
+
+
+@dataclass
+class BulkResult:
+    """Summary of a bulk insert/upsert, returned by `bulk_insert()` & `bulk_upsert()`.
+
+    Params:
+        rows (int): Number of rows sent to the database.
+        batches (int): Number of batches (statements) executed.
+        seconds (float): Seconds spent building & executing the batches.
+
+    """
+
+    rows: int = field(default=0)
+    batches: int = field(default=0)
+    seconds: float = field(default=0.0)
+
+    @property
+    def rows_per_sec(self) -> float:
+        """Average throughput, in rows/second."""
+        if not self.seconds:
+            return 0.0
+
+        return self.rows / self.seconds
+
+
+def _row_dict(model: type, row: t.Any) -> dict[str, t.Any]:
+    """Return a row as a `dict`, from a `dict` or an instance of `model`."""
+    if isinstance(row, dict):
+        values: dict[str, t.Any] = dict(row)
+    else:
+        assert isinstance(row, model), TypeError(
+            f"rows must be dicts or instances of {model.__name__}. Got type: ({type(row)})"
+        )
+        ## Only attributes that were set, so unset columns get their defaults
+        _set: dict[str, t.Any] = sa.inspect(row).dict
+        values = {
+            attr.key: _set[attr.key]
+            for attr in sa.inspect(model).column_attrs
+            if attr.key in _set
+        }
+
+    if issubclass(model, TimestampMixin):
+        ## A None timestamp would override the server default with NULL
+        for name in TIMESTAMP_COLUMNS:
+            if name in values and values[name] is None:
+                del values[name]
+
+    return values
+
+
+def _batches(
+    model: type, rows: t.Iterable[t.Any], batch_size: int
+) -> t.Iterator[list[dict[str, t.Any]]]:
+    """Yield lists of at most `batch_size` rows sharing the same keys, so each list is one executemany."""
+    iterator: t.Iterator[t.Any] = iter(rows)
+
+    while True:
+        chunk: list[dict[str, t.Any]] = [
+            _row_dict(model, row) for row in itertools.islice(iterator, batch_size)
+        ]
+        if not chunk:
+            return
+
+        groups: dict[tuple[str, ...], list[dict[str, t.Any]]] = {}
+        for values in chunk:
+            groups.setdefault(tuple(sorted(values)), []).append(values)
+
+        yield from groups.values()
+
+
+def _validate(executor: Executor, model: type, batch_size: int) -> None:
+    assert isinstance(executor, (so.Session, sa.Connection)), TypeError(
+        f"executor must be a sqlalchemy.orm.Session or sqlalchemy.Connection. Got type: ({type(executor)})"
+    )
+    assert isinstance(model, type) and hasattr(model, "__table__"), TypeError(
+        f"model must be a mapped class, i.e. a subclass of Base. Got: ({model})"
+    )
+    assert isinstance(batch_size, int) and batch_size > 0, ValueError(
+        f"batch_size must be a positive integer. Got: ({batch_size})"
+    )
+
+
+def _target(executor: Executor, model: type) -> t.Any:
+    ## Sessions run ORM-enabled bulk statements; Connections run Core statements against the table
+    return model if isinstance(executor, so.Session) else model.__table__
+
+
+def bulk_insert(
+    executor: Executor = None,
+    model: type = None,
+    rows: t.Iterable[t.Any] = None,
+    batch_size: int = 10_000,
+) -> BulkResult:
+    """Insert rows in batches, with one multi-row statement per batch.
+
+    Description:
+        Each batch is executed as an `executemany`, which SQLAlchemy sends with its "insertmanyvalues" mode (many
+        rows per `INSERT ... VALUES` statement) instead of one `INSERT` per object. `rows` is consumed lazily, so
+        it can be a generator of any length.
+
+        Columns missing from a row use their defaults, so `TimestampMixin` columns are filled by the database.
+        The transaction is not committed; commit it (or use `session.begin()`/`engine.begin()`) when done. From an
+        `AsyncSession`, run with `await session.run_sync(bulk_insert, model, rows)`.
+
+    Params:
+        executor (Session|Connection): The session (ORM bulk insert) or connection (Core insert) to insert with.
+        model (type): A mapped class, i.e. a subclass of `Base`.
+        rows (Iterable[dict|model]): Rows as dicts of column values, or instances of `model`.
+        batch_size (int): [Default: 10000] Rows per statement.
+
+    Returns:
+        (BulkResult): Rows & batches executed, with throughput.
+
+    """
+    _validate(executor=executor, model=model, batch_size=batch_size)
+
+    result: BulkResult = BulkResult()
+    started_at: float = time.perf_counter()
+    stmt: sa.Insert = sa.insert(_target(executor, model))
+
+    try:
+        for batch in _batches(model=model, rows=rows, batch_size=batch_size):
+            executor.execute(stmt, batch)
+
+            result.rows += len(batch)
+            result.batches += 1
+
+    except Exception as exc:
+        msg = Exception(
+            f"Unhandled exception bulk inserting into table '{model.__table__.name}' after {result.rows} rows. Details: {exc}"
+        )
+
+        raise msg
+
+    result.seconds = time.perf_counter() - started_at
+
+    return result
+
+
+def _upsert_set(
+    stmt: t.Any, model: type, keys: t.Iterable[str], update_columns: list[str]
+) -> dict[str, t.Any]:
+    """Return the `SET` clause of an upsert: the batch's update columns, plus `onupdate` columns."""
+    table: sa.Table = model.__table__
+    _set: dict[str, t.Any] = {name: stmt.excluded[name] for name in update_columns if name in keys}
+
+    ## ON CONFLICT DO UPDATE does not apply column onupdate defaults (i.e. TimestampMixin.updated_at)
+    for column in table.columns:
+        if column.name in _set or column.onupdate is None:
+            continue
+        if column.onupdate.is_clause_element or column.onupdate.is_scalar:
+            _set[column.name] = column.onupdate.arg
+
+    return _set
+
+
+def bulk_upsert(
+    executor: Executor = None,
+    model: type = None,
+    rows: t.Iterable[t.Any] = None,
+    index_elements: list[str] | None = None,
+    update_columns: list[str] | None = None,
+    batch_size: int = 10_000,
+) -> BulkResult:
+    """Insert rows in batches, updating existing rows on a conflict (`INSERT ... ON CONFLICT DO UPDATE`).
+
+    Description:
+        Supported on SQLite & PostgreSQL. Rows are batched like `bulk_insert()`.
+
+        For `TimestampMixin` models, `created_at` is set on insert & never overwritten, and `updated_at` is set
+        to `now()` when an existing row is updated (along with any other column with an SQL `onupdate`).
+
+    Params:
+        executor (Session|Connection): The session or connection to upsert with.
+        model (type): A mapped class, i.e. a subclass of `Base`.
+        rows (Iterable[dict|model]): Rows as dicts of column values, or instances of `model`.
+        index_elements (list[str]|None): [Default: primary key columns] Columns of the unique index/constraint
+            that identifies existing rows.
+        update_columns (list[str]|None): [Default: all other columns] Columns updated on a conflict. Columns
+            missing from a row are not updated.
+        batch_size (int): [Default: 10000] Rows per statement.
+
+    Returns:
+        (BulkResult): Rows & batches executed, with throughput.
+
+    """
+    _validate(executor=executor, model=model, batch_size=batch_size)
+
+    bind: t.Union[sa.Engine, sa.Connection] = (
+        executor.get_bind() if isinstance(executor, so.Session) else executor
+    )
+    dialect: str = bind.dialect.name
+    assert dialect in UPSERT_DIALECTS, ValueError(
+        f"Upserts are only supported on: {list(UPSERT_DIALECTS)}. Got dialect: ({dialect})"
+    )
+
+    table: sa.Table = model.__table__
+    index_elements = index_elements or [c.name for c in table.primary_key.columns]
+    assert index_elements, ValueError(
+        f"Table '{table.name}' has no primary key. Pass index_elements."
+    )
+
+    insert_only: tuple[str, ...] = (
+        INSERT_ONLY_COLUMNS if issubclass(model, TimestampMixin) else ()
+    )
+    update_columns = [
+        name
+        for name in (update_columns or [c.name for c in table.columns])
+        if name not in index_elements and name not in insert_only
+    ]
+
+    result: BulkResult = BulkResult()
+    started_at: float = time.perf_counter()
+    insert: t.Callable[[t.Any], t.Any] = UPSERT_DIALECTS[dialect]
+
+    try:
+        for batch in _batches(model=model, rows=rows, batch_size=batch_size):
+            stmt: t.Any = insert(_target(executor, model))
+            _set: dict[str, t.Any] = _upsert_set(
+                stmt=stmt, model=model, keys=batch[0], update_columns=update_columns
+            )
+            stmt = (
+                stmt.on_conflict_do_update(index_elements=index_elements, set_=_set)
+                if _set
+                else stmt.on_conflict_do_nothing(index_elements=index_elements)
+            )
+
+            executor.execute(stmt, batch)
+
+            result.rows += len(batch)
+            result.batches += 1
+
+    except Exception as exc:
+        msg = Exception(
+            f"Unhandled exception bulk upserting into table '{table.name}' after {result.rows} rows. Details: {exc}"
+        )
+
+        raise msg
+
+    result.seconds = time.perf_counter() - started_at
+
+    return result
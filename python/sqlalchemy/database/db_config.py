@@ -1,9 +1,26 @@
 from __future__ import annotations
 
 import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 import sqlalchemy.orm as so
 
 from dataclasses import dataclass, field
+import typing as t
+
+from .methods import (
+    dispose_async_engine,
+    dispose_engine,
+    find_async_engine,
+    find_engine,
+    get_async_db_uri,
+    get_async_engine,
+    get_async_session_pool,
+    get_engine,
+    get_session_pool,
+    pool_options,
+)
+from .pool_metrics import PoolMetrics, get_pool_metrics
+from .sqlite_profile import SQLITE_PROFILES
 
 
 @dataclass
@@ -15,6 +32,17 @@ class DBSettings:
     port: str | None = field(default=None)
     database: str = field(default="app.sqlite")
     echo: bool = field(default=False)
+    ## Connection pool options. None uses SQLAlchemy's defaults (see methods.pool_options())
+    pool_size: int | None = field(default=None)
+    max_overflow: int | None = field(default=None)
+    pool_timeout: float | None = field(default=None)
+    pool_recycle: int | None = field(default=None)
+    pool_pre_ping: bool = field(default=False)
+    pool_metrics: bool = field(default=False)
+    ## Name of a SQLite PRAGMA profile, i.e. "high_throughput" (see sqlite_profile.SQLITE_PROFILES)
+    sqlite_profile: str | None = field(default=None)
+    ## Driver for get_async_engine(). None maps drivername with methods.ASYNC_DRIVERS, i.e. sqlite+aiosqlite
+    async_drivername: str | None = field(default=None)
 
     def __post_init__(self):
         assert self.drivername is not None, ValueError("drivername cannot be None")
@@ -43,6 +71,25 @@ class DBSettings:
             assert self.port > 0 and self.port <= 65535, ValueError(
                 f"port must be an integer between 1 and 65535"
             )
+        assert isinstance(self.pool_metrics, bool), TypeError(
+            f"pool_metrics must be a bool. Got type: ({type(self.pool_metrics)})"
+        )
+        if self.async_drivername is not None:
+            assert isinstance(self.async_drivername, str), TypeError(
+                f"async_drivername must be of type str. Got type: ({type(self.async_drivername)})"
+            )
+        if self.sqlite_profile is not None:
+            assert self.sqlite_profile in SQLITE_PROFILES, ValueError(
+                f"Unknown SQLite profile: ({self.sqlite_profile!r}). Must be one of: {list(SQLITE_PROFILES)}"
+            )
+        ## Validate pool options
+        pool_options(
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pool_pre_ping,
+        )
 
     def get_db_uri(self) -> sa.URL:
         try:
@@ -64,16 +111,15 @@ class DBSettings:
             raise msg
 
     def get_engine(self) -> sa.Engine:
-        assert self.get_db_uri() is not None, ValueError("db_uri is not None")
-        assert isinstance(self.get_db_uri(), sa.URL), TypeError(
-            f"db_uri must be of type sqlalchemy.URL. Got type: ({type(self.db_uri)})"
+        """Return the shared engine for these settings (see `ENGINE_REGISTRY`)."""
+        db_uri: sa.URL = self.get_db_uri()
+        assert db_uri is not None, ValueError("db_uri is not None")
+        assert isinstance(db_uri, sa.URL), TypeError(
+            f"db_uri must be of type sqlalchemy.URL. Got type: ({type(db_uri)})"
         )
 
         try:
-            engine: sa.Engine = sa.create_engine(
-                url=self.get_db_uri().render_as_string(hide_password=False),
-                echo=self.echo,
-            )
+            engine: sa.Engine = get_engine(db_uri=db_uri, **self._engine_options())
 
             return engine
         except Exception as exc:
@@ -90,6 +136,80 @@ class DBSettings:
             f"engine must be of type sqlalchemy.Engine. Got type: ({type(engine)})"
         )
 
-        session_pool: so.sessionmaker[so.Session] = so.sessionmaker(bind=engine)
+        session_pool: so.sessionmaker[so.Session] = get_session_pool(engine=engine)
+
+        return session_pool
+
+    def get_async_db_uri(self) -> sa.URL:
+        """Return the database URL with an asyncio driver (`async_drivername`, or mapped from `drivername`)."""
+        db_uri: sa.URL = self.get_db_uri()
+        if self.async_drivername:
+            return db_uri.set(drivername=self.async_drivername)
+
+        return get_async_db_uri(db_uri=db_uri)
+
+    def _engine_options(self) -> dict[str, t.Any]:
+        return dict(
+            echo=self.echo,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pool_pre_ping,
+            pool_metrics=self.pool_metrics,
+            sqlite_profile=self.sqlite_profile,
+        )
+
+    def get_async_engine(self) -> AsyncEngine:
+        """Return the shared asyncio engine for these settings (see `ENGINE_REGISTRY`)."""
+        try:
+            engine: AsyncEngine = get_async_engine(
+                db_uri=self.get_async_db_uri(), **self._engine_options()
+            )
+
+            return engine
+        except Exception as exc:
+            msg = Exception(
+                f"Unhandled exception getting async database engine. Details: {exc}"
+            )
+
+            raise msg
+
+    def get_async_session_pool(self) -> async_sessionmaker[AsyncSession]:
+        engine: AsyncEngine = self.get_async_engine()
+
+        session_pool: async_sessionmaker[AsyncSession] = get_async_session_pool(
+            engine=engine
+        )
 
         return session_pool
+
+    async def dispose_async_engine(self) -> int:
+        """Close the shared asyncio engine's connections & remove it from `ENGINE_REGISTRY`. No-op if not created."""
+        engine: AsyncEngine | None = find_async_engine(
+            db_uri=self.get_async_db_uri(), **self._engine_options()
+        )
+        if engine is None:
+            return 0
+
+        return await dispose_async_engine(engine=engine)
+
+    def get_pool_metrics(self) -> PoolMetrics | None:
+        """Return the shared engine's pool metrics, when `pool_metrics=True` & the engine has been created."""
+        engine: sa.Engine | None = find_engine(
+            db_uri=self.get_db_uri(), **self._engine_options()
+        )
+        if engine is None:
+            return None
+
+        return get_pool_metrics(engine=engine)
+
+    def dispose_engine(self) -> int:
+        """Close the shared engine's connections & remove it from `ENGINE_REGISTRY`. No-op if not created."""
+        engine: sa.Engine | None = find_engine(
+            db_uri=self.get_db_uri(), **self._engine_options()
+        )
+        if engine is None:
+            return 0
+
+        return dispose_engine(engine=engine)
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import typing as t
+import weakref
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+import sqlalchemy.orm as so
+
+from .pool_metrics import instrument_pool
+from .sqlite_profile import SQLiteProfile, apply_sqlite_profile, get_sqlite_profile
+
+
+def engine_key(db_uri: sa.URL = None, **engine_kwargs: t.Any) -> str:
+    """Return a registry key for a database URL & the options its engine is created with.
+
+    Description:
+        The key is a hash of the rendered URL (including the password, so engines for different credentials
+        are not shared) and the sorted engine options, so the password is never stored in plain text.
+    """
+    assert isinstance(db_uri, sa.URL), TypeError(
+        f"db_uri must be of type sqlalchemy.URL. Got type: ({type(db_uri)})"
+    )
+
+    _parts: list[str] = [db_uri.render_as_string(hide_password=False)]
+    _parts.extend(f"{k}={engine_kwargs[k]!r}" for k in sorted(engine_kwargs))
+
+    return hashlib.sha256("\n".join(_parts).encode("utf-8")).hexdigest()
+
+
+class EngineRegistry:
+    """Share one `sqlalchemy.Engine` (and its connection pool) per database URL & engine options.
+
+    Description:
+        `get_engine()` creates an engine the first time a URL/options pair is requested, and returns the same
+        engine on every later call, so each call site does not open its own connection pool.
+        `get_session_pool()` returns one cached `sessionmaker` per engine. `get_async_engine()` &
+        `get_async_session_pool()` do the same for asyncio engines (`dispose_async()` disposes them).
+        `find_engine()` & `find_async_engine()` look up an existing engine without creating one.
+
+        Engines stay open until `dispose()` is called. After `os.fork()`, the child process drops the
+        connections it inherited (without closing them, as they belong to the parent) & opens new ones on first
+        use.
+
+    Usage:
+
+    ``` py linenums=1
+    engine = ENGINE_REGISTRY.get_engine(db_uri=db_uri, echo=False)
+    SessionLocal = ENGINE_REGISTRY.get_session_pool(engine=engine)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.RLock = threading.RLock()
+        self._engines: dict[str, sa.Engine] = {}
+        self._session_pools: dict[str, so.sessionmaker[so.Session]] = {}
+        self._async_engines: dict[str, AsyncEngine] = {}
+        self._async_session_pools: dict[str, async_sessionmaker[AsyncSession]] = {}
+
+        _self: weakref.ref[EngineRegistry] = weakref.ref(self)
+
+        def _after_fork() -> None:
+            registry: EngineRegistry | None = _self()
+            if registry is not None:
+                registry.reset_after_fork()
+
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_after_fork)
+
+    def __len__(self) -> int:
+        return len(self._engines) + len(self._async_engines)
+
+    def _key_of(self, engine: sa.Engine = None) -> str | None:
+        return next((k for k, e in self._engines.items() if e is engine), None)
+
+    @staticmethod
+    def _key(
+        db_uri: sa.URL = None,
+        profile: SQLiteProfile | None = None,
+        pool_metrics: bool = False,
+        **engine_kwargs: t.Any,
+    ) -> str:
+        if profile is not None:
+            engine_kwargs["sqlite_profile"] = profile
+        if pool_metrics:
+            engine_kwargs["pool_metrics"] = True
+
+        return engine_key(db_uri, **engine_kwargs)
+
+    def _lookup_key(
+        self,
+        db_uri: sa.URL = None,
+        sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+        pool_metrics: bool = False,
+        **engine_kwargs: t.Any,
+    ) -> str:
+        _profile: SQLiteProfile | None = (
+            get_sqlite_profile(sqlite_profile) if sqlite_profile is not None else None
+        )
+
+        return self._key(
+            db_uri, profile=_profile, pool_metrics=pool_metrics, **engine_kwargs
+        )
+
+    def find_engine(
+        self,
+        db_uri: sa.URL = None,
+        sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+        pool_metrics: bool = False,
+        **engine_kwargs: t.Any,
+    ) -> sa.Engine | None:
+        """Return the engine `get_engine()` created for the same arguments, or `None` without creating one."""
+        key: str = self._lookup_key(
+            db_uri,
+            sqlite_profile=sqlite_profile,
+            pool_metrics=pool_metrics,
+            **engine_kwargs,
+        )
+
+        with self._lock:
+            return self._engines.get(key)
+
+    def find_async_engine(
+        self,
+        db_uri: sa.URL = None,
+        sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+        pool_metrics: bool = False,
+        **engine_kwargs: t.Any,
+    ) -> AsyncEngine | None:
+        """Async counterpart to `find_engine()`, returning an engine created by `get_async_engine()`."""
+        key: str = self._lookup_key(
+            db_uri,
+            sqlite_profile=sqlite_profile,
+            pool_metrics=pool_metrics,
+            **engine_kwargs,
+        )
+
+        with self._lock:
+            return self._async_engines.get(key)
+
+    def get_engine(
+        self,
+        db_uri: sa.URL = None,
+        sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+        pool_metrics: bool = False,
+        **engine_kwargs: t.Any,
+    ) -> sa.Engine:
+        """Return the shared engine for `db_uri` & `engine_kwargs`, creating it on first use.
+
+        Params:
+            db_uri (sqlalchemy.URL): The database URL.
+            sqlite_profile (str|SQLiteProfile|None): [Default: None] A SQLite profile (see `apply_sqlite_profile()`)
+                applied when the engine is created.
+            pool_metrics (bool): [Default: False] Instrument the engine's pool with `instrument_pool()` when it is
+                created. Instrumented & plain engines are not shared.
+            **engine_kwargs (Any): Options passed to `sqlalchemy.create_engine()`, i.e. `echo=True`. Engines
+                with different options are not shared.
+        """
+        _profile: SQLiteProfile | None = (
+            get_sqlite_profile(sqlite_profile) if sqlite_profile is not None else None
+        )
+        key: str = self._key(
+            db_uri, profile=_profile, pool_metrics=pool_metrics, **engine_kwargs
+        )
+
+        with self._lock:
+            engine: sa.Engine | None = self._engines.get(key)
+            if engine is None:
+                engine = sa.create_engine(url=db_uri, **engine_kwargs)
+                if _profile is not None:
+                    apply_sqlite_profile(engine=engine, profile=_profile)
+                if pool_metrics:
+                    instrument_pool(engine=engine)
+                self._engines[key] = engine
+
+            return engine
+
+    def get_session_pool(
+        self, engine: sa.Engine = None, **sessionmaker_kwargs: t.Any
+    ) -> so.sessionmaker[so.Session]:
+        """Return the cached `sessionmaker` for `engine`.
+
+        Params:
+            engine (sqlalchemy.Engine): An engine, i.e. from `get_engine()`. Engines not created by the registry
+                get a new `sessionmaker` on every call.
+            **sessionmaker_kwargs (Any): Options passed to `sqlalchemy.orm.sessionmaker()`, i.e.
+                `expire_on_commit=False`. Session pools with different options are not shared.
+        """
+        assert isinstance(engine, sa.Engine), TypeError(
+            f"engine must be of type sqlalchemy.Engine. Got type: ({type(engine)})"
+        )
+
+        with self._lock:
+            key: str | None = self._key_of(engine)
+            if key is None:
+                return so.sessionmaker(bind=engine, **sessionmaker_kwargs)
+
+            key = f"{key}:{sorted(sessionmaker_kwargs.items())!r}"
+            session_pool: so.sessionmaker[so.Session] | None = self._session_pools.get(key)
+            if session_pool is None:
+                session_pool = so.sessionmaker(bind=engine, **sessionmaker_kwargs)
+                self._session_pools[key] = session_pool
+
+            return session_pool
+
+    def get_async_engine(
+        self,
+        db_uri: sa.URL = None,
+        sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+        pool_metrics: bool = False,
+        **engine_kwargs: t.Any,
+    ) -> AsyncEngine:
+        """Return the shared asyncio engine for `db_uri` (an async driver URL) & `engine_kwargs`.
+
+        Description:
+            Async counterpart to `get_engine()`. Async & sync engines are never shared, even for the same URL.
+        """
+        _profile: SQLiteProfile | None = (
+            get_sqlite_profile(sqlite_profile) if sqlite_profile is not None else None
+        )
+        key: str = self._key(
+            db_uri, profile=_profile, pool_metrics=pool_metrics, **engine_kwargs
+        )
+
+        with self._lock:
+            engine: AsyncEngine | None = self._async_engines.get(key)
+            if engine is None:
+                engine = create_async_engine(url=db_uri, **engine_kwargs)
+                if _profile is not None:
+                    ## Connect events are dispatched by the sync engine an AsyncEngine proxies
+                    apply_sqlite_profile(engine=engine.sync_engine, profile=_profile)
+                if pool_metrics:
+                    instrument_pool(engine=engine.sync_engine)
+                self._async_engines[key] = engine
+
+            return engine
+
+    def get_async_session_pool(
+        self, engine: AsyncEngine = None, **sessionmaker_kwargs: t.Any
+    ) -> async_sessionmaker[AsyncSession]:
+        """Return the cached `async_sessionmaker` for `engine`.
+
+        Description:
+            Async counterpart to `get_session_pool()`. `expire_on_commit` defaults to `False`, since expired
+            attributes cannot be lazy-loaded outside of an `await`.
+        """
+        assert isinstance(engine, AsyncEngine), TypeError(
+            f"engine must be of type sqlalchemy.ext.asyncio.AsyncEngine. Got type: ({type(engine)})"
+        )
+        sessionmaker_kwargs.setdefault("expire_on_commit", False)
+
+        with self._lock:
+            key: str | None = next(
+                (k for k, e in self._async_engines.items() if e is engine), None
+            )
+            if key is None:
+                return async_sessionmaker(bind=engine, **sessionmaker_kwargs)
+
+            key = f"{key}:{sorted(sessionmaker_kwargs.items())!r}"
+            session_pool: async_sessionmaker[AsyncSession] | None = (
+                self._async_session_pools.get(key)
+            )
+            if session_pool is None:
+                session_pool = async_sessionmaker(bind=engine, **sessionmaker_kwargs)
+                self._async_session_pools[key] = session_pool
+
+            return session_pool
+
+    async def dispose_async(self, engine: AsyncEngine | None = None) -> int:
+        """Close an asyncio engine's pooled connections & remove it from the registry.
+
+        Params:
+            engine (AsyncEngine|None): The engine to dispose. When `None`, all asyncio engines are disposed.
+
+        Returns:
+            (int): The number of engines disposed.
+        """
+        with self._lock:
+            keys: list[str] = [
+                k for k, e in self._async_engines.items() if engine is None or e is engine
+            ]
+            engines: list[AsyncEngine] = [self._async_engines.pop(k) for k in keys]
+            for key in keys:
+                for pool_key in [
+                    k for k in self._async_session_pools if k.startswith(f"{key}:")
+                ]:
+                    del self._async_session_pools[pool_key]
+
+        ## Awaited outside the lock
+        for _engine in engines:
+            await _engine.dispose()
+
+        return len(engines)
+
+    def dispose(self, engine: sa.Engine | None = None) -> int:
+        """Close an engine's pooled connections & remove it from the registry.
+
+        Params:
+            engine (sqlalchemy.Engine|None): The engine to dispose. When `None`, all (sync) engines are disposed.
+                Dispose asyncio engines with `dispose_async()`.
+
+        Returns:
+            (int): The number of engines disposed.
+        """
+        with self._lock:
+            if engine is None:
+                keys: list[str] = list(self._engines)
+            else:
+                key: str | None = self._key_of(engine)
+                keys = [key] if key is not None else []
+
+            for key in keys:
+                self._engines.pop(key).dispose()
+                for pool_key in [k for k in self._session_pools if k.startswith(f"{key}:")]:
+                    del self._session_pools[pool_key]
+
+        return len(keys)
+
+    def reset_after_fork(self) -> None:
+        """Drop connection pools inherited from the parent process. Called automatically in a forked child."""
+        ## The parent's lock may have been held by another thread when the process forked
+        self._lock = threading.RLock()
+
+        for engine in [
+            *self._engines.values(),
+            *(e.sync_engine for e in self._async_engines.values()),
+        ]:
+            ## close=False: the parent's connections must not be closed from the child
+            engine.dispose(close=False)
+
+
+## Process-wide registry, shared by `get_engine()`, `get_session_pool()` & `DBSettings`
+ENGINE_REGISTRY: EngineRegistry = EngineRegistry()
@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import typing as t
+
 import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 import sqlalchemy.orm as so
 
+from .engine_registry import ENGINE_REGISTRY
+from .pool_metrics import instrument_pool
+from .sqlite_profile import SQLiteProfile, apply_sqlite_profile
+
+
 def get_db_uri(
     drivername: str = "sqlite+pysqlite",
     username: str | None = None,
@@ -55,14 +68,109 @@ def get_db_uri(
         raise msg
 
 
-def get_engine(db_uri: sa.URL = None, echo: bool = False) -> sa.Engine:
+def pool_options(
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool = False,
+) -> dict[str, t.Any]:
+    """Return the connection pool options to pass to `sqlalchemy.create_engine()`.
+
+    Description:
+        Options left as `None` are omitted, so SQLAlchemy's defaults (and the dialect's default pool class)
+        apply. SQLite `:memory:` databases use a pool that does not accept `max_overflow`/`pool_timeout`.
+
+    Params:
+        pool_size (int|None): Number of connections kept open in the pool.
+        max_overflow (int|None): Connections allowed beyond `pool_size` when the pool is exhausted.
+        pool_timeout (float|None): Seconds to wait for a connection before raising `sqlalchemy.exc.TimeoutError`.
+        pool_recycle (int|None): Replace connections older than this many seconds. `-1` disables recycling.
+        pool_pre_ping (bool): [Default: False] Test connections on checkout, replacing dead ones.
+    """
+    if pool_size is not None:
+        assert isinstance(pool_size, int) and pool_size >= 0, ValueError(
+            f"pool_size must be a non-negative integer. Got: ({pool_size})"
+        )
+    if max_overflow is not None:
+        assert isinstance(max_overflow, int), TypeError(
+            f"max_overflow must be of type int. Got type: ({type(max_overflow)})"
+        )
+    if pool_timeout is not None:
+        assert isinstance(pool_timeout, (int, float)) and pool_timeout > 0, ValueError(
+            f"pool_timeout must be a positive number. Got: ({pool_timeout})"
+        )
+    if pool_recycle is not None:
+        assert isinstance(pool_recycle, int), TypeError(
+            f"pool_recycle must be of type int. Got type: ({type(pool_recycle)})"
+        )
+    assert isinstance(pool_pre_ping, bool), TypeError(
+        f"pool_pre_ping must be a bool. Got type: ({type(pool_pre_ping)})"
+    )
+
+    _options: dict[str, t.Any] = {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pool_pre_ping or None,
+    }
+
+    return {k: v for k, v in _options.items() if v is not None}
+
+
+def get_engine(
+    db_uri: sa.URL = None,
+    echo: bool = False,
+    cached: bool = True,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool = False,
+    pool_metrics: bool = False,
+    sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+) -> sa.Engine:
+    """Return a database engine for `db_uri`.
+
+    Description:
+        With `cached=True`, the engine (and its connection pool) is shared through `ENGINE_REGISTRY`: every call
+        with the same URL & options returns the same engine. Pass `cached=False` for a new, unshared engine.
+
+        Pool options are described in `pool_options()`. With `pool_metrics=True`, the engine's pool is
+        instrumented; read the metrics with `get_pool_metrics(engine).stats()`.
+
+        `sqlite_profile` (a name in `SQLITE_PROFILES`, i.e. "high_throughput", or a `SQLiteProfile`) sets PRAGMAs
+        on each new connection of a SQLite engine. See `apply_sqlite_profile()`.
+    """
     assert db_uri is not None, ValueError("db_uri is not None")
     assert isinstance(db_uri, sa.URL), TypeError(
         f"db_uri must be of type sqlalchemy.URL. Got type: ({type(db_uri)})"
     )
 
+    _options: dict[str, t.Any] = pool_options(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+
     try:
-        engine: sa.Engine = sa.create_engine(url=db_uri, echo=echo)
+        if cached:
+            engine: sa.Engine = ENGINE_REGISTRY.get_engine(
+                db_uri=db_uri,
+                echo=echo,
+                sqlite_profile=sqlite_profile,
+                pool_metrics=pool_metrics,
+                **_options,
+            )
+        else:
+            engine = sa.create_engine(url=db_uri, echo=echo, **_options)
+            if sqlite_profile is not None:
+                apply_sqlite_profile(engine=engine, profile=sqlite_profile)
+            if pool_metrics:
+                instrument_pool(engine=engine)
 
         return engine
     except Exception as exc:
@@ -71,12 +179,203 @@ def get_engine(db_uri: sa.URL = None, echo: bool = False) -> sa.Engine:
         raise msg
 
 
+def find_engine(
+    db_uri: sa.URL = None,
+    echo: bool = False,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool = False,
+    pool_metrics: bool = False,
+    sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+) -> sa.Engine | None:
+    """Return the shared engine `get_engine()` created with the same options, or `None` without creating one."""
+    assert isinstance(db_uri, sa.URL), TypeError(
+        f"db_uri must be of type sqlalchemy.URL. Got type: ({type(db_uri)})"
+    )
+
+    _options: dict[str, t.Any] = pool_options(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+
+    return ENGINE_REGISTRY.find_engine(
+        db_uri=db_uri,
+        echo=echo,
+        sqlite_profile=sqlite_profile,
+        pool_metrics=pool_metrics,
+        **_options,
+    )
+
+
 def get_session_pool(engine: sa.Engine = None) -> so.sessionmaker[so.Session]:
     assert engine is not None, ValueError("engine cannot be None")
     assert isinstance(engine, sa.Engine), TypeError(
         f"engine must be of type sqlalchemy.Engine. Got type: ({type(engine)})"
     )
 
-    session_pool: so.sessionmaker[so.Session] = so.sessionmaker(bind=engine)
+    ## Cached per engine for engines from ENGINE_REGISTRY
+    session_pool: so.sessionmaker[so.Session] = ENGINE_REGISTRY.get_session_pool(
+        engine=engine
+    )
+
+    return session_pool
+
+
+## Sync driver -> asyncio driver, used by `get_async_db_uri()`
+ASYNC_DRIVERS: dict[str, str] = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgresql+psycopg": "postgresql+psycopg_async",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+
+def get_async_db_uri(db_uri: sa.URL = None) -> sa.URL:
+    """Return `db_uri` with its driver swapped for the asyncio driver in `ASYNC_DRIVERS`.
+
+    Description:
+        URLs that already use an async driver (or a driver not in `ASYNC_DRIVERS`) are returned unchanged.
+        I.e. `sqlite+pysqlite:///app.sqlite` -> `sqlite+aiosqlite:///app.sqlite`, and `postgresql://...` ->
+        `postgresql+asyncpg://...`.
+    """
+    assert db_uri is not None, ValueError("db_uri is not None")
+    assert isinstance(db_uri, sa.URL), TypeError(
+        f"db_uri must be of type sqlalchemy.URL. Got type: ({type(db_uri)})"
+    )
+
+    drivername: str | None = ASYNC_DRIVERS.get(db_uri.drivername)
+    if drivername is None:
+        return db_uri
+
+    return db_uri.set(drivername=drivername)
+
+
+def get_async_engine(
+    db_uri: sa.URL = None,
+    echo: bool = False,
+    cached: bool = True,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool = False,
+    pool_metrics: bool = False,
+    sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+) -> AsyncEngine:
+    """Return an asyncio database engine for `db_uri`.
+
+    Description:
+        Async counterpart to `get_engine()`, accepting the same options. `db_uri` may use a sync driver (i.e.
+        from `get_db_uri()`); it is converted with `get_async_db_uri()`. Requires the async driver to be
+        installed, i.e. `pip install aiosqlite` or `pip install asyncpg`.
+
+        With `pool_metrics=True`, read the metrics with `get_pool_metrics(engine.sync_engine).stats()`.
+    """
+    db_uri = get_async_db_uri(db_uri=db_uri)
+
+    _options: dict[str, t.Any] = pool_options(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+
+    try:
+        if cached:
+            engine: AsyncEngine = ENGINE_REGISTRY.get_async_engine(
+                db_uri=db_uri,
+                echo=echo,
+                sqlite_profile=sqlite_profile,
+                pool_metrics=pool_metrics,
+                **_options,
+            )
+        else:
+            engine = create_async_engine(url=db_uri, echo=echo, **_options)
+            if sqlite_profile is not None:
+                apply_sqlite_profile(engine=engine.sync_engine, profile=sqlite_profile)
+            if pool_metrics:
+                instrument_pool(engine=engine.sync_engine)
+
+        return engine
+    except Exception as exc:
+        msg = Exception(
+            f"Unhandled exception getting async database engine. Details: {exc}"
+        )
+
+        raise msg
+
+
+def find_async_engine(
+    db_uri: sa.URL = None,
+    echo: bool = False,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool = False,
+    pool_metrics: bool = False,
+    sqlite_profile: t.Union[str, SQLiteProfile] | None = None,
+) -> AsyncEngine | None:
+    """Async counterpart to `find_engine()`, for engines created by `get_async_engine()`."""
+    db_uri = get_async_db_uri(db_uri=db_uri)
+
+    _options: dict[str, t.Any] = pool_options(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+
+    return ENGINE_REGISTRY.find_async_engine(
+        db_uri=db_uri,
+        echo=echo,
+        sqlite_profile=sqlite_profile,
+        pool_metrics=pool_metrics,
+        **_options,
+    )
+
+
+def get_async_session_pool(
+    engine: AsyncEngine = None,
+) -> async_sessionmaker[AsyncSession]:
+    assert engine is not None, ValueError("engine cannot be None")
+    assert isinstance(engine, AsyncEngine), TypeError(
+        f"engine must be of type sqlalchemy.ext.asyncio.AsyncEngine. Got type: ({type(engine)})"
+    )
+
+    ## Cached per engine for engines from ENGINE_REGISTRY
+    session_pool: async_sessionmaker[AsyncSession] = (
+        ENGINE_REGISTRY.get_async_session_pool(engine=engine)
+    )
 
     return session_pool
+
+
+async def dispose_async_engine(engine: AsyncEngine | None = None) -> int:
+    """Close a shared asyncio engine's connections & remove it from `ENGINE_REGISTRY`. Disposes all when `None`."""
+    if engine is not None:
+        assert isinstance(engine, AsyncEngine), TypeError(
+            f"engine must be of type sqlalchemy.ext.asyncio.AsyncEngine. Got type: ({type(engine)})"
+        )
+
+    return await ENGINE_REGISTRY.dispose_async(engine=engine)
+
+
+def dispose_engine(engine: sa.Engine | None = None) -> int:
+    """Close a shared engine's connections & remove it from `ENGINE_REGISTRY`. Disposes all engines when `None`."""
+    if engine is not None:
+        assert isinstance(engine, sa.Engine), TypeError(
+            f"engine must be of type sqlalchemy.Engine. Got type: ({type(engine)})"
+        )
+
+    return ENGINE_REGISTRY.dispose(engine=engine)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from collections import deque
+import threading
+import time
+import typing as t
+import weakref
+
+import sqlalchemy as sa
+
+## Pool events counted by `PoolMetrics`
+POOL_EVENTS: tuple[str, ...] = (
+    "connect",
+    "checkout",
+    "checkin",
+    "invalidate",
+    "soft_invalidate",
+    "close",
+)
+
+## Instrumented engines, and their metrics
+_POOL_METRICS: weakref.WeakKeyDictionary[sa.Engine, PoolMetrics] = (
+    weakref.WeakKeyDictionary()
+)
+_POOL_METRICS_LOCK: threading.Lock = threading.Lock()
+
+## Connection record `info` key holding the time a connection was checked out
+_CHECKED_OUT_AT: str = "pool_metrics_checked_out_at"
+
+
+def _pool_state(pool: t.Any = None) -> dict[str, int]:
+    """Return a pool's size, checked out/in connections & overflow. Only `QueuePool`s report these."""
+    if not isinstance(pool, sa.pool.QueuePool):
+        return {"pool_size": 0, "checked_out": 0, "checked_in": 0, "overflow": 0}
+
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+def _pool_capacity(pool: t.Any = None) -> int | None:
+    """Return the most connections a `QueuePool` can hand out, or `None` when overflow is unlimited."""
+    if not isinstance(pool, sa.pool.QueuePool) or pool._max_overflow < 0:
+        return None
+
+    return pool.size() + pool._max_overflow
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    if not samples:
+        return 0.0
+
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class PoolMetrics:
+    """Connection pool instrumentation for an engine, built on SQLAlchemy's pool events.
+
+    Description:
+        Records, from the pool's `checkout` & `checkin` events:
+            - Checkout duration: how long connections stay checked out (from checkout to checkin), with
+              p50/p95/p99 over the last `sample_size` checkins.
+            - Checked-out connections: current & peak. Pool state is only reported by `QueuePool`s (the default
+              for file databases & client/server dialects).
+            - Overflow usage: current & peak overflow connections, and checkouts made while overflow
+              connections were in use.
+            - Saturation: checkouts that left a `QueuePool` with no connection to hand out, so the next checkout
+              waits up to `pool_timeout` seconds for a checkin.
+            - Event counts: connections opened/closed, checkouts/checkins & invalidations.
+
+        Pool starvation shows up as peak checked-out connections at `pool_size + max_overflow`, saturated
+        checkouts, and long checkout durations holding connections. Listeners are added to the engine, so they
+        cover every checkout from its pool (including `engine.pool.connect()`) and carry over to the new pool
+        `engine.dispose()` creates. Use `instrument_pool()` to instrument an engine, instead of initializing
+        this class directly.
+
+    Params:
+        engine (sqlalchemy.Engine): The engine to instrument.
+        sample_size (int): [Default: 10000] Number of recent checkout durations kept for percentiles.
+
+    """
+
+    def __init__(self, engine: sa.Engine = None, sample_size: int = 10_000) -> None:
+        assert isinstance(engine, sa.Engine), TypeError(
+            f"engine must be of type sqlalchemy.Engine. Got type: ({type(engine)})"
+        )
+
+        self.engine: weakref.ref[sa.Engine] = weakref.ref(engine)
+        self._lock: threading.Lock = threading.Lock()
+        self._durations: deque[float] = deque(maxlen=sample_size)
+
+        self.reset()
+
+        for name in POOL_EVENTS:
+            sa.event.listen(engine, name, self._counter(name))
+
+        sa.event.listen(engine, "checkout", self._on_checkout)
+        sa.event.listen(engine, "checkin", self._on_checkin)
+
+    def _counter(self, name: str) -> t.Callable[..., None]:
+        def _count(*args: t.Any) -> None:
+            with self._lock:
+                self.events[name] += 1
+
+        return _count
+
+    def _on_checkout(
+        self, dbapi_connection: t.Any, connection_record: t.Any, connection_proxy: t.Any
+    ) -> None:
+        connection_record.info[_CHECKED_OUT_AT] = time.perf_counter()
+
+        engine: sa.Engine | None = self.engine()
+        pool: t.Any = engine.pool if engine is not None else None
+        state: dict[str, int] = _pool_state(pool)
+        checked_out: int = state["checked_out"]
+        overflow: int = state["overflow"]
+        capacity: int | None = _pool_capacity(pool)
+
+        with self._lock:
+            self.checkout_count += 1
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+            if overflow:
+                self.overflow_checkouts += 1
+            if capacity is not None and checked_out >= capacity:
+                self.saturated_checkouts += 1
+
+    def _on_checkin(self, dbapi_connection: t.Any, connection_record: t.Any) -> None:
+        ## Missing when the connection was checked out before the engine was instrumented
+        checked_out_at: float | None = connection_record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is None:
+            return
+
+        seconds: float = time.perf_counter() - checked_out_at
+
+        with self._lock:
+            self._durations.append(seconds)
+            self.checkin_count += 1
+            self.checkout_seconds += seconds
+            self.max_checkout_seconds = max(self.max_checkout_seconds, seconds)
+
+    def reset(self) -> None:
+        """Reset all counters & checkout duration samples."""
+        with self._lock:
+            self._durations.clear()
+            self.events: dict[str, int] = {name: 0 for name in POOL_EVENTS}
+            self.checkout_count: int = 0
+            self.checkin_count: int = 0
+            self.checkout_seconds: float = 0.0
+            self.max_checkout_seconds: float = 0.0
+            self.peak_checked_out: int = 0
+            self.peak_overflow: int = 0
+            self.overflow_checkouts: int = 0
+            self.saturated_checkouts: int = 0
+
+    def stats(self) -> dict[str, t.Union[int, float, str]]:
+        """Return the pool's current state & the recorded metrics."""
+        engine: sa.Engine | None = self.engine()
+        pool: t.Any = engine.pool if engine is not None else None
+
+        with self._lock:
+            samples: list[float] = sorted(self._durations)
+            _stats: dict[str, t.Union[int, float, str]] = {
+                "pool_class": type(pool).__name__,
+                **_pool_state(pool),
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "overflow_checkouts": self.overflow_checkouts,
+                "saturated_checkouts": self.saturated_checkouts,
+                "checkouts": self.checkout_count,
+                "avg_checkout_seconds": (
+                    self.checkout_seconds / self.checkin_count
+                    if self.checkin_count
+                    else 0.0
+                ),
+                "max_checkout_seconds": self.max_checkout_seconds,
+                "p50_checkout_seconds": _percentile(samples, 0.50),
+                "p95_checkout_seconds": _percentile(samples, 0.95),
+                "p99_checkout_seconds": _percentile(samples, 0.99),
+            }
+            _stats.update({f"{name}_events": count for name, count in self.events.items()})
+
+        return _stats
+
+
+def instrument_pool(engine: sa.Engine = None, sample_size: int = 10_000) -> PoolMetrics:
+    """Instrument an engine's connection pool, and return its `PoolMetrics`.
+
+    Description:
+        Engines are only instrumented once; later calls return the existing `PoolMetrics`.
+    """
+    with _POOL_METRICS_LOCK:
+        metrics: PoolMetrics | None = _POOL_METRICS.get(engine)
+        if metrics is None:
+            metrics = PoolMetrics(engine=engine, sample_size=sample_size)
+            _POOL_METRICS[engine] = metrics
+
+        return metrics
+
+
+def get_pool_metrics(engine: sa.Engine = None) -> PoolMetrics | None:
+    """Return an engine's `PoolMetrics`, or `None` if it has not been instrumented with `instrument_pool()`."""
+    return _POOL_METRICS.get(engine)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing as t
+
+import sqlalchemy as sa
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """A set of PRAGMAs applied to every new SQLite connection.
+
+    Description:
+        Apply a profile to an engine with `apply_sqlite_profile()`, or by name with the `sqlite_profile` param
+        of `get_engine()`/`DBSettings`. Named profiles are in `SQLITE_PROFILES`.
+
+        `journal_mode=WAL` lets readers run concurrently with a writer, and with `synchronous=NORMAL` a commit
+        does not wait for an fsync (the database cannot be corrupted, but the last transactions may be rolled
+        back after a power loss). WAL does not apply to `:memory:` databases.
+
+    Params:
+        journal_mode (str|None): [Default: "WAL"] `PRAGMA journal_mode`.
+        synchronous (str|None): [Default: "NORMAL"] `PRAGMA synchronous` (OFF, NORMAL, FULL or EXTRA).
+        cache_size (int|None): [Default: -64000] `PRAGMA cache_size`. Negative values are in KiB (64MB), positive
+            values in pages.
+        mmap_size (int|None): [Default: 268435456] `PRAGMA mmap_size`, in bytes (256MB). `0` disables memory-mapped
+            I/O.
+        temp_store (str|None): [Default: "MEMORY"] `PRAGMA temp_store` (DEFAULT, FILE or MEMORY).
+        busy_timeout (int|None): [Default: 5000] `PRAGMA busy_timeout`, in milliseconds a connection waits for a
+            lock before raising "database is locked".
+
+        Options set to `None` are not changed from SQLite's defaults.
+
+    """
+
+    journal_mode: str | None = field(default="WAL")
+    synchronous: str | None = field(default="NORMAL")
+    cache_size: int | None = field(default=-64000)
+    mmap_size: int | None = field(default=268435456)
+    temp_store: str | None = field(default="MEMORY")
+    busy_timeout: int | None = field(default=5000)
+
+    def __post_init__(self):
+        for name in ("journal_mode", "synchronous", "temp_store"):
+            value: t.Any = getattr(self, name)
+            if value is not None:
+                assert isinstance(value, str) and value.isalpha(), ValueError(
+                    f"{name} must be a PRAGMA keyword, i.e. 'WAL'. Got: ({value!r})"
+                )
+        for name in ("cache_size", "mmap_size", "busy_timeout"):
+            value = getattr(self, name)
+            if value is not None:
+                assert isinstance(value, int), TypeError(
+                    f"{name} must be of type int. Got type: ({type(value)})"
+                )
+
+    def pragmas(self) -> list[str]:
+        """Return the `PRAGMA` statements for this profile."""
+        _pragmas: list[str] = []
+
+        for name in (
+            "busy_timeout",
+            "journal_mode",
+            "synchronous",
+            "cache_size",
+            "mmap_size",
+            "temp_store",
+        ):
+            value: t.Any = getattr(self, name)
+            if value is not None:
+                _pragmas.append(f"PRAGMA {name}={value}")
+
+        return _pragmas
+
+
+## Named profiles, for `get_engine(sqlite_profile=...)` & `DBSettings.sqlite_profile`
+SQLITE_PROFILES: dict[str, SQLiteProfile] = {
+    ## WAL, no fsync per commit, large page cache & memory-mapped reads
+    "high_throughput": SQLiteProfile(),
+    ## WAL, with an fsync per commit
+    "durable": SQLiteProfile(synchronous="FULL"),
+}
+
+
+def get_sqlite_profile(profile: t.Union[str, SQLiteProfile] = None) -> SQLiteProfile:
+    """Return a `SQLiteProfile`, looking it up in `SQLITE_PROFILES` by name."""
+    if isinstance(profile, SQLiteProfile):
+        return profile
+
+    assert profile in SQLITE_PROFILES, ValueError(
+        f"Unknown SQLite profile: ({profile!r}). Must be one of: {list(SQLITE_PROFILES)}"
+    )
+
+    return SQLITE_PROFILES[profile]
+
+
+def apply_sqlite_profile(
+    engine: sa.Engine = None, profile: t.Union[str, SQLiteProfile] = "high_throughput"
+) -> SQLiteProfile:
+    """Run a profile's PRAGMAs on every new connection of a SQLite engine, with a `connect` event listener.
+
+    Description:
+        Only connections opened after the listener is added are configured. Apply the profile before the engine
+        is first used, or call `engine.dispose()` afterwards.
+
+    Params:
+        engine (sqlalchemy.Engine): A SQLite engine.
+        profile (str|SQLiteProfile): [Default: "high_throughput"] A profile, or the name of one in `SQLITE_PROFILES`.
+
+    Returns:
+        (SQLiteProfile): The applied profile.
+
+    """
+    assert isinstance(engine, sa.Engine), TypeError(
+        f"engine must be of type sqlalchemy.Engine. Got type: ({type(engine)})"
+    )
+    assert engine.dialect.name == "sqlite", ValueError(
+        f"SQLite profiles only apply to SQLite engines. Got dialect: ({engine.dialect.name})"
+    )
+
+    _profile: SQLiteProfile = get_sqlite_profile(profile)
+    _pragmas: list[str] = _profile.pragmas()
+
+    def _set_pragmas(dbapi_connection: t.Any, connection_record: t.Any) -> None:
+        cursor: t.Any = dbapi_connection.cursor()
+        try:
+            for pragma in _pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    sa.event.listen(engine, "connect", _set_pragmas)
+
+    return _profile